@@ -0,0 +1,276 @@
+import os
+import asyncio
+import logging
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from engines import DEFAULT_ENGINE, ENGINES, parse_engines, run_engines, preload
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Analysis processes; each loads the engines once and runs one analysis at a time
+ASYNC_WORKERS = int(os.environ.get('ASYNC_WORKERS', os.cpu_count() or 1))
+# Requests allowed to wait for a free worker; beyond this they get an immediate 503
+MAX_QUEUE_DEPTH = int(os.environ.get('MAX_QUEUE_DEPTH', ASYNC_WORKERS * 2))
+# Seconds a request may wait for a worker before giving up with a 503
+QUEUE_TIMEOUT = float(os.environ.get('QUEUE_TIMEOUT', 10))
+# Engines loaded by each worker at startup (comma-separated, or 'all')
+PRELOAD_ENGINES = os.environ.get('PRELOAD_ENGINES', DEFAULT_ENGINE)
+
+
+class QueueFull(Exception):
+    """Raised when MAX_QUEUE_DEPTH requests are already waiting for a worker"""
+
+
+class AnalysisPool:
+    """
+    Bounded process pool with admission control
+
+    Requests wait on a semaphore with one slot per worker instead of in the
+    executor's own queue, so the number waiting is known (requests past
+    MAX_QUEUE_DEPTH are rejected without queueing) and a request whose client
+    has gone away can leave the queue before it reaches a worker. An analysis
+    that has already started runs to completion; its result is discarded.
+    """
+
+    def __init__(self, workers, max_queue_depth, queue_timeout, preload_engines):
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout = queue_timeout
+        self.preload_engines = preload_engines
+        self.executor = None
+        self.slots = None
+        self.queued = 0
+        self.running = 0
+        self.stats = {'completed': 0, 'rejected': 0, 'timed_out': 0, 'cancelled': 0, 'failed': 0}
+
+    def start(self):
+        self.slots = asyncio.Semaphore(self.workers)
+        self.executor = self._create_executor()
+        logger.info(f"Analysis pool: {self.workers} worker(s), max queue depth {self.max_queue_depth}")
+
+    def _create_executor(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=preload,
+                                   initargs=(self.preload_engines,))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def saturated(self):
+        return self.queued >= self.max_queue_depth
+
+    async def run(self, engines, text):
+        """
+        Run the engines in a worker process
+
+        Raises:
+            QueueFull: Too many requests already waiting
+            asyncio.TimeoutError: No worker became free within queue_timeout
+            BrokenProcessPool: The worker died; the pool has been replaced
+            asyncio.CancelledError: The analysis was cancelled with its pool
+        """
+        if self.saturated():
+            raise QueueFull()
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self.slots.acquire(), self.queue_timeout)
+        finally:
+            self.queued -= 1
+
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            future = executor.submit(run_engines, engines, text)
+        except BrokenProcessPool:
+            self.slots.release()
+            self._restart(executor)
+            raise
+        self.running += 1
+        # The slot is held until the worker is actually free: cancelling a
+        # request mid-analysis must not let another one onto the busy worker
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._restart(executor)
+            raise
+
+    def _release(self):
+        self.running -= 1
+        self.slots.release()
+
+    def _restart(self, broken):
+        """
+        Replace a pool whose worker died (e.g. out of memory) so later requests still work
+
+        Every request in flight on the broken pool fails with it; only the
+        first to get here replaces it, so the others do not shut down (and
+        cancel the requests on) the pool that replaced it.
+        """
+        if self.executor is not broken:
+            return
+        logger.error("Analysis worker died, restarting the pool")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.executor = self._create_executor()
+
+    def status(self):
+        return {
+            'workers': self.workers,
+            'max_queue_depth': self.max_queue_depth,
+            'queue_timeout_s': self.queue_timeout,
+            'queued': self.queued,
+            'running': self.running,
+            **self.stats
+        }
+
+
+pool = AnalysisPool(ASYNC_WORKERS, MAX_QUEUE_DEPTH, QUEUE_TIMEOUT, parse_engines(PRELOAD_ENGINES))
+
+
+def service_unavailable(message):
+    return JSONResponse({'error': message}, status_code=503, headers={'Retry-After': '1'})
+
+
+async def wait_for_disconnect(request):
+    """Return once the client disconnects (the request body has already been read)"""
+    while True:
+        message = await request.receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+async def health_check(request):
+    return JSONResponse({
+        'status': 'healthy',
+        'service': 'Unified Resume Analysis API (async)',
+        'version': '1.0.0',
+        'default_engine': DEFAULT_ENGINE,
+        'engines': list(ENGINES),
+        'pool': pool.status()
+    })
+
+
+async def analyze_text(request):
+    """
+    Analyze resume text with one or more engines
+
+    Same contract as unified_app.py. Returns 503 straight away when the
+    queue is full or no worker frees up within QUEUE_TIMEOUT.
+    """
+    # Checked before reading the body so rejections stay cheap, and again on queueing
+    if pool.saturated():
+        pool.stats['rejected'] += 1
+        return service_unavailable('Server busy, retry shortly')
+
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    if not data or 'text' not in data:
+        return JSONResponse({'error': 'No text provided for analysis'}, status_code=400)
+
+    text = data['text']
+    if not text or len(text.strip()) < 50:
+        return JSONResponse({
+            'error': 'Text too short for meaningful analysis (minimum 50 characters)'
+        }, status_code=400)
+
+    try:
+        engines = parse_engines(request.query_params.get('engine') or data.get('engine'))
+    except ValueError as e:
+        return JSONResponse({'error': str(e)}, status_code=400)
+
+    work = asyncio.ensure_future(pool.run(engines, text))
+    disconnect = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({work, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect.cancel()
+
+    if not work.done():
+        work.cancel()
+        pool.stats['cancelled'] += 1
+        logger.info("Client disconnected, analysis cancelled")
+        # Nobody is listening; the server drops this response
+        return JSONResponse({'error': 'Client disconnected'}, status_code=499)
+
+    try:
+        analyses, timings_ms = work.result()
+    except QueueFull:
+        pool.stats['rejected'] += 1
+        return service_unavailable('Server busy, retry shortly')
+    except asyncio.TimeoutError:
+        pool.stats['timed_out'] += 1
+        return service_unavailable('Timed out waiting for an analysis worker')
+    except asyncio.CancelledError:
+        # A BaseException, so not caught below: the analysis was cancelled
+        # with a pool that was shut down, not by this request
+        pool.stats['failed'] += 1
+        return service_unavailable('Analysis worker restarted, retry shortly')
+    except Exception as e:
+        pool.stats['failed'] += 1
+        logger.error(f"❌ Analysis failed: {str(e)}")
+        logger.error(traceback.format_exc())
+        return JSONResponse({
+            'error': 'Internal server error during analysis',
+            'details': str(e)
+        }, status_code=500)
+
+    pool.stats['completed'] += 1
+    if len(engines) == 1:
+        return JSONResponse({
+            'success': True,
+            'engine': engines[0],
+            'analysis': analyses[engines[0]]
+        })
+
+    return JSONResponse({
+        'success': True,
+        'analyses': analyses,
+        'scores': {engine: analysis['score'] for engine, analysis in analyses.items()},
+        'timings_ms': timings_ms
+    })
+
+
+async def not_found(request, exc):
+    return JSONResponse({
+        'error': 'Endpoint not found',
+        'available_endpoints': ['/', '/analyze-text']
+    }, status_code=404)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    pool.start()
+    try:
+        yield
+    finally:
+        pool.shutdown()
+
+
+app = Starlette(
+    routes=[
+        Route('/', health_check, methods=['GET']),
+        Route('/analyze-text', analyze_text, methods=['POST'])
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])],
+    exception_handlers={404: not_found},
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    logger.info("🚀 Starting Unified Resume Analysis API (async)")
+    logger.info("📍 Server will be available at http://localhost:5000")
+    logger.info(f"⚙️ {ASYNC_WORKERS} analysis worker(s), max queue depth {MAX_QUEUE_DEPTH}")
+    uvicorn.run(app, host='0.0.0.0', port=5000)
@@ -0,0 +1,99 @@
+import os
+import sys
+import time
+import logging
+import importlib
+import threading
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Engine name -> (module exposing a module-level `analyzer`, description)
+ENGINES = {
+    'ml': ('app', 'SmartResumeAnalyzer with contact extraction (app.py)'),
+    'smart': ('smart_app', 'SmartResumeAnalyzer (smart_app.py)'),
+    'intelligent': ('intelligent_app', 'IntelligentResumeAnalyzer with spaCy NER (intelligent_app.py)'),
+    'resume_score': ('resume_score_engine', 'TF-IDF random forest scorer (../resume_score/app.py)')
+}
+
+DEFAULT_ENGINE = os.environ.get('DEFAULT_ENGINE', 'smart')
+
+_analyzers = {}
+_lock = threading.Lock()
+
+
+def register_engine(name, module, description=''):
+    """Add an engine backed by a module with a module-level `analyzer`"""
+    ENGINES[name] = (module, description)
+
+
+def get_analyzer(name):
+    """
+    Analyzer for an engine, importing its module on first use
+
+    Every engine runs in this process, so NLTK data (utils/text_utils.py)
+    and compiled lexicons (lexicon/terms.py) are loaded once and shared.
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine '{name}'. Available: {sorted(ENGINES)}")
+    if name not in _analyzers:
+        with _lock:
+            if name not in _analyzers:
+                start = time.perf_counter()
+                module = importlib.import_module(ENGINES[name][0])
+                _analyzers[name] = module.analyzer
+                logger.info(f"Engine '{name}' loaded in {time.perf_counter() - start:.2f}s")
+    return _analyzers[name]
+
+
+def parse_engines(value):
+    """Engine names from a request parameter: one name, a comma-separated list or 'all'"""
+    if not value:
+        return [DEFAULT_ENGINE]
+    if value == 'all':
+        return list(ENGINES)
+    names = list(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    unknown = [name for name in names if name not in ENGINES]
+    if unknown:
+        raise ValueError(f"Unknown engine(s) {unknown}. Available: {sorted(ENGINES)}")
+    return names
+
+
+def analyze(engine, text):
+    """Run one engine's analyze_text"""
+    return get_analyzer(engine).analyze_text(text)
+
+
+def run_engines(names, text):
+    """
+    Run several engines on the same text
+
+    Module-level so it can be submitted to a process pool (async_app.py).
+
+    Returns:
+        (analyses, timings_ms) keyed by engine name; model loading is not timed
+    """
+    analyses, timings_ms = {}, {}
+    for name in names:
+        analyzer = get_analyzer(name)
+        start = time.perf_counter()
+        analyses[name] = analyzer.analyze_text(text)
+        timings_ms[name] = (time.perf_counter() - start) * 1000
+    return analyses, timings_ms
+
+
+def preload(names):
+    """Load engines ahead of the first request (also used as a pool initializer)"""
+    for name in names:
+        get_analyzer(name)
+
+
+def engine_status():
+    """Registered engines and whether each is loaded"""
+    return {
+        name: {'module': module, 'description': description, 'loaded': name in _analyzers}
+        for name, (module, description) in ENGINES.items()
+    }
@@ -5,13 +5,19 @@ import traceback
 import re
 import json
 import nltk
-import spacy
+import threading
 from collections import Counter, defaultdict
 import numpy as np
 from textstat import flesch_reading_ease, flesch_kincaid_grade
 import sys
 import os
 
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -24,33 +30,110 @@ except ImportError as e:
     print(f"⚠️ Could not import custom modules: {e}")
     print("🔄 Falling back to built-in NLP analysis")
 
+from lexicon.automaton import group_hits, merge_hits, hits_for
+from data_processing.preprocessing import segment_resume, SKILL_SECTIONS
+from utils.text_utils import ensure_nltk_resources
+from lexicon.terms import get_lexicon, LEXICONS
+
 app = Flask(__name__)
 CORS(app)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-    nltk.download('wordnet', quiet=True)
-except:
-    pass
-
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-    logger.info("✅ spaCy model loaded successfully")
-except OSError:
-    nlp = None
-    logger.warning("⚠️ spaCy model not found - using fallback analysis")
+# Required NLTK data, looked up (and downloaded if missing) once per process
+ensure_nltk_resources()
+
+# spaCy settings; the model itself is loaded on first use
+SPACY_MODEL = os.environ.get('SPACY_MODEL', 'en_core_web_sm')
+SPACY_MAX_CHARS = int(os.environ.get('SPACY_MAX_CHARS', '5000'))
+SPACY_BATCH_SIZE = int(os.environ.get('SPACY_BATCH_SIZE', '16'))
+SPACY_N_PROCESS = int(os.environ.get('SPACY_N_PROCESS', '1'))
+
+class SpacyEntityExtractor:
+    """
+    ORG/PRODUCT entities from a spaCy model trimmed to its NER component
+
+    The model is loaded lazily on first use with every other component
+    disabled, texts are capped at max_chars, and batches go through
+    nlp.pipe with n_process workers.
+    """
+
+    ENTITY_LABELS = ('ORG', 'PRODUCT')
+
+    def __init__(self, model_name=SPACY_MODEL, max_chars=SPACY_MAX_CHARS,
+                 batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS):
+        self.model_name = model_name
+        self.max_chars = max_chars
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.nlp = None
+        self.load_error = None if SPACY_AVAILABLE else 'spacy not installed'
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self):
+        return self.nlp is not None
+
+    @property
+    def available(self):
+        return self.load_error is None
+
+    def load(self):
+        """Load the model once; returns False if spaCy or the model is unavailable"""
+        if self.nlp is not None or self.load_error:
+            return self.nlp is not None
+        with self._lock:
+            if self.nlp is None and not self.load_error:
+                try:
+                    self.nlp = spacy.load(self.model_name, enable=['ner'])
+                    logger.info(f"✅ spaCy model loaded (NER only): {self.nlp.pipe_names}")
+                except OSError as e:
+                    self.load_error = str(e)
+                    logger.warning("⚠️ spaCy model not found - using fallback analysis")
+        return self.nlp is not None
+
+    def truncate(self, text):
+        """Cap text at max_chars, cutting at the last whitespace before the cap"""
+        if len(text) <= self.max_chars:
+            return text
+        cut = text.rfind(' ', 0, self.max_chars)
+        return text[:cut if cut > 0 else self.max_chars]
+
+    def extract(self, texts, n_process=1):
+        """
+        Entity texts for each input text
+
+        Args:
+            texts: Resume texts
+            n_process: Worker processes for nlp.pipe (worth it only for large batches)
+
+        Returns:
+            One list of ORG/PRODUCT entity strings per text (empty without a model)
+        """
+        if not self.load():
+            return [[] for _ in texts]
+        docs = self.nlp.pipe(
+            (self.truncate(text) for text in texts),
+            batch_size=self.batch_size, n_process=n_process
+        )
+        return [[ent.text for ent in doc.ents if ent.label_ in self.ENTITY_LABELS] for doc in docs]
+
+    def status(self):
+        return {
+            'model': self.model_name,
+            'available': self.available,
+            'ready': self.ready,
+            'max_chars': self.max_chars,
+            'n_process': self.n_process,
+            'error': self.load_error
+        }
 
 class IntelligentResumeAnalyzer:
     def __init__(self):
         self.setup_models()
         self.setup_patterns()
+        self.entity_extractor = SpacyEntityExtractor()
 
     def setup_models(self):
         """Initialize ML models and processors"""
@@ -67,91 +150,57 @@ class IntelligentResumeAnalyzer:
 
     def setup_patterns(self):
         """Setup regex patterns for intelligent extraction"""
-        # Technical skills with context
-        self.tech_patterns = {
-            'programming': r'\b(?:python|java|javascript|typescript|c\+\+|c#|php|ruby|go|rust|kotlin|swift|scala|r|matlab)\b',
-            'web_frameworks': r'\b(?:react|angular|vue|node\.js|django|flask|express|spring|laravel|rails)\b',
-            'databases': r'\b(?:mysql|postgresql|mongodb|redis|elasticsearch|oracle|sqlite|cassandra)\b',
-            'cloud_aws': r'\b(?:aws|amazon web services|ec2|s3|lambda|rds|dynamodb|cloudformation)\b',
-            'cloud_azure': r'\b(?:azure|microsoft azure|azure functions|cosmos db|azure sql)\b',
-            'cloud_gcp': r'\b(?:gcp|google cloud|firebase|big query|cloud functions)\b',
-            'devops': r'\b(?:docker|kubernetes|jenkins|git|gitlab|github|ci/cd|terraform|ansible)\b',
-            'ml_ai': r'\b(?:machine learning|deep learning|tensorflow|pytorch|scikit-learn|pandas|numpy|opencv)\b',
-            'mobile': r'\b(?:android|ios|react native|flutter|xamarin|swift|kotlin)\b'
-        }
-
-        # Soft skills with variations
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'collaboration', 'problem solving',
-            'analytical thinking', 'creative', 'adaptable', 'organized', 'detail oriented',
-            'time management', 'project management', 'critical thinking', 'innovation',
-            'mentoring', 'training', 'presentation', 'negotiation', 'customer service'
-        ]
-
-        # Action verbs for experience evaluation
-        self.strong_verbs = [
-            'achieved', 'implemented', 'developed', 'created', 'designed', 'built',
-            'managed', 'led', 'coordinated', 'organized', 'optimized', 'improved',
-            'increased', 'reduced', 'streamlined', 'automated', 'delivered', 'launched'
-        ]
-
-        self.weak_verbs = ['responsible for', 'worked on', 'helped with', 'assisted', 'involved in']
-
-        # Resume sections
-        self.section_patterns = {
-            'experience': r'(?i)\b(?:experience|employment|work history|professional experience)\b',
-            'education': r'(?i)\b(?:education|academic|qualification|degree)\b',
-            'skills': r'(?i)\b(?:skills|technical skills|competencies|expertise)\b',
-            'projects': r'(?i)\b(?:projects|portfolio|work samples)\b',
-            'certifications': r'(?i)\b(?:certification|certificate|license)\b',
-            'achievements': r'(?i)\b(?:achievement|accomplishment|award|honor)\b'
-        }
-
-    def extract_technical_skills(self, text):
-        """Extract technical skills using NLP and pattern matching"""
-        text_lower = text.lower()
+        # Term sets live in the shared lexicon, compiled once per process
+        terms = LEXICONS['intelligent']
+        self.tech_skills = terms['tech']
+        self.soft_skills = terms['soft']
+        self.strong_verbs = terms['verbs']['strong']
+        self.weak_verbs = terms['verbs']['weak']
+        self.passive_phrases = terms['passive']
+        self.lexicon = get_lexicon('intelligent')
+
+        # Sections checked for (spans from data_processing/preprocessing.py)
+        self.resume_sections = ['experience', 'education', 'skills', 'projects', 'certifications', 'achievements']
+
+    def extract_technical_skills(self, text, hits=None, entities=None):
+        """Extract technical skills from the skills, experience and projects sections"""
         skills = defaultdict(list)
+        skill_text = segment_resume(text).text_of(*SKILL_SECTIONS) if hits is None or entities is None else None
 
-        if nlp:
-            doc = nlp(text)
-            # Extract entities that might be technologies
-            for ent in doc.ents:
-                if ent.label_ in ['ORG', 'PRODUCT']:
-                    skills['entities'].append(ent.text)
+        # Extract entities that might be technologies
+        if entities is None:
+            entities = self.entity_extractor.extract([skill_text])[0]
+        if entities:
+            skills['entities'].extend(entities)
 
-        # Pattern-based extraction
-        for category, pattern in self.tech_patterns.items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                skills[category].extend(matches)
+        # Lexicon-based extraction
+        tech_hits = group_hits(self.lexicon.scan(skill_text) if hits is None else hits, 'tech')
+        for category, terms in self.tech_skills.items():
+            found = [term for term in terms if term in tech_hits.get(category, {})]
+            if found:
+                skills[category].extend(found)
 
         # Remove duplicates
         for category in skills:
-            skills[category] = list(set(skills[category]))
+            skills[category] = list(dict.fromkeys(skills[category]))
 
         return dict(skills)
 
-    def extract_soft_skills(self, text):
-        """Extract soft skills with context analysis"""
-        text_lower = text.lower()
-        found_skills = []
-
-        for skill in self.soft_skills:
-            if skill.lower() in text_lower:
-                # Check for context (not just keyword matching)
-                skill_pattern = rf'\b{re.escape(skill.lower())}\b'
-                if re.search(skill_pattern, text_lower):
-                    found_skills.append(skill)
+    def extract_soft_skills(self, text, hits=None):
+        """Extract soft skills from the skills, experience and projects sections"""
+        if hits is None:
+            hits = self.lexicon.scan(segment_resume(text).text_of(*SKILL_SECTIONS))
+        soft_hits = hits.get('soft', {})
+        return [skill for skill in self.soft_skills if skill in soft_hits]
 
-        return found_skills
-
-    def analyze_experience_quality(self, text):
+    def analyze_experience_quality(self, text, hits=None):
         """Analyze the quality of experience descriptions"""
         text_lower = text.lower()
+        verb_hits = group_hits(self.lexicon.scan(text) if hits is None else hits, 'verbs')
 
         # Count strong vs weak action verbs
-        strong_verb_count = sum(1 for verb in self.strong_verbs if verb in text_lower)
-        weak_verb_count = sum(1 for verb in self.weak_verbs if verb in text_lower)
+        strong_verb_count = len(verb_hits.get('strong', {}))
+        weak_verb_count = len(verb_hits.get('weak', {}))
 
         # Look for quantified achievements
         numbers_pattern = r'\b\d+(?:\.\d+)?(?:\s*(?:%|percent|k|million|billion|years?|months?|days?|hours?))\b'
@@ -169,19 +218,12 @@ class IntelligentResumeAnalyzer:
             'total_sentences': len([s for s in sentences if s.strip()])
         }
 
-    def detect_resume_sections(self, text):
-        """Detect which resume sections are present"""
-        detected_sections = {}
-
-        for section, pattern in self.section_patterns.items():
-            if re.search(pattern, text):
-                detected_sections[section] = True
-            else:
-                detected_sections[section] = False
+    def detect_resume_sections(self, text, segments=None):
+        """Detect which resume sections are present, from the section headings"""
+        segments = segment_resume(text) if segments is None else segments
+        return {section: segments.has(section) for section in self.resume_sections}
 
-        return detected_sections
-
-    def calculate_ats_compatibility(self, text):
+    def calculate_ats_compatibility(self, text, sections=None):
         """Calculate ATS compatibility score"""
         issues = []
         score = 100
@@ -192,7 +234,7 @@ class IntelligentResumeAnalyzer:
             score -= 10
 
         # Check for standard sections
-        sections = self.detect_resume_sections(text)
+        sections = self.detect_resume_sections(text) if sections is None else sections
         missing_sections = [s for s, present in sections.items() if not present and s in ['experience', 'education']]
         if missing_sections:
             issues.append(f"Missing critical sections: {', '.join(missing_sections)}")
@@ -214,7 +256,7 @@ class IntelligentResumeAnalyzer:
 
         return max(0, score), issues
 
-    def detect_specific_issues(self, text, skills, experience_analysis, sections):
+    def detect_specific_issues(self, text, skills, experience_analysis, sections, hits=None):
         """Detect specific resume issues with detailed analysis"""
         issues = []
 
@@ -249,8 +291,7 @@ class IntelligentResumeAnalyzer:
             issues.append("Resume too lengthy - consider condensing content")
 
         # Check for passive language
-        passive_indicators = ['was responsible', 'were involved', 'duties included']
-        passive_count = sum(1 for indicator in passive_indicators if indicator in text.lower())
+        passive_count = len((self.lexicon.scan(text) if hits is None else hits).get('passive', {}))
         if passive_count > 2:
             issues.append("Too much passive language - use active voice for impact")
 
@@ -328,20 +369,33 @@ class IntelligentResumeAnalyzer:
         final_score = base_score + skills_score + exp_score + section_score + ats_contribution - issue_penalty
         return max(0.1, min(10.0, final_score))
 
-    def analyze_text(self, text):
-        """Main analysis function with intelligent processing"""
+    def analyze_text(self, text, entities=None, segments=None):
+        """
+        Main analysis function with intelligent processing
+
+        entities: precomputed spaCy entities for the text (see analyze_batch)
+        segments: precomputed section spans for the text
+        """
         try:
             logger.info("🔍 Starting intelligent resume analysis")
 
-            # Extract features using advanced methods
-            technical_skills = self.extract_technical_skills(text)
-            soft_skills = self.extract_soft_skills(text)
-            experience_analysis = self.analyze_experience_quality(text)
-            sections = self.detect_resume_sections(text)
-            ats_score, ats_issues = self.calculate_ats_compatibility(text)
+            # Skills are looked for only in the sections that list them
+            segments = segment_resume(text) if segments is None else segments
+            if entities is None:
+                entities = self.entity_extractor.extract([segments.text_of(*SKILL_SECTIONS)])[0]
+
+            # Extract features using advanced methods; every lexicon term is matched in one pass over the sections
+            section_hits = self.lexicon.scan_sections(text, segments.sections)
+            hits = merge_hits(*section_hits.values())
+            skill_hits = hits_for(section_hits, SKILL_SECTIONS)
+            technical_skills = self.extract_technical_skills(text, skill_hits, entities)
+            soft_skills = self.extract_soft_skills(text, skill_hits)
+            experience_analysis = self.analyze_experience_quality(text, hits)
+            sections = self.detect_resume_sections(text, segments)
+            ats_score, ats_issues = self.calculate_ats_compatibility(text, sections)
 
             # Detect issues
-            issues = self.detect_specific_issues(text, technical_skills, experience_analysis, sections)
+            issues = self.detect_specific_issues(text, technical_skills, experience_analysis, sections, hits)
             issues.extend(ats_issues)
 
             # Generate intelligent suggestions
@@ -405,6 +459,15 @@ class IntelligentResumeAnalyzer:
                 }
             }
 
+    def analyze_batch(self, texts):
+        """Analyze several resumes, running spaCy over all of them in one nlp.pipe call"""
+        extractor = self.entity_extractor
+        segments = [segment_resume(text) for text in texts]
+        entities = extractor.extract([text_segments.text_of(*SKILL_SECTIONS) for text_segments in segments],
+                                     n_process=extractor.n_process if len(texts) > 1 else 1)
+        return [self.analyze_text(text, text_entities, text_segments)
+                for text, text_entities, text_segments in zip(texts, entities, segments)]
+
 # Initialize the intelligent analyzer
 analyzer = IntelligentResumeAnalyzer()
 
@@ -414,7 +477,8 @@ def health_check():
         'status': 'healthy',
         'service': 'Intelligent Resume ML Analysis API',
         'version': '2.0.0',
-        'features': ['NLP Analysis', 'ATS Compatibility', 'Smart Suggestions', 'Issue Detection']
+        'features': ['NLP Analysis', 'ATS Compatibility', 'Smart Suggestions', 'Issue Detection'],
+        'spacy': analyzer.entity_extractor.status()
     })
 
 @app.route('/analyze-text', methods=['POST'])
@@ -455,11 +519,44 @@ def analyze_text():
             'details': str(e)
         }), 500
 
+@app.route('/analyze-batch', methods=['POST'])
+def analyze_batch():
+    try:
+        data = request.get_json()
+        if not data or not isinstance(data.get('texts'), list) or not data['texts']:
+            return jsonify({
+                'error': 'Provide a non-empty list of texts for analysis'
+            }), 400
+
+        texts = data['texts']
+        if any(not isinstance(text, str) or len(text.strip()) < 50 for text in texts):
+            return jsonify({
+                'error': 'Every text must be at least 50 characters'
+            }), 400
+
+        logger.info(f"📥 Received batch of {len(texts)} resumes")
+
+        analyses = analyzer.analyze_batch(texts)
+
+        return jsonify({
+            'success': True,
+            'analyses': analyses
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Batch analysis failed: {str(e)}")
+        logger.error(traceback.format_exc())
+
+        return jsonify({
+            'error': 'Internal server error during analysis',
+            'details': str(e)
+        }), 500
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({
         'error': 'Endpoint not found',
-        'available_endpoints': ['/', '/analyze-text']
+        'available_endpoints': ['/', '/analyze-text', '/analyze-batch']
     }), 404
 
 @app.errorhandler(500)
@@ -0,0 +1,278 @@
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import logging
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import requests
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from training.benchmark import load_corpus
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Service name -> (working directory, module exposing the Flask `app`)
+SERVICES = {
+    'resume_score': (PROJECT_ROOT.parent / 'resume_score', 'app'),
+    'ml': (PROJECT_ROOT, 'app'),
+    'smart': (PROJECT_ROOT, 'smart_app'),
+    'intelligent': (PROJECT_ROOT, 'intelligent_app'),
+    'unified': (PROJECT_ROOT, 'unified_app'),
+    'async': (PROJECT_ROOT, 'async_app')
+}
+
+# ASGI services always run under uvicorn; workers sets the size of their analysis pool
+ASGI_SERVICES = {'async'}
+
+
+def free_port():
+    """An unused local TCP port for the next service instance"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(service, workers, port, server='flask'):
+    """
+    Start a service in a subprocess
+
+    server='flask' runs the threaded development server (one process, so
+    workers is ignored); server='gunicorn' runs `workers` gunicorn processes.
+    ASGI services run under uvicorn with `workers` analysis processes.
+    """
+    cwd, module = SERVICES[service]
+    env = dict(os.environ)
+    if service in ASGI_SERVICES:
+        server = 'uvicorn'
+        env['ASYNC_WORKERS'] = str(workers)
+        command = [sys.executable, '-m', 'uvicorn', f'{module}:app', '--host', '127.0.0.1',
+                   '--port', str(port), '--log-level', 'warning']
+    elif server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-w', str(workers), '--threads', '4',
+                   '-b', f'127.0.0.1:{port}', f'{module}:app']
+    else:
+        command = [sys.executable, '-c',
+                   f"import logging, {module}; logging.disable(logging.INFO); "
+                   f"{module}.app.run(host='127.0.0.1', port={port}, threaded=True, debug=False)"]
+
+    logger.info(f"Starting {service} ({server}, {workers} worker(s)) on port {port}")
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, cwd=str(cwd), env=env, stdout=subprocess.DEVNULL, stderr=log)
+    # Keep the stderr log so a failed start can be reported
+    process.log = log
+    return process
+
+
+def wait_until_ready(base_url, process, timeout=120):
+    """
+    Poll the service's health endpoint until it answers 200
+
+    Raises:
+        RuntimeError: The process exited first (with the tail of its stderr)
+        TimeoutError: Not ready within timeout seconds
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            process.log.seek(0)
+            last_lines = process.log.read().decode(errors='ignore').strip().splitlines()[-3:]
+            raise RuntimeError(f"Service exited with code {process.returncode} before becoming ready: "
+                               + ' | '.join(last_lines))
+        try:
+            if requests.get(base_url + '/', timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"Service at {base_url} not ready after {timeout}s")
+
+
+def run_level(url, texts, concurrency, duration, timeout=30):
+    """
+    Drive the endpoint with `concurrency` closed-loop clients for `duration` seconds
+
+    Returns:
+        Latency percentiles (ms), throughput (req/s), error rate and the
+        share of errors that were 503 rejections (admission control)
+    """
+    latencies = []
+    errors = []
+    rejected = []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        session = requests.Session()
+        while time.perf_counter() < stop_at:
+            text = rng.choice(texts)
+            start = time.perf_counter()
+            try:
+                response = session.post(url, json={'text': text}, timeout=timeout)
+                ok = response.status_code == 200
+                busy = response.status_code == 503
+            except requests.RequestException:
+                ok = busy = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                (latencies if ok else errors).append(elapsed)
+                if busy:
+                    rejected.append(elapsed)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = len(latencies) + len(errors)
+    # No latency percentiles (None) when every request at this level failed
+    percentiles = np.percentile(np.asarray(latencies) * 1000, [50, 95, 99]) if latencies else [None] * 3
+    p50, p95, p99 = (None if value is None else float(value) for value in percentiles)
+    return {
+        'concurrency': concurrency,
+        'requests': total,
+        'throughput_rps': len(latencies) / elapsed,
+        'error_rate': len(errors) / total if total else 0.0,
+        'rejected_rate': len(rejected) / total if total else 0.0,
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99
+    }
+
+
+def saturation_point(levels, min_gain=0.1):
+    """
+    Concurrency beyond which throughput stops growing
+
+    Returns the last level whose successor adds less than min_gain relative
+    throughput (or raises the error rate); None if throughput kept growing.
+    """
+    for previous, current in zip(levels, levels[1:]):
+        gain = current['throughput_rps'] / previous['throughput_rps'] - 1 if previous['throughput_rps'] else 0
+        if gain < min_gain or current['error_rate'] > previous['error_rate'] + 0.01:
+            return previous['concurrency']
+    return None
+
+
+def load_test(service, worker_counts, concurrency_levels, duration, texts, server='flask'):
+    """
+    Run the concurrency sweep once per worker configuration
+
+    The Flask development server is a single process, so for non-ASGI
+    services under server='flask' the worker counts collapse to one run.
+    """
+    if server == 'flask' and service not in ASGI_SERVICES and len(set(worker_counts)) > 1:
+        logger.warning(f"{service} runs on the single-process Flask server; ignoring --workers "
+                       f"{' '.join(map(str, worker_counts))} (use --server gunicorn to vary workers)")
+        worker_counts = [1]
+
+    report = []
+    for workers in worker_counts:
+        port = free_port()
+        base_url = f'http://127.0.0.1:{port}'
+        process = start_service(service, workers, port, server)
+        try:
+            try:
+                wait_until_ready(base_url, process)
+            except (RuntimeError, TimeoutError) as e:
+                logger.error(f"{service} failed to start: {e}")
+                continue
+            levels = []
+            for concurrency in concurrency_levels:
+                result = run_level(base_url + '/analyze-text', texts, concurrency, duration)
+                levels.append(result)
+                logger.info(f"{service} w={workers} c={concurrency}: {result['throughput_rps']:.1f} req/s, "
+                            f"p95 {format_ms(result['p95_ms'])} ms, errors {result['error_rate']:.1%}")
+            report.append({
+                'service': service,
+                'server': 'uvicorn' if service in ASGI_SERVICES else server,
+                'workers': workers,
+                'levels': levels,
+                'saturation_concurrency': saturation_point(levels),
+                'peak_throughput_rps': max(level['throughput_rps'] for level in levels)
+            })
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return report
+
+
+def format_ms(value):
+    """A latency for the report, '-' for a level without successful requests"""
+    return '-' if value is None else f"{value:.1f}"
+
+
+def print_report(report):
+    """Print each run's per-concurrency latency/throughput table and saturation point"""
+    print("\n" + "="*60)
+    print("LOAD TEST RESULTS")
+    print("="*60)
+
+    for run in report:
+        print(f"\n{run['service']} - {run['server']}, {run['workers']} worker(s)")
+        print(f"  {'clients':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8} {'503s':>8}")
+        for level in run['levels']:
+            print(f"  {level['concurrency']:>7} {level['throughput_rps']:>9.1f} {format_ms(level['p50_ms']):>9} "
+                  f"{format_ms(level['p95_ms']):>9} {format_ms(level['p99_ms']):>9} {level['error_rate']:>8.1%} "
+                  f"{level['rejected_rate']:>8.1%}")
+        saturation = run['saturation_concurrency']
+        print(f"  Peak throughput: {run['peak_throughput_rps']:.1f} req/s, "
+              f"saturates at: {saturation if saturation else 'not reached'} clients")
+
+    print("\n" + "="*60)
+
+
+def main():
+    """Load test the selected services over the worker and concurrency sweep"""
+    parser = argparse.ArgumentParser(description="Load test the /analyze-text services")
+    parser.add_argument('--service', choices=list(SERVICES), nargs='+', default=['smart'])
+    parser.add_argument('--server', choices=['flask', 'gunicorn'], default='flask',
+                        help="flask: threaded dev server; gunicorn: multi-process (needs gunicorn)")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1],
+                        help="Worker processes to try (gunicorn, or the analysis pool of ASGI services; "
+                             "the flask server always runs one)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument('--corpus', default='data/raw', help="Resume directory or dataset file for the request mix")
+    parser.add_argument('--synthetic', type=int, default=200, help="Synthetic resumes added to the request mix")
+    parser.add_argument('--output', help="Optional JSON path for the report")
+    args = parser.parse_args()
+
+    corpus = args.corpus if Path(args.corpus).exists() else None
+    texts = [text for text in load_corpus(corpus, n_synthetic=args.synthetic) if len(text.strip()) >= 50]
+
+    report = []
+    for service in args.service:
+        report.extend(load_test(service, args.workers, args.concurrency, args.duration, texts, args.server))
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report saved to {args.output}")
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import os
+import logging
+import importlib.util
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The resume_score service, deployed on its own next to this project
+RESUME_SCORE_APP = os.path.join(os.path.dirname(__file__), '..', 'resume_score', 'app.py')
+
+
+def load_resume_score(path=RESUME_SCORE_APP):
+    """
+    Import resume_score/app.py
+
+    Loaded by path under its own module name: it is also called app.py, so
+    a plain import would return this project's app.py.
+    """
+    spec = importlib.util.spec_from_file_location('resume_score_app', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ResumeScoreAnalyzer:
+    """resume_score's TF-IDF + random forest analysis behind the engine interface (engines.py)"""
+
+    def __init__(self, module):
+        self.module = module
+
+    def analyze_text(self, text):
+        """
+        Run resume_score's analyze_resume_text
+
+        Raises:
+            ValueError: The text is too short to analyze
+        """
+        analysis = self.module.analyze_resume_text(text)
+        if 'error' in analysis:
+            raise ValueError(analysis['error'])
+        return analysis
+
+
+analyzer = ResumeScoreAnalyzer(load_resume_score())
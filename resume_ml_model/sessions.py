@@ -0,0 +1,203 @@
+import os
+import sys
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from data_processing.preprocessing import segment_resume
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sessions kept in memory, least recently used evicted first
+SESSION_MAX = int(os.environ.get('SESSION_MAX', 1000))
+# Seconds an idle session is kept
+SESSION_TTL = float(os.environ.get('SESSION_TTL', 1800))
+
+
+def split_sections(text):
+    """
+    Section spans of resume text (data_processing/preprocessing.py)
+
+    Returns:
+        [(type, start, end)] in document order
+    """
+    return [(section.type, section.start, section.end) for section in segment_resume(text).sections]
+
+
+def merge_states(states):
+    """
+    Merge section states: counts add, lists concatenate, flags OR, dicts merge by key
+    """
+    merged = {}
+    for state in states:
+        merged = _merge_value(merged, state)
+    return merged
+
+
+def _merge_value(a, b):
+    if isinstance(a, dict):
+        merged = dict(a)
+        for key, value in b.items():
+            merged[key] = _merge_value(merged[key], value) if key in merged else value
+        return merged
+    if isinstance(a, bool):
+        return a or b
+    if isinstance(a, (int, float, list)):
+        return a + b
+    return b
+
+
+def supports_incremental(analyzer):
+    return hasattr(analyzer, 'section_state')
+
+
+class AnalysisSession:
+    """
+    Resume text and per-section analysis state for one editor session
+
+    Section states are keyed by section text, so after an edit only the
+    sections whose text changed are analyzed again; the analysis is then
+    rebuilt from the merged states.
+    """
+
+    def __init__(self, engine, analyzer, text):
+        self.id = uuid.uuid4().hex
+        self.engine = engine
+        self.analyzer = analyzer
+        self.text = ''
+        self.revision = 0
+        self.sections = []
+        self.states = {}
+        self.analysis = None
+        self.lock = threading.Lock()
+        self.last_used = time.time()
+        self.update(text)
+
+    def update(self, text):
+        """
+        Re-analyze after the text changed
+
+        Returns:
+            Indices of the sections that were analyzed again
+        """
+        sections = split_sections(text)
+        states, recomputed = {}, []
+        for index, (_, start, end) in enumerate(sections):
+            section_text = text[start:end]
+            if section_text not in states:
+                if section_text in self.states:
+                    states[section_text] = self.states[section_text]
+                else:
+                    states[section_text] = self.analyzer.section_state(section_text)
+                    recomputed.append(index)
+
+        self.text = text
+        self.sections = sections
+        self.states = states
+        self.analysis = self.analyzer.analyze_text(
+            text, merge_states(states[text[start:end]] for _, start, end in sections)
+        )
+        self.revision += 1
+        self.last_used = time.time()
+        return recomputed
+
+    def apply_edits(self, edits):
+        """
+        Apply edits in order, then re-analyze the changed sections
+
+        Each edit is either a text diff {'start', 'end', 'text'} replacing
+        text[start:end], or a section replacement {'section', 'text'} where
+        section is an index or type from `sections` (the first section of that
+        type) and the text replaces
+        the whole section span, heading included. Offsets refer to the text
+        as left by the previous edit.
+
+        Raises:
+            ValueError: An edit is malformed or out of range
+        """
+        text = self.text
+        for edit in edits:
+            if not isinstance(edit, dict) or not isinstance(edit.get('text'), str):
+                raise ValueError("Each edit needs a 'text' string")
+            if 'section' in edit:
+                start, end = self._section_span(text, edit['section'])
+            elif 'start' in edit and 'end' in edit:
+                start, end = edit['start'], edit['end']
+                if not (isinstance(start, int) and isinstance(end, int) and 0 <= start <= end <= len(text)):
+                    raise ValueError(f"Edit range [{start}, {end}) is outside the text (length {len(text)})")
+            else:
+                raise ValueError("Each edit needs 'start' and 'end', or 'section'")
+            text = text[:start] + edit['text'] + text[end:]
+        return self.update(text)
+
+    @staticmethod
+    def _section_span(text, section):
+        sections = split_sections(text)
+        if isinstance(section, int) and not isinstance(section, bool):
+            if not 0 <= section < len(sections):
+                raise ValueError(f"Section index {section} out of range (0-{len(sections) - 1})")
+            return sections[section][1:]
+        for section_type, start, end in sections:
+            if section_type == section:
+                return start, end
+        raise ValueError(f"Section '{section}' not found. Available: {[section_type for section_type, _, _ in sections]}")
+
+    def to_dict(self):
+        return {
+            'session_id': self.id,
+            'engine': self.engine,
+            'revision': self.revision,
+            'sections': [{'type': section_type, 'start': start, 'end': end}
+                         for section_type, start, end in self.sections],
+            'analysis': self.analysis
+        }
+
+
+class SessionStore:
+    """In-memory sessions with LRU eviction and an idle timeout"""
+
+    def __init__(self, max_sessions=SESSION_MAX, ttl=SESSION_TTL):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, session):
+        with self._lock:
+            self._sessions[session.id] = session
+            self._evict()
+        return session
+
+    def get(self, session_id):
+        """
+        Raises:
+            KeyError: Unknown or expired session
+        """
+        with self._lock:
+            self._evict()
+            session = self._sessions[session_id]
+            session.last_used = time.time()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _evict(self):
+        cutoff = time.time() - self.ttl
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if len(self._sessions) <= self.max_sessions and oldest.last_used >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
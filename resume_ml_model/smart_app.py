@@ -7,6 +7,16 @@ import json
 import nltk
 from collections import Counter, defaultdict
 import numpy as np
+import sys
+import os
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from lexicon.automaton import group_hits, merge_hits, hits_for
+from data_processing.preprocessing import segment_resume, SKILL_SECTIONS
+from utils.text_utils import ensure_nltk_resources, get_stopwords
+from lexicon.terms import get_lexicon, LEXICONS
 
 app = Flask(__name__)
 CORS(app)
@@ -14,159 +24,102 @@ CORS(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data quietly
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-    nltk.download('wordnet', quiet=True)
-    from nltk.corpus import stopwords
+# Required NLTK data, looked up (and downloaded if missing) once per process
+NLTK_AVAILABLE = ensure_nltk_resources()
+if NLTK_AVAILABLE:
     from nltk.tokenize import word_tokenize, sent_tokenize
     from nltk.tag import pos_tag
-    NLTK_AVAILABLE = True
     logger.info("✅ NLTK loaded successfully")
-except:
-    NLTK_AVAILABLE = False
+else:
     logger.warning("⚠️ NLTK not available - using basic analysis")
 
 class SmartResumeAnalyzer:
     def __init__(self):
         self.setup_patterns()
-        self.stop_words = set(stopwords.words('english')) if NLTK_AVAILABLE else set()
+        self.stop_words = get_stopwords() if NLTK_AVAILABLE else frozenset()
 
     def setup_patterns(self):
         """Setup comprehensive patterns for intelligent extraction"""
 
-        # Advanced technical skills database
-        self.tech_skills_db = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-                'kotlin', 'swift', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell'
-            ],
-            'web_technologies': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-                'spring', 'laravel', 'rails', 'asp.net', 'jquery', 'bootstrap', 'sass', 'less'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle', 'sqlite',
-                'cassandra', 'dynamodb', 'neo4j', 'couchdb', 'mariadb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'google cloud', 'amazon web services', 'microsoft azure',
-                'ec2', 's3', 'lambda', 'rds', 'kubernetes', 'docker', 'terraform', 'ansible'
-            ],
-            'ml_ai': [
-                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-                'pandas', 'numpy', 'opencv', 'nlp', 'computer vision', 'neural networks'
-            ],
-            'tools_frameworks': [
-                'git', 'github', 'gitlab', 'jenkins', 'docker', 'kubernetes', 'jira', 'confluence',
-                'agile', 'scrum', 'devops', 'ci/cd', 'rest api', 'graphql', 'microservices'
-            ]
-        }
-
-        # Soft skills with importance weights
-        self.soft_skills = {
-            'leadership': ['leadership', 'team lead', 'managing', 'supervising', 'mentoring'],
-            'communication': ['communication', 'presentation', 'public speaking', 'writing'],
-            'problem_solving': ['problem solving', 'analytical', 'troubleshooting', 'debugging'],
-            'teamwork': ['teamwork', 'collaboration', 'cross-functional', 'interpersonal'],
-            'project_management': ['project management', 'planning', 'coordination', 'organizing'],
-            'adaptability': ['adaptable', 'flexible', 'learning', 'growth mindset']
-        }
-
-        # Action verbs categorized by strength
-        self.action_verbs = {
-            'strong': [
-                'achieved', 'implemented', 'developed', 'created', 'designed', 'built', 'engineered',
-                'managed', 'led', 'directed', 'coordinated', 'organized', 'optimized', 'improved',
-                'increased', 'reduced', 'streamlined', 'automated', 'delivered', 'launched',
-                'established', 'initiated', 'transformed', 'revolutionized', 'spearheaded'
-            ],
-            'moderate': [
-                'worked', 'assisted', 'supported', 'contributed', 'participated', 'collaborated',
-                'helped', 'maintained', 'updated', 'modified', 'enhanced', 'researched'
-            ],
-            'weak': [
-                'responsible for', 'duties included', 'involved in', 'was tasked with',
-                'familiar with', 'exposure to', 'knowledge of'
-            ]
-        }
-
-        # Resume sections patterns
-        self.section_patterns = {
-            'contact': r'(?i)(email|phone|address|linkedin|portfolio)',
-            'summary': r'(?i)(summary|profile|objective|about)',
-            'experience': r'(?i)(experience|employment|work history|professional)',
-            'education': r'(?i)(education|academic|qualification|degree|university|college)',
-            'skills': r'(?i)(skills|technical|competencies|expertise|proficiencies)',
-            'projects': r'(?i)(projects|portfolio|work samples|personal projects)',
-            'certifications': r'(?i)(certification|certificate|license|credentials)',
-            'achievements': r'(?i)(achievement|accomplishment|award|honor|recognition)'
-        }
-
-        # Industry keywords
-        self.industry_keywords = {
-            'software_engineering': ['software', 'engineering', 'development', 'programming', 'coding'],
-            'data_science': ['data science', 'analytics', 'statistics', 'machine learning', 'ai'],
-            'cybersecurity': ['security', 'cybersecurity', 'penetration', 'encryption', 'firewall'],
-            'product_management': ['product', 'strategy', 'roadmap', 'stakeholder', 'user experience'],
-            'marketing': ['marketing', 'campaign', 'brand', 'social media', 'content', 'seo']
-        }
+        # Term sets live in the shared lexicon, compiled once per process
+        terms = LEXICONS['smart']
+        self.tech_skills_db = terms['tech']
+        self.soft_skills = terms['soft']
+        self.action_verbs = terms['verbs']
+        self.industry_keywords = terms['industry']
+        self.lexicon = get_lexicon('smart')
+
+        # Sections reported in sections_found (spans from data_processing/preprocessing.py;
+        # 'contact' means an email, phone or LinkedIn profile was found)
+        self.resume_sections = [
+            'contact', 'summary', 'experience', 'education', 'skills',
+            'projects', 'certifications', 'achievements'
+        ]
 
-    def extract_skills_intelligent(self, text):
-        """Extract skills using intelligent pattern matching and context analysis"""
-        text_lower = text.lower()
+    def extract_skills_intelligent(self, text, hits=None):
+        """Extract skills from the skills, experience and projects sections"""
+        if hits is None:
+            hits = self.lexicon.scan(segment_resume(text).text_of(*SKILL_SECTIONS))
         extracted_skills = defaultdict(list)
 
         # Extract technical skills
+        tech_hits = group_hits(hits, 'tech')
         for category, skills in self.tech_skills_db.items():
-            for skill in skills:
-                # Look for skill with word boundaries
-                pattern = rf'\b{re.escape(skill.lower())}\b'
-                if re.search(pattern, text_lower):
-                    extracted_skills[category].append(skill)
+            found = [skill for skill in skills if skill in tech_hits.get(category, {})]
+            if found:
+                extracted_skills[category] = found
 
         # Extract soft skills with context
+        soft_hits = group_hits(hits, 'soft')
         for category, variations in self.soft_skills.items():
-            for variation in variations:
-                pattern = rf'\b{re.escape(variation.lower())}\b'
-                if re.search(pattern, text_lower):
-                    extracted_skills['soft_skills'].append(variation)
+            extracted_skills['soft_skills'].extend(
+                variation for variation in variations if variation in soft_hits.get(category, {})
+            )
 
         # Remove duplicates
         for category in extracted_skills:
-            extracted_skills[category] = list(set(extracted_skills[category]))
+            extracted_skills[category] = list(dict.fromkeys(extracted_skills[category]))
 
-        return dict(extracted_skills)
+        return {category: skills for category, skills in extracted_skills.items() if skills}
 
-    def analyze_writing_quality(self, text):
+    def writing_stats(self, text):
+        """Sentence, passive voice and word counts behind the writing quality checks"""
+        sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'[.!?]+', text)
+        # The regex split leaves an empty piece after the last full stop
+        sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
+        passive_indicators = ['was ', 'were ', 'been ', 'being ']
+        return {
+            'sentence_count': len(sentence_lengths),
+            'sentence_lengths': sentence_lengths,
+            'passive_count': sum(text.lower().count(indicator) for indicator in passive_indicators),
+            'word_freq': Counter(text.lower().split())
+        }
+
+    def analyze_writing_quality(self, text, stats=None):
         """Analyze writing quality and detect issues"""
+        stats = self.writing_stats(text) if stats is None else stats
         issues = []
 
         # Sentence analysis
-        sentences = sent_tokenize(text) if NLTK_AVAILABLE else re.split(r'[.!?]+', text)
+        sentence_count = stats['sentence_count']
 
-        if len(sentences) == 0:
+        if sentence_count == 0:
             return {'issues': ['No clear sentences detected'], 'metrics': {}}
 
         # Calculate metrics
-        avg_sentence_length = np.mean([len(s.split()) for s in sentences if s.strip()])
+        avg_sentence_length = np.mean(stats['sentence_lengths'])
 
         # Detect issues
         if avg_sentence_length > 25:
             issues.append("Sentences are too long - aim for 15-20 words per sentence")
 
         # Look for passive voice
-        passive_indicators = ['was ', 'were ', 'been ', 'being ']
-        passive_count = sum(text.lower().count(indicator) for indicator in passive_indicators)
-        if passive_count > len(sentences) * 0.3:
+        passive_count = stats['passive_count']
+        if passive_count > sentence_count * 0.3:
             issues.append("Too much passive voice - use active voice for stronger impact")
 
         # Check for repetitive words
-        words = text.lower().split()
-        word_freq = Counter(words)
-        repetitive_words = [word for word, count in word_freq.items()
+        repetitive_words = [word for word, count in stats['word_freq'].items()
                           if count > 5 and len(word) > 4 and word not in self.stop_words]
         if repetitive_words:
             issues.append(f"Repetitive words detected: {', '.join(repetitive_words[:3])}")
@@ -175,14 +128,14 @@ class SmartResumeAnalyzer:
             'issues': issues,
             'metrics': {
                 'avg_sentence_length': avg_sentence_length,
-                'passive_voice_ratio': passive_count / len(sentences) if sentences else 0,
-                'total_sentences': len(sentences)
+                'passive_voice_ratio': passive_count / sentence_count,
+                'total_sentences': sentence_count
             }
         }
 
-    def evaluate_action_verbs(self, text):
+    def evaluate_action_verbs(self, text, hits=None):
         """Evaluate the strength of action verbs used"""
-        text_lower = text.lower()
+        verb_hits = group_hits(self.lexicon.scan(text) if hits is None else hits, 'verbs')
 
         verb_analysis = {
             'strong_count': 0,
@@ -193,8 +146,7 @@ class SmartResumeAnalyzer:
 
         for strength, verbs in self.action_verbs.items():
             for verb in verbs:
-                pattern = rf'\b{re.escape(verb.lower())}\b'
-                if re.search(pattern, text_lower):
+                if verb in verb_hits.get(strength, {}):
                     verb_analysis[f'{strength}_count'] += 1
                     verb_analysis['found_verbs'][strength].append(verb)
 
@@ -219,15 +171,34 @@ class SmartResumeAnalyzer:
 
         return achievements
 
-    def analyze_ats_compatibility(self, text):
+    def ats_stats(self, text, segments=None):
+        """Sections, contact details, special characters and words found in the text"""
+        segments = segment_resume(text) if segments is None else segments
+        contact_patterns = {
+            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+            'phone': r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b',
+            'linkedin': r'linkedin\.com/in/[\w-]+',
+        }
+        contact_found = {contact_type: bool(re.search(pattern, text, re.IGNORECASE))
+                         for contact_type, pattern in contact_patterns.items()}
+        sections_found = {section: segments.has(section) for section in self.resume_sections}
+        # Any text before the first heading is typed 'contact'; the details decide
+        sections_found['contact'] = any(contact_found.values())
+        return {
+            'sections_found': sections_found,
+            'contact_found': contact_found,
+            'problematic_chars': len(re.findall(r'[^\w\s\-.,()@:/\n\r]', text)),
+            'word_count': len(text.split())
+        }
+
+    def analyze_ats_compatibility(self, text, stats=None):
         """Comprehensive ATS compatibility analysis"""
+        stats = self.ats_stats(text) if stats is None else stats
         score = 100
         issues = []
 
         # Check for standard section headers
-        sections_found = {}
-        for section, pattern in self.section_patterns.items():
-            sections_found[section] = bool(re.search(pattern, text))
+        sections_found = dict(stats['sections_found'])
 
         critical_sections = ['experience', 'education', 'skills']
         missing_critical = [s for s in critical_sections if not sections_found.get(s, False)]
@@ -237,25 +208,18 @@ class SmartResumeAnalyzer:
             issues.append(f"Missing critical sections: {', '.join(missing_critical)}")
 
         # Check for contact information
-        contact_patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b',
-            'linkedin': r'linkedin\.com/in/[\w-]+',
-        }
-
-        for contact_type, pattern in contact_patterns.items():
-            if not re.search(pattern, text, re.IGNORECASE):
+        for contact_type, found in stats['contact_found'].items():
+            if not found:
                 score -= 10
                 issues.append(f"No {contact_type} found")
 
         # Check for problematic formatting characters
-        problematic_chars = len(re.findall(r'[^\w\s\-.,()@:/\n\r]', text))
-        if problematic_chars > 20:
+        if stats['problematic_chars'] > 20:
             score -= 15
             issues.append("Contains special characters that may confuse ATS systems")
 
         # Word count analysis
-        word_count = len(text.split())
+        word_count = stats['word_count']
         if word_count < 200:
             score -= 15
             issues.append("Resume too brief - expand with more relevant details")
@@ -329,16 +293,43 @@ class SmartResumeAnalyzer:
 
         return round(min(10.0, max(1.0, total_score)), 1)
 
-    def analyze_text(self, text):
-        """Main intelligent analysis function"""
+    def section_state(self, text):
+        """
+        Additive statistics of a piece of text
+
+        Incremental sessions (sessions.py) keep one state per resume section
+        and merge them; analyze_text on the merged state matches a full
+        analysis except for matches that span a section boundary. Lexicon
+        hits are kept per section type so skills are matched only in the
+        sections that list them. Writing statistics are not included:
+        sentences run across section boundaries, so analyze_text computes
+        them over the whole text.
+        """
+        segments = segment_resume(text)
+        return {
+            'hits': self.lexicon.scan_sections(text, segments.sections),
+            'achievements': self.detect_quantified_achievements(text),
+            'ats': self.ats_stats(text, segments),
+        }
+
+    def analyze_text(self, text, state=None):
+        """
+        Main intelligent analysis function
+
+        Args:
+            text: Resume text
+            state: Merged section_state() of the text, if already computed
+        """
         try:
             logger.info("🧠 Starting intelligent resume analysis")
 
-            # Core extractions
-            skills = self.extract_skills_intelligent(text)
-            verb_analysis = self.evaluate_action_verbs(text)
-            achievements = self.detect_quantified_achievements(text)
-            ats_score, ats_issues, sections_found = self.analyze_ats_compatibility(text)
+            # Core extractions; every lexicon term is matched in one pass over the sections
+            state = self.section_state(text) if state is None else state
+            hits = merge_hits(*state['hits'].values())
+            skills = self.extract_skills_intelligent(text, hits_for(state['hits'], SKILL_SECTIONS))
+            verb_analysis = self.evaluate_action_verbs(text, hits)
+            achievements = state['achievements']
+            ats_score, ats_issues, sections_found = self.analyze_ats_compatibility(text, state['ats'])
             writing_analysis = self.analyze_writing_quality(text)
 
             # Compile all issues
@@ -391,7 +382,7 @@ class SmartResumeAnalyzer:
                     'ats_compatibility_score': ats_score,
                     'sections_found': sections_found,
                     'writing_quality': writing_analysis['metrics'],
-                    'word_count': len(text.split()),
+                    'word_count': state['ats']['word_count'],
                     'character_count': len(text)
                 }
             }
@@ -1,20 +1,45 @@
 import os
+import sys
 import pandas as pd
 import numpy as np
-import PyPDF2
-import docx
 import requests
 import zipfile
 from pathlib import Path
 import json
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator
 import re
 from tqdm import tqdm
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data_processing.ingestion import ResumeIngestionEngine, extract_pdf_text, extract_docx_text
+from data_processing.deduplication import NearDuplicateDetector
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columnar datasets are memory-mapped on load; CSV is the fallback without pyarrow
+TRAINING_DATASET_FILE = 'training_dataset.feather' if PYARROW_AVAILABLE else 'training_dataset.csv'
+COLUMNAR_EXTENSIONS = ('.feather', '.arrow', '.parquet')
+
+# Column types of the Kaggle resume export (Resume.csv)
+KAGGLE_RESUME_DTYPES = {
+    'ID': 'int64',
+    'Resume_str': 'string',
+    'Resume_html': 'string',
+    'Category': 'category'
+}
+
 class ResumeDataLoader:
     """
     Handles loading and processing of resume datasets from various sources
@@ -29,6 +54,9 @@ class ResumeDataLoader:
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         
+        # Near-duplicate clusters found by the last combine_datasets call
+        self.duplicate_clusters = []
+        
     def download_kaggle_datasets(self):
         """
         Download resume datasets from Kaggle
@@ -205,15 +233,58 @@ University Name (2016-2020)
             logger.error(f"Error loading dataset: {e}")
             return pd.DataFrame()
     
+    def iter_real_resume_dataset(self, file_path: str, chunksize: int = 10000,
+                                 columns: Optional[List[str]] = None,
+                                 dtypes: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a real resume dataset in typed chunks
+        
+        Unlike load_real_resume_dataset the file is never fully materialized,
+        and read errors are raised rather than turned into an empty frame.
+        
+        Args:
+            file_path: CSV, JSON Lines (.jsonl), Parquet or Feather file
+            chunksize: Maximum rows per chunk
+            columns: Columns to read (all if None)
+            dtypes: Explicit column types, e.g. KAGGLE_RESUME_DTYPES
+            
+        Yields:
+            DataFrames of at most chunksize rows
+        """
+        logger.info(f"Streaming dataset from {file_path} in chunks of {chunksize}")
+        
+        def typed(chunk: pd.DataFrame) -> pd.DataFrame:
+            if columns is not None:
+                chunk = chunk[columns]
+            if dtypes:
+                chunk = chunk.astype({c: t for c, t in dtypes.items() if c in chunk.columns})
+            return chunk
+        
+        if file_path.endswith('.csv'):
+            csv_dtypes = {c: t for c, t in dtypes.items() if columns is None or c in columns} if dtypes else None
+            # usecols keeps file order, so chunks still go through typed()
+            for chunk in pd.read_csv(file_path, chunksize=chunksize, usecols=columns, dtype=csv_dtypes):
+                yield typed(chunk)
+        elif file_path.endswith('.jsonl'):
+            for chunk in pd.read_json(file_path, lines=True, chunksize=chunksize, dtype=False):
+                yield typed(chunk)
+        elif file_path.endswith(COLUMNAR_EXTENSIONS):
+            if not PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is required for columnar formats. Run: pip install pyarrow")
+            if file_path.endswith('.parquet'):
+                batches = pq.ParquetFile(file_path).iter_batches(batch_size=chunksize, columns=columns)
+            else:
+                table = feather.read_table(file_path, columns=columns, memory_map=True)
+                batches = table.to_batches(max_chunksize=chunksize)
+            for batch in batches:
+                yield typed(batch.to_pandas())
+        else:
+            raise ValueError("Unsupported format for chunked reading. Use CSV, JSON Lines, Parquet or Feather.")
+    
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF file"""
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            return extract_pdf_text(pdf_path)
         except Exception as e:
             logger.error(f"Error extracting from PDF {pdf_path}: {e}")
             return ""
@@ -221,11 +292,7 @@ University Name (2016-2020)
     def extract_text_from_docx(self, docx_path: str) -> str:
         """Extract text from DOCX file"""
         try:
-            doc = docx.Document(docx_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return extract_docx_text(docx_path)
         except Exception as e:
             logger.error(f"Error extracting from DOCX {docx_path}: {e}")
             return ""
@@ -252,9 +319,83 @@ University Name (2016-2020)
         
         return pd.DataFrame(resume_data)
     
-    def combine_datasets(self, datasets: List[pd.DataFrame]) -> pd.DataFrame:
+    def ingest_directory(self, input_dir: str, filename: str = 'ingested_resumes.csv',
+                         max_workers: Optional[int] = None, timeout: float = 30.0,
+                         memory_limit_mb: Optional[int] = 512, chunk_size: int = 500) -> Dict:
+        """
+        Ingest a directory tree of PDF and DOCX resumes in parallel
+        
+        Records are streamed into the processed dataset in chunks, so memory
+        use stays flat regardless of archive size.
+        
+        Args:
+            input_dir: Root directory to walk for resume files
+            filename: CSV file in the processed directory to write records to
+            max_workers: Number of extraction processes (defaults to CPU count)
+            timeout: Per-file extraction timeout in seconds
+            memory_limit_mb: Per-worker memory cap for a single extraction
+            chunk_size: Number of records buffered before each write
+            
+        Returns:
+            Ingestion summary with counts, failures and the output path
+        """
+        engine = ResumeIngestionEngine(
+            max_workers=max_workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb
+        )
+        save_path = self.processed_dir / filename
+        columns = ['resume_id', 'resume_text', 'file_path', 'file_type', 'word_count']
+        
+        buffer = []
+        failures = []
+        written = 0
+        header = True
+        
+        def flush():
+            nonlocal header, written
+            pd.DataFrame(buffer, columns=columns).to_csv(
+                save_path, mode='w' if header else 'a', header=header, index=False
+            )
+            header = False
+            written += len(buffer)
+            buffer.clear()
+        
+        for record in tqdm(engine.iter_records(input_dir)):
+            if record['status'] == 'ok':
+                buffer.append({column: record[column] for column in columns})
+                if len(buffer) >= chunk_size:
+                    flush()
+            else:
+                failures.append({
+                    'file_path': record['file_path'],
+                    'status': record['status'],
+                    'error': record['error']
+                })
+        
+        if buffer or header:
+            flush()
+        
+        if failures:
+            logger.warning(f"{len(failures)} files could not be ingested")
+        logger.info(f"Ingested {written} resumes into {save_path}")
+        
+        return {
+            'processed': written,
+            'failed': len(failures),
+            'failures': failures,
+            'output_path': str(save_path)
+        }
+    
+    def combine_datasets(self, datasets: List[pd.DataFrame],
+                         near_duplicate_threshold: Optional[float] = None) -> pd.DataFrame:
         """
         Combine multiple resume datasets
+        
+        Args:
+            datasets: Datasets to combine
+            near_duplicate_threshold: If set, also drop resumes whose estimated
+                Jaccard similarity to an earlier resume is at least this value
         """
         logger.info(f"Combining {len(datasets)} datasets...")
         
@@ -263,23 +404,110 @@ University Name (2016-2020)
         # Remove duplicates based on resume text
         combined_df = combined_df.drop_duplicates(subset=['resume_text'], keep='first')
         
+        if near_duplicate_threshold is not None:
+            combined_df = self.remove_near_duplicates(combined_df, near_duplicate_threshold)
+        
         logger.info(f"Combined dataset has {len(combined_df)} unique resumes")
         return combined_df
     
+    def remove_near_duplicates(self, df: pd.DataFrame, threshold: float = 0.85) -> pd.DataFrame:
+        """
+        Drop near-duplicate resumes, keeping the first of each cluster
+        
+        The clusters found are stored in self.duplicate_clusters.
+        """
+        detector = NearDuplicateDetector(threshold=threshold)
+        clusters = detector.find_clusters(df['resume_text'].astype(str).tolist())
+        
+        if 'resume_id' in df.columns:
+            ids = df['resume_id'].tolist()
+        else:
+            ids = df.index.tolist()
+        self.duplicate_clusters = detector.cluster_report(clusters, ids)
+        
+        drop_positions = [i for members in clusters for i in members[1:]]
+        logger.info(
+            f"Found {len(clusters)} near-duplicate clusters, "
+            f"dropping {len(drop_positions)} resumes (threshold={threshold})"
+        )
+        
+        keep_mask = np.ones(len(df), dtype=bool)
+        keep_mask[drop_positions] = False
+        return df[keep_mask].reset_index(drop=True)
+    
     def save_processed_data(self, df: pd.DataFrame, filename: str):
-        """Save processed data to file"""
+        """
+        Save processed data to file
+        
+        Feather/Arrow files are written uncompressed so they can be memory-mapped
+        on load. Nested columns such as 'suggestions' are stored natively.
+        """
         save_path = self.processed_dir / filename
         
-        if filename.endswith('.csv'):
+        if filename.endswith(COLUMNAR_EXTENSIONS):
+            if not PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is required for columnar formats. Run: pip install pyarrow")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if filename.endswith('.parquet'):
+                pq.write_table(table, save_path)
+            else:
+                feather.write_feather(table, save_path, compression='uncompressed')
+        elif filename.endswith('.csv'):
             df.to_csv(save_path, index=False)
         elif filename.endswith('.json'):
             df.to_json(save_path, orient='records', indent=2)
         
         logger.info(f"Saved processed data to {save_path}")
     
-    def create_training_dataset(self) -> pd.DataFrame:
+    def load_processed_data(self, filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load processed data, reading only the requested columns
+        
+        Args:
+            filename: File in the processed directory
+            columns: Columns to read (all if None); columns missing from the
+                file are ignored
+            
+        Returns:
+            DataFrame with the projected columns
+        """
+        load_path = self.processed_dir / filename
+        
+        if filename.endswith(COLUMNAR_EXTENSIONS):
+            if not PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is required for columnar formats. Run: pip install pyarrow")
+            if filename.endswith('.parquet'):
+                schema_names = pq.read_schema(load_path).names
+                if columns is not None:
+                    columns = [c for c in columns if c in schema_names]
+                table = pq.read_table(load_path, columns=columns, memory_map=True)
+            else:
+                if columns is not None:
+                    with pa.memory_map(str(load_path)) as source:
+                        schema_names = pa.ipc.open_file(source).schema.names
+                    columns = [c for c in columns if c in schema_names]
+                # Uncompressed IPC files are mapped, not copied, into memory,
+                # and only the projected columns are read
+                table = feather.read_table(load_path, columns=columns, memory_map=True)
+            return table.to_pandas(split_blocks=True)
+        
+        if filename.endswith('.csv'):
+            usecols = (lambda c: c in columns) if columns is not None else None
+            return pd.read_csv(load_path, usecols=usecols)
+        
+        if filename.endswith('.json'):
+            df = pd.read_json(load_path)
+            return df[[c for c in columns if c in df.columns]] if columns is not None else df
+        
+        raise ValueError("Unsupported file format. Use Feather, Parquet, CSV or JSON.")
+    
+    def create_training_dataset(self, near_duplicate_threshold: Optional[float] = None) -> pd.DataFrame:
         """
         Create complete training dataset by combining all sources
+        
+        Args:
+            near_duplicate_threshold: Passed to combine_datasets (None keeps
+                near-duplicates and drops exact duplicates only)
         """
         logger.info("Creating comprehensive training dataset...")
         
@@ -300,10 +528,10 @@ University Name (2016-2020)
         
         # 3. Combine all datasets
         if datasets:
-            final_df = self.combine_datasets(datasets)
+            final_df = self.combine_datasets(datasets, near_duplicate_threshold)
             
             # Save the training dataset
-            self.save_processed_data(final_df, 'training_dataset.csv')
+            self.save_processed_data(final_df, TRAINING_DATASET_FILE)
             
             return final_df
         
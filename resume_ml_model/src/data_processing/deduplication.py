@@ -0,0 +1,161 @@
+import re
+import zlib
+import logging
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Largest prime below 2**32: keeps a * x + b inside uint64 for 32-bit hashes
+_HASH_PRIME = np.uint64(4294967291)
+
+
+def _area(y: np.ndarray, x: np.ndarray) -> float:
+    """Trapezoidal integral of y over x"""
+    if len(x) < 2:
+        return 0.0
+    return float(np.sum((y[1:] + y[:-1]) / 2 * np.diff(x)))
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose LSH bands and rows per band for a Jaccard threshold
+
+    Minimizes the sum of false positive and false negative probability mass
+    of the banding S-curve, as in Leskovec et al., "Mining of Massive Datasets".
+    """
+    grid = np.linspace(0.0, 1.0, 201)
+    best, best_error = (1, num_perm), float('inf')
+
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        if rows == 0:
+            break
+        prob = 1 - (1 - grid ** rows) ** bands
+        below = grid < threshold
+        false_positive = _area(prob[below], grid[below])
+        false_negative = _area(1 - prob[~below], grid[~below])
+        error = false_positive + false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Find near-duplicate resumes with word shingling, MinHash and LSH banding.
+
+    Runs in roughly linear time: every document is hashed once and only
+    documents sharing an LSH bucket are compared.
+    """
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 128,
+                 shingle_size: int = 5, seed: int = 42):
+        """
+        Initialize the detector
+
+        Args:
+            threshold: Estimated Jaccard similarity at which two resumes are duplicates
+            num_perm: Number of MinHash permutations per signature
+            shingle_size: Number of words per shingle
+            seed: Seed for the hash permutations
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_HASH_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_HASH_PRIME), size=num_perm, dtype=np.uint64)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """Hash the normalized word shingles of a document"""
+        words = re.sub(r'\s+', ' ', str(text).lower()).strip().split(' ')
+        k = self.shingle_size
+        if len(words) <= k:
+            shingles = {' '.join(words)}
+        else:
+            shingles = {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+        return np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of one document"""
+        hashes = self._shingle_hashes(text)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _HASH_PRIME
+        return permuted.min(axis=1)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """Compute MinHash signatures for a corpus, one row per document"""
+        signatures = np.empty((len(texts), self.num_perm), dtype=np.uint64)
+        for i, text in enumerate(texts):
+            signatures[i] = self.signature(text)
+        return signatures
+
+    def find_clusters(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group near-duplicate documents
+
+        Args:
+            texts: Documents to compare
+
+        Returns:
+            Clusters of positional indices (size >= 2), each sorted so the
+            first index is the earliest occurrence
+        """
+        signatures = self.signatures(texts)
+        parent = list(range(len(texts)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.bands):
+            band_slice = signatures[:, band * self.rows:(band + 1) * self.rows]
+            buckets = defaultdict(list)
+            for i, row in enumerate(band_slice):
+                buckets[row.tobytes()].append(i)
+
+            # Every pair sharing a bucket is a candidate; checking only against
+            # the first member would miss pairs whose first member is dissimilar
+            for members in buckets.values():
+                for pos, a in enumerate(members):
+                    for b in members[pos + 1:]:
+                        root_a, root_b = find(a), find(b)
+                        if root_a == root_b:
+                            continue
+                        similarity = np.mean(signatures[a] == signatures[b])
+                        if similarity >= self.threshold:
+                            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        clusters = defaultdict(list)
+        for i in range(len(texts)):
+            clusters[find(i)].append(i)
+
+        return sorted(
+            (members for members in clusters.values() if len(members) > 1),
+            key=lambda members: members[0]
+        )
+
+    def cluster_report(self, clusters: List[List[int]], ids: List) -> List[Dict]:
+        """Describe clusters by document id, keeping the earliest member"""
+        return [
+            {
+                'kept': ids[members[0]],
+                'duplicates': [ids[i] for i in members[1:]],
+                'size': len(members)
+            }
+            for members in clusters
+        ]
@@ -1,7 +1,8 @@
 import re
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from scipy import sparse
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize, sent_tokenize
@@ -10,10 +11,27 @@ from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from collections import Counter
 import textstat
 import logging
+import time
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lexicon.automaton import group_hits, merge_hits, hits_for
+from data_processing.preprocessing import segment_resume, SegmentedResume, SKILL_SECTIONS
+from lexicon.terms import get_lexicon, LEXICONS, FEATURE_SECTIONS
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Extractor groups in extract_all_features order; each maps to extract_<group>_features
+FEATURE_GROUPS = [
+    'basic', 'content_quality', 'skills', 'structure',
+    'keyword', 'experience', 'education'
+]
+
 class ResumeFeatureExtractor:
     """
     Extract comprehensive features from resume text for ML model training
@@ -24,6 +42,8 @@ class ResumeFeatureExtractor:
         self.initialize_keywords()
         self.tfidf_vectorizer = None
         self.count_vectorizer = None
+        self._group_outputs = None
+        self.group_timings = {}
         
     def download_nltk_data(self):
         """Download required NLTK data"""
@@ -45,67 +65,48 @@ class ResumeFeatureExtractor:
     def initialize_keywords(self):
         """Initialize keyword dictionaries for feature extraction"""
         
-        # Technical skills by category
-        self.technical_skills = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 
-                'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl'
-            ],
-            'web_technologies': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 
-                'django', 'flask', 'spring', 'bootstrap', 'jquery'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 
-                'cassandra', 'oracle', 'sqlite', 'dynamodb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean'
-            ],
-            'devops_tools': [
-                'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 
-                'git', 'github', 'gitlab', 'ci/cd'
-            ],
-            'data_science': [
-                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 
-                'pandas', 'numpy', 'scikit-learn', 'keras', 'spark'
-            ]
-        }
-        
-        # Soft skills
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'collaboration', 
-            'problem solving', 'analytical', 'creative', 'organized',
-            'detail-oriented', 'self-motivated', 'adaptable', 'innovative'
-        ]
-        
-        # Action verbs (power words)
-        self.action_verbs = [
-            'achieved', 'accomplished', 'implemented', 'developed', 'created',
-            'managed', 'led', 'improved', 'increased', 'decreased', 'optimized',
-            'designed', 'built', 'launched', 'delivered', 'executed', 'drove',
-            'spearheaded', 'streamlined', 'collaborated', 'mentored'
-        ]
-        
-        # Resume sections
-        self.section_keywords = {
-            'contact': ['email', 'phone', 'address', 'linkedin', 'github'],
-            'summary': ['summary', 'objective', 'profile', 'about'],
-            'experience': ['experience', 'work', 'employment', 'career'],
-            'education': ['education', 'degree', 'university', 'college'],
-            'skills': ['skills', 'technical', 'competencies'],
-            'projects': ['projects', 'portfolio'],
-            'certifications': ['certifications', 'certificates', 'licenses']
-        }
-        
-        # Industry keywords
-        self.industry_keywords = {
-            'technology': ['software', 'programming', 'development', 'coding', 'tech'],
-            'marketing': ['marketing', 'advertising', 'branding', 'campaigns'],
-            'finance': ['finance', 'accounting', 'investment', 'banking'],
-            'healthcare': ['healthcare', 'medical', 'clinical', 'patient'],
-            'education': ['teaching', 'curriculum', 'student', 'academic']
-        }
+        # Term sets live in the shared lexicon, compiled once per process
+        terms = LEXICONS['features']
+        self.technical_skills = terms['tech']
+        self.soft_skills = terms['soft']
+        self.action_verbs = terms['verbs']
+        self.sections = FEATURE_SECTIONS
+        self.industry_keywords = terms['industry']
+        self.lexicon = get_lexicon('features')
+        # Per thread, so extractors shared by server threads never read another text's scan
+        self._last_scan = threading.local()
+    
+    def _scan(self, text: str):
+        """
+        Segment and scan a text, keeping the result for the last text
+        
+        Extracting every group for a resume therefore segments and scans it once.
+        The result is kept per thread and read from the same tuple it is
+        checked against.
+        """
+        scan = getattr(self._last_scan, 'value', None)
+        if scan is None or scan[0] is not text:
+            segments = segment_resume(text)
+            section_hits = self.lexicon.scan_sections(text, segments.sections)
+            scan = (text, segments, section_hits, merge_hits(*section_hits.values()))
+            self._last_scan.value = scan
+        return scan
+    
+    def segments(self, text: str) -> SegmentedResume:
+        """Section spans of a text, shared by the extractor groups"""
+        return self._scan(text)[1]
+    
+    def lexicon_hits(self, text: str, sections: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Lexicon matches for a text, shared by the extractor groups
+        
+        Args:
+            text: Resume text
+            sections: Only count matches in these section types (the whole
+                text if it has none of them)
+        """
+        _, _, section_hits, hits = self._scan(text)
+        return hits if sections is None else hits_for(section_hits, sections)
     
     def extract_basic_features(self, text: str) -> Dict:
         """Extract basic text statistics"""
@@ -138,11 +139,12 @@ class ResumeFeatureExtractor:
         
         text_lower = text.lower()
         words = word_tokenize(text_lower)
+        action_verb_count = len(self.lexicon_hits(text).get('verbs', {}))
         
         features = {
             # Action verbs
-            'action_verb_count': sum(1 for verb in self.action_verbs if verb in text_lower),
-            'action_verb_ratio': sum(1 for verb in self.action_verbs if verb in text_lower) / len(words) if words else 0,
+            'action_verb_count': action_verb_count,
+            'action_verb_ratio': action_verb_count / len(words) if words else 0,
             
             # Quantified achievements
             'number_count': len(re.findall(r'\d+', text)),
@@ -165,19 +167,20 @@ class ResumeFeatureExtractor:
     def extract_skills_features(self, text: str) -> Dict:
         """Extract skills-related features"""
         
-        text_lower = text.lower()
+        hits = self.lexicon_hits(text, SKILL_SECTIONS)
+        tech_hits = group_hits(hits, 'tech')
         
         # Count technical skills by category
         tech_skill_counts = {}
         total_tech_skills = 0
         
-        for category, skills in self.technical_skills.items():
-            count = sum(1 for skill in skills if skill in text_lower)
+        for category in self.technical_skills:
+            count = len(tech_hits.get(category, {}))
             tech_skill_counts[f'tech_skills_{category}'] = count
             total_tech_skills += count
         
         # Count soft skills
-        soft_skill_count = sum(1 for skill in self.soft_skills if skill in text_lower)
+        soft_skill_count = len(hits.get('soft', {}))
         
         features = {
             'total_technical_skills': total_tech_skills,
@@ -191,20 +194,27 @@ class ResumeFeatureExtractor:
     def extract_structure_features(self, text: str) -> Dict:
         """Extract resume structure-related features"""
         
-        text_lower = text.lower()
-        
-        # Check for required sections
-        sections_present = {}
-        for section, keywords in self.section_keywords.items():
-            sections_present[f'has_{section}_section'] = any(keyword in text_lower for keyword in keywords)
+        segments = self.segments(text)
         
         # Contact information
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
+        has_email = bool(re.search(email_pattern, text))
+        has_phone = bool(re.search(phone_pattern, text))
+        
+        # Check for required sections; any text before the first heading is
+        # typed 'contact', so contact details decide that one
+        sections_present = {}
+        for section in self.sections:
+            sections_present[f'has_{section}_section'] = segments.has(section)
+        sections_present['has_contact_section'] = (
+            has_email or has_phone or bool(re.search(linkedin_pattern, text, re.IGNORECASE))
+        )
         
         features = {
-            'has_email': bool(re.search(email_pattern, text)),
-            'has_phone': bool(re.search(phone_pattern, text)),
+            'has_email': has_email,
+            'has_phone': has_phone,
             'section_count': sum(sections_present.values()),
             'completeness_score': sum(sections_present.values()) / len(sections_present),
             **sections_present
@@ -215,14 +225,13 @@ class ResumeFeatureExtractor:
     def extract_keyword_features(self, text: str) -> Dict:
         """Extract keyword-related features for ATS optimization"""
         
-        text_lower = text.lower()
-        words = word_tokenize(text_lower)
+        words = word_tokenize(text.lower())
+        industry_hits = group_hits(self.lexicon_hits(text), 'industry')
         
         # Industry keyword counts
         industry_counts = {}
-        for industry, keywords in self.industry_keywords.items():
-            count = sum(1 for keyword in keywords if keyword in text_lower)
-            industry_counts[f'industry_{industry}_keywords'] = count
+        for industry in self.industry_keywords:
+            industry_counts[f'industry_{industry}_keywords'] = len(industry_hits.get(industry, {}))
         
         # Keyword density
         total_keywords = sum(industry_counts.values())
@@ -244,17 +253,13 @@ class ResumeFeatureExtractor:
         years_mentioned = len(set(year_matches))
         
         # Experience indicators
-        experience_indicators = [
-            'years of experience', 'years experience', 'experience in',
-            'worked at', 'employed at', 'position at'
-        ]
-        
-        experience_mentions = sum(1 for indicator in experience_indicators if indicator in text.lower())
+        experience_hits = group_hits(self.lexicon_hits(text), 'experience')
+        experience_mentions = len(experience_hits.get('indicators', {}))
         
         features = {
             'years_mentioned': years_mentioned,
             'experience_mentions': experience_mentions,
-            'has_work_history': any(keyword in text.lower() for keyword in ['work', 'employment', 'job', 'position']),
+            'has_work_history': 'work_history' in experience_hits,
             'job_titles_count': len(re.findall(r'(engineer|manager|developer|analyst|specialist|coordinator|director)', text.lower()))
         }
         
@@ -263,21 +268,17 @@ class ResumeFeatureExtractor:
     def extract_education_features(self, text: str) -> Dict:
         """Extract education-related features"""
         
-        text_lower = text.lower()
-        
-        # Degree types
-        degree_types = ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'diploma']
-        degree_count = sum(1 for degree in degree_types if degree in text_lower)
+        education_hits = group_hits(self.lexicon_hits(text, ['education']), 'education')
         
-        # Education institutions
-        education_keywords = ['university', 'college', 'institute', 'school']
-        institution_count = sum(1 for keyword in education_keywords if keyword in text_lower)
+        # Degree types and education institutions
+        degree_count = len(education_hits.get('degrees', {}))
+        institution_count = len(education_hits.get('institutions', {}))
         
         features = {
             'degree_count': degree_count,
             'institution_count': institution_count,
-            'has_education': any(keyword in text_lower for keyword in education_keywords + degree_types),
-            'has_gpa': 'gpa' in text_lower,
+            'has_education': degree_count + institution_count > 0,
+            'has_gpa': 'gpa' in education_hits,
         }
         
         return features
@@ -288,18 +289,68 @@ class ResumeFeatureExtractor:
         all_features = {}
         
         # Extract different types of features
-        all_features.update(self.extract_basic_features(text))
-        all_features.update(self.extract_content_quality_features(text))
-        all_features.update(self.extract_skills_features(text))
-        all_features.update(self.extract_structure_features(text))
-        all_features.update(self.extract_keyword_features(text))
-        all_features.update(self.extract_experience_features(text))
-        all_features.update(self.extract_education_features(text))
+        for group in FEATURE_GROUPS:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            all_features.update(getattr(self, f'extract_{group}_features')(text))
+            self._record_timing(group, wall_start, cpu_start)
         
         return all_features
     
-    def create_tfidf_features(self, texts: List[str], max_features: int = 1000) -> np.ndarray:
-        """Create TF-IDF features from resume texts"""
+    def _record_timing(self, name: str, wall_start: float, cpu_start: float):
+        """Accumulate wall/CPU time spent in an extractor group"""
+        timing = self.group_timings.setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0, 'calls': 0})
+        timing['wall_s'] += time.perf_counter() - wall_start
+        timing['cpu_s'] += time.process_time() - cpu_start
+        timing['calls'] += 1
+    
+    def pop_group_timings(self) -> Dict[str, Dict]:
+        """Return the accumulated per-group timings and reset them"""
+        timings, self.group_timings = self.group_timings, {}
+        return timings
+    
+    def feature_group_outputs(self) -> Dict[str, List[str]]:
+        """Feature names produced by each extractor group"""
+        if self._group_outputs is None:
+            sample_text = "Sample resume text with experience at company. Skills include Python and machine learning."
+            self._group_outputs = {
+                group: list(getattr(self, f'extract_{group}_features')(sample_text))
+                for group in FEATURE_GROUPS
+            }
+        return self._group_outputs
+    
+    def extract_selected_features(self, text: str, feature_names: List[str]) -> Dict:
+        """
+        Extract only the given features from resume text
+        
+        Extractor groups with none of their outputs selected are skipped
+        entirely, and TF-IDF is only computed when a tfidf_ column is selected
+        (and a fitted vectorizer is available).
+        
+        Args:
+            text: Resume text
+            feature_names: Features the model uses, e.g. ResumeScorer.feature_names
+            
+        Returns:
+            Dictionary with the selected features that could be computed
+        """
+        selected = set(feature_names)
+        features = {}
+        
+        for group, outputs in self.feature_group_outputs().items():
+            if selected.intersection(outputs):
+                group_features = getattr(self, f'extract_{group}_features')(text)
+                features.update({name: value for name, value in group_features.items() if name in selected})
+        
+        tfidf_columns = [name for name in feature_names if name.startswith('tfidf_')]
+        if tfidf_columns and self.tfidf_vectorizer is not None:
+            indices = [int(name[len('tfidf_'):]) for name in tfidf_columns]
+            row = self.tfidf_vectorizer.transform([text])[:, indices].toarray()[0]
+            features.update(zip(tfidf_columns, row))
+        
+        return features
+    
+    def create_tfidf_features(self, texts: List[str], max_features: int = 1000) -> sparse.csr_matrix:
+        """Create TF-IDF features from resume texts, as a sparse CSR matrix"""
         
         if self.tfidf_vectorizer is None:
             self.tfidf_vectorizer = TfidfVectorizer(
@@ -313,7 +364,7 @@ class ResumeFeatureExtractor:
         else:
             tfidf_features = self.tfidf_vectorizer.transform(texts)
         
-        return tfidf_features.toarray()
+        return tfidf_features
     
     def process_dataset(self, df: pd.DataFrame, text_column: str = 'resume_text') -> pd.DataFrame:
         """Process entire dataset and extract features for all resumes"""
@@ -333,13 +384,17 @@ class ResumeFeatureExtractor:
         
         # Create TF-IDF features
         logger.info("Creating TF-IDF features...")
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
         tfidf_features = self.create_tfidf_features(df[text_column].tolist())
+        self._record_timing('tfidf', wall_start, cpu_start)
         
-        # Add TF-IDF features to DataFrame
-        tfidf_df = pd.DataFrame(
-            tfidf_features, 
+        # Add TF-IDF features to DataFrame as sparse columns, so the matrix is
+        # never densified (sparse backends take it back as CSR, see
+        # ResumeScorer.prepare_features); fillna makes the implicit entries 0
+        tfidf_df = pd.DataFrame.sparse.from_spmatrix(
+            tfidf_features,
             columns=[f'tfidf_{i}' for i in range(tfidf_features.shape[1])]
-        )
+        ).fillna(0.0)
         
         # Combine all features
         final_features_df = pd.concat([features_df, tfidf_df], axis=1)
@@ -348,6 +403,22 @@ class ResumeFeatureExtractor:
         
         return final_features_df
     
+    def iter_process_dataset(self, chunks: Iterable[pd.DataFrame],
+                             text_column: str = 'resume_text') -> Iterator[pd.DataFrame]:
+        """
+        Extract features chunk by chunk without materializing the full dataset
+        
+        The TF-IDF vectorizer must already be fitted (or loaded), since it
+        cannot be fitted on a stream.
+        """
+        if self.tfidf_vectorizer is None:
+            raise ValueError("TF-IDF vectorizer must be fitted or loaded before processing chunks")
+        
+        for chunk in chunks:
+            chunk = chunk.copy()
+            chunk[text_column] = chunk[text_column].fillna('').astype(str)
+            yield self.process_dataset(chunk, text_column=text_column)
+    
     def get_feature_names(self) -> List[str]:
         """Get list of all feature names"""
         
@@ -364,18 +435,18 @@ class ResumeFeatureExtractor:
         return feature_names
     
     def save_vectorizers(self, filepath: str):
-        """Save trained vectorizers"""
-        import joblib
-        joblib.dump({
+        """Save trained vectorizers as a memory-mappable, checksummed artifact"""
+        from utils.artifacts import save_artifact
+        save_artifact({
             'tfidf_vectorizer': self.tfidf_vectorizer,
             'count_vectorizer': self.count_vectorizer
         }, filepath)
         logger.info(f"Vectorizers saved to {filepath}")
     
-    def load_vectorizers(self, filepath: str):
-        """Load trained vectorizers"""
-        import joblib
-        vectorizers = joblib.load(filepath)
+    def load_vectorizers(self, filepath: str, mmap: bool = True):
+        """Load trained vectorizers, memory-mapping the IDF vectors"""
+        from utils.artifacts import load_artifact
+        vectorizers = load_artifact(filepath, mmap=mmap)
         self.tfidf_vectorizer = vectorizers['tfidf_vectorizer']
         self.count_vectorizer = vectorizers['count_vectorizer']
         logger.info(f"Vectorizers loaded from {filepath}")
@@ -0,0 +1,303 @@
+import os
+import time
+import signal
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import PyPDF2
+import docx
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside a worker when a single file exceeds its time budget"""
+
+
+# Set in each pool worker; the worker reports (file_path, pid, start time) here
+# before extracting, so the parent can kill it if the file hangs
+_started_queue = None
+
+
+def extract_pdf_text(pdf_path: str) -> str:
+    """Extract text from a PDF file, raising on failure"""
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        text = ""
+        for page in pdf_reader.pages:
+            text += (page.extract_text() or "") + "\n"
+        return text.strip()
+
+
+def extract_docx_text(docx_path: str) -> str:
+    """Extract text from a DOCX file, raising on failure"""
+    doc = docx.Document(docx_path)
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    return text.strip()
+
+
+def extract_text(file_path: str) -> str:
+    """Extract text from any supported resume file based on its extension"""
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.pdf':
+        return extract_pdf_text(file_path)
+    if suffix == '.docx':
+        return extract_docx_text(file_path)
+    raise ValueError(f"Unsupported file type: {suffix}")
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+
+def _current_address_space() -> int:
+    """Current virtual memory size of this process in bytes (0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _init_worker(memory_limit_mb: Optional[int], started_queue=None):
+    """
+    Install the timeout handler and memory cap in each pool worker
+
+    RLIMIT_AS is set once, so it caps the worker's address space for its
+    whole lifetime rather than per file. Freed memory is reused across
+    files, so in practice it bounds the largest single extraction plus
+    fragmentation; a worker that hits it fails that file with
+    'memory_limit' and later files in the same worker may fail the same way
+    until the pool is restarted.
+    """
+    global _started_queue
+    _started_queue = started_queue
+
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+    if memory_limit_mb and resource is not None:
+        # The cap is relative to what the worker already maps after start-up,
+        # so it bounds what extractions can allocate on top of that.
+        limit = _current_address_space() + memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not apply memory limit in worker: {e}")
+
+
+def _extract_worker(file_path: str, timeout: Optional[float]) -> Dict:
+    """Extract a single file inside a pool worker and report its status"""
+    record = {
+        'resume_id': Path(file_path).stem,
+        'resume_text': '',
+        'file_path': file_path,
+        'file_type': Path(file_path).suffix.lower().lstrip('.'),
+        'word_count': 0,
+        'status': 'ok',
+        'error': None
+    }
+
+    if _started_queue is not None:
+        _started_queue.put((file_path, os.getpid(), time.monotonic()))
+
+    # SIGALRM only fires between Python bytecodes; a hang inside C code is
+    # caught by the parent's deadline instead (ResumeIngestionEngine.kill_grace)
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        text = extract_text(file_path)
+        record['resume_text'] = text
+        record['word_count'] = len(text.split())
+        if not text:
+            record['status'] = 'empty'
+    except ExtractionTimeout:
+        record['status'] = 'timeout'
+        record['error'] = f"Extraction exceeded {timeout}s"
+    except MemoryError:
+        record['status'] = 'memory_limit'
+        record['error'] = "Extraction exceeded the worker memory limit"
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return record
+
+
+class ResumeIngestionEngine:
+    """
+    Parallel text extraction for directory trees of PDF and DOCX resumes.
+
+    Each file is extracted in a worker process with a per-file timeout and
+    memory cap, so a single malformed file cannot stall or exhaust the batch.
+    The timeout is enforced twice: by SIGALRM inside the worker, and by the
+    parent, which kills a worker still busy with a file kill_grace seconds
+    after its timeout (a hang inside C code never returns to the interpreter).
+    Records are yielded as they complete rather than collected in memory.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: float = 30.0,
+                 memory_limit_mb: Optional[int] = 512, max_in_flight: Optional[int] = None,
+                 max_retries: int = 1, kill_grace: float = 5.0):
+        """
+        Initialize the ingestion engine
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            timeout: Per-file extraction timeout in seconds
+            memory_limit_mb: Per-worker memory cap for a single extraction
+            max_in_flight: Maximum files submitted but not yet completed
+            max_retries: Times a file is resubmitted after a worker crash
+            kill_grace: Seconds past the timeout before the parent kills a hung worker
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_in_flight = max_in_flight or self.max_workers * 4
+        self.max_retries = max_retries
+        self.kill_grace = kill_grace
+        self._mp_context = multiprocessing.get_context()
+
+    def discover_files(self, root_dir: str) -> List[Path]:
+        """Recursively find all supported resume files under a directory"""
+        root = Path(root_dir)
+        return sorted(
+            path for path in root.rglob('*')
+            if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+        )
+
+    def _create_pool(self):
+        """
+        New worker pool and the queue its workers report started files on
+
+        A fresh queue per pool: a worker killed mid-write could leave the
+        old one locked.
+        """
+        started_queue = self._mp_context.SimpleQueue()
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self.memory_limit_mb, started_queue)
+        )
+        return pool, started_queue
+
+    def _kill_hung_workers(self, started: Dict[str, tuple], killed: set):
+        """Kill workers whose current file has run past timeout + kill_grace"""
+        deadline = self.timeout + self.kill_grace
+        now = time.monotonic()
+        for file_path, (pid, start) in list(started.items()):
+            if file_path not in killed and now - start > deadline:
+                logger.warning(f"Killing worker {pid}: {file_path} still running after {deadline:.0f}s")
+                try:
+                    os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+                except OSError:
+                    pass
+                killed.add(file_path)
+
+    def _timeout_record(self, file_path: str) -> Dict:
+        record = self._crash_record(file_path)
+        record['status'] = 'timeout'
+        record['error'] = f"Extraction exceeded {self.timeout}s; worker killed"
+        return record
+
+    def iter_records(self, root_dir: str) -> Iterator[Dict]:
+        """
+        Extract every supported file under a directory tree
+
+        Yields:
+            One record per file, in completion order, including failures
+            (see the 'status' and 'error' fields)
+        """
+        files = self.discover_files(root_dir)
+        logger.info(f"Ingesting {len(files)} resume files with {self.max_workers} workers...")
+
+        pending = [(str(path), 0) for path in reversed(files)]
+        in_flight = {}
+        # File -> (worker pid, start time) for files a worker has started
+        started = {}
+        # Files whose worker the parent killed; they fail as timeouts, not crashes
+        killed = set()
+        pool, started_queue = self._create_pool()
+
+        def lost_record(file_path, attempts):
+            """Requeue a file lost with a broken pool, or give up on it"""
+            if file_path in killed:
+                return self._timeout_record(file_path)
+            if attempts < self.max_retries:
+                pending.append((file_path, attempts + 1))
+                return None
+            return self._crash_record(file_path)
+
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.max_in_flight:
+                    file_path, attempts = pending.pop()
+                    future = pool.submit(_extract_worker, file_path, self.timeout)
+                    in_flight[future] = (file_path, attempts)
+
+                # Wake up at least once a second to enforce the parent-side deadline
+                done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+
+                while not started_queue.empty():
+                    file_path, pid, start = started_queue.get()
+                    started[file_path] = (pid, start)
+                if self.timeout:
+                    self._kill_hung_workers(started, killed)
+
+                broken = False
+                for future in done:
+                    file_path, attempts = in_flight.pop(future)
+                    started.pop(file_path, None)
+                    try:
+                        yield future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        record = lost_record(file_path, attempts)
+                        if record:
+                            yield record
+
+                if broken:
+                    # A worker died (killed by us or by the OS); every other
+                    # in-flight file is lost with the pool, so requeue them.
+                    logger.warning("Worker process crashed, restarting pool...")
+                    for file_path, attempts in in_flight.values():
+                        record = lost_record(file_path, attempts)
+                        if record:
+                            yield record
+                    in_flight.clear()
+                    started.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool, started_queue = self._create_pool()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _crash_record(self, file_path: str) -> Dict:
+        return {
+            'resume_id': Path(file_path).stem,
+            'resume_text': '',
+            'file_path': file_path,
+            'file_type': Path(file_path).suffix.lower().lstrip('.'),
+            'word_count': 0,
+            'status': 'crashed',
+            'error': "Worker process crashed during extraction"
+        }
@@ -1 +1,171 @@
- 
\ No newline at end of file
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Set
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Typed section spans; text before the first heading is 'contact'
+SECTION_TYPES = [
+    'contact', 'summary', 'experience', 'education', 'skills',
+    'projects', 'certifications', 'achievements', 'other'
+]
+
+# Sections whose text is searched for skills; see SegmentedResume.text_of
+SKILL_SECTIONS = ('skills', 'experience', 'projects')
+
+# Heading phrases for each section type (matched case-insensitively)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    'contact': [
+        'contact', 'contact information', 'contact info', 'contact details',
+        'personal information', 'personal details'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'executive summary',
+        'profile', 'professional profile', 'objective', 'career objective', 'about', 'about me'
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history', 'internships'
+    ],
+    'education': [
+        'education', 'academic background', 'academics', 'education and training',
+        'qualifications', 'academic qualifications'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'core skills', 'key skills', 'skills summary',
+        'core competencies', 'competencies', 'expertise', 'areas of expertise',
+        'technologies', 'tools', 'proficiencies', 'technical proficiencies'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects', 'portfolio'
+    ],
+    'certifications': [
+        'certifications', 'certification', 'certificates', 'licenses', 'credentials',
+        'licenses and certifications', 'licenses & certifications', 'certifications and licenses'
+    ],
+    'achievements': [
+        'achievements', 'accomplishments', 'awards', 'honors', 'honors and awards',
+        'awards and honors', 'awards & honors'
+    ],
+    # Recognised so their text is not attributed to the section above them
+    'other': [
+        'languages', 'interests', 'hobbies', 'volunteer', 'volunteering', 'volunteer experience',
+        'references', 'publications', 'activities', 'extracurricular activities'
+    ]
+}
+
+# Typed heading phrases that are also common labels inside a section
+# ('- Tools: Airflow, Spark' under experience, 'Experience: 10 years' in a
+# summary); they are headings only on a line of their own
+BODY_LABELS = {'experience', 'profile', 'about', 'tools', 'technologies', 'expertise', 'portfolio'}
+
+_HEADING_TYPES = {
+    phrase: section_type
+    for section_type, phrases in SECTION_HEADINGS.items()
+    for phrase in phrases
+}
+
+
+def _alternation(phrases: List[str]) -> str:
+    """Regex alternation of phrases, longest first, with flexible inner whitespace"""
+    ordered = sorted(phrases, key=len, reverse=True)
+    return '|'.join(r'[ \t]+'.join(re.escape(word) for word in phrase.split()) for phrase in ordered)
+
+
+_TYPED_PHRASES = [phrase for section_type, phrases in SECTION_HEADINGS.items()
+                  if section_type != 'other' for phrase in phrases]
+_BULLET = r'(?:[#*•▪■\-]+[ \t]*)?'
+
+# A heading is a line holding only a heading phrase (optionally bulleted or
+# followed by a colon). An unbulleted typed heading may also lead an inline
+# list ('Skills: Python, SQL') unless it is one of BODY_LABELS; a bulleted
+# line with text after the colon is always body text. 'other' headings never
+# take a list, so 'Languages: Python' inside a skills section stays there.
+HEADING_PATTERN = re.compile(
+    r'^[ \t]*(?:' + _BULLET + r'(?P<heading>' + _alternation(_TYPED_PHRASES) + r')[ \t]*:?'
+    r'|(?P<inline>' + _alternation([p for p in _TYPED_PHRASES if p not in BODY_LABELS]) + r')[ \t]*:[^\n]*'
+    r'|' + _BULLET + r'(?P<other>' + _alternation(SECTION_HEADINGS['other']) + r')[ \t]*:?'
+    r')[ \t\r]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    A typed span of resume text
+
+    Attributes:
+        type: One of SECTION_TYPES
+        start: Offset of the span (its heading line included)
+        end: Offset just past the span
+        heading: Heading phrase as written ('' for the text before the first heading)
+    """
+    type: str
+    start: int
+    end: int
+    heading: str = ''
+
+
+@dataclass
+class SegmentedResume:
+    """Resume text with its section spans in document order"""
+    text: str
+    sections: List[Section]
+
+    @property
+    def types(self) -> Set[str]:
+        return {section.type for section in self.sections}
+
+    def has(self, section_type: str) -> bool:
+        return any(section.type == section_type for section in self.sections)
+
+    def spans(self, *types: str) -> List[Section]:
+        return [section for section in self.sections if section.type in types]
+
+    def text_of(self, *types: str, fallback: bool = True) -> str:
+        """
+        Text of the sections of the given types
+
+        Args:
+            types: Section types to include
+            fallback: Return the whole text when the resume has none of these
+                sections (e.g. a resume without headings)
+        """
+        spans = self.spans(*types)
+        if not spans:
+            return self.text if fallback else ''
+        return '\n'.join(self.text[section.start:section.end] for section in spans)
+
+
+def segment_resume(text: str) -> SegmentedResume:
+    """
+    Split resume text into typed sections in one pass over its lines
+
+    Each span runs from its heading to the next heading; spans are
+    contiguous, so together they cover the text apart from blank lines
+    before the first heading. Text before the first heading is typed
+    'contact' (name, email, phone usually come first).
+
+    Args:
+        text: Resume text
+
+    Returns:
+        SegmentedResume with the sections in document order
+    """
+    sections = []
+    section_type, heading, start = 'contact', '', 0
+
+    for match in HEADING_PATTERN.finditer(text):
+        if text[start:match.start()].strip() or heading:
+            sections.append(Section(section_type, start, match.start(), heading))
+        heading = match.group('heading') or match.group('inline') or match.group('other')
+        section_type = _HEADING_TYPES[' '.join(heading.lower().split())]
+        start = match.start()
+
+    if text[start:].strip() or heading:
+        sections.append(Section(section_type, start, len(text), heading))
+
+    return SegmentedResume(text, sections)
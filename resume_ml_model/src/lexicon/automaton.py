@@ -0,0 +1,148 @@
+import re
+import logging
+from collections import Counter, deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Words and single punctuation marks, so 'c++' is ('c', '+', '+') and 'node.js' is ('node', '.', 'js')
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens used for matching"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over word tokens for a set of term categories
+
+    Terms are matched as whole token sequences, which gives the same word
+    boundaries as an rf'\\b{term}\\b' regex ('go' does not match 'good',
+    'machine learning' does not match 'machine learnings'). All categories
+    are found, with per-term counts, in one pass over the text's tokens;
+    overlapping terms ('learning' inside 'machine learning') are all reported.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Compile the automaton
+
+        Args:
+            categories: Category name -> terms; a term may appear in several categories
+        """
+        self.categories = {category: list(dict.fromkeys(terms)) for category, terms in categories.items()}
+
+        self.term_categories: Dict[str, List[str]] = {}
+        for category, terms in self.categories.items():
+            for term in terms:
+                self.term_categories.setdefault(term, []).append(category)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        for term in self.term_categories:
+            tokens = tokenize(term)
+            if not tokens:
+                continue
+            node = 0
+            for token in tokens:
+                if token not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[node][token] = len(self._goto) - 1
+                node = self._goto[node][token]
+            self._output[node] += (term,)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """Breadth-first failure links; each node also emits its suffixes' terms"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                if node:
+                    fallback = self._fail[node]
+                    while fallback and token not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[child] = self._goto[fallback].get(token, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+    def iter_terms(self, text: str) -> Iterator[str]:
+        """Yield every term occurrence in the text, in order of where it ends"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for token in tokenize(text):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if output[node]:
+                yield from output[node]
+
+    def count_terms(self, text: str) -> Counter:
+        """Occurrences of each term found in the text"""
+        return Counter(self.iter_terms(text))
+
+    def scan(self, text: str) -> Dict[str, Dict[str, int]]:
+        """
+        Match every category in one pass
+
+        Returns:
+            Category -> {term: count} for the categories with at least one hit
+        """
+        hits: Dict[str, Dict[str, int]] = {}
+        for term, count in self.count_terms(text).items():
+            for category in self.term_categories[term]:
+                hits.setdefault(category, {})[term] = count
+        return hits
+
+    def scan_sections(self, text: str, sections: Iterable) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        Match every category in each section span
+
+        Args:
+            text: Full text
+            sections: Spans with type, start and end (data_processing/preprocessing.py)
+
+        Returns:
+            Section type -> scan() hits, with hits of same-typed sections added together
+        """
+        section_hits: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for section in sections:
+            hits = self.scan(text[section.start:section.end])
+            section_hits[section.type] = merge_hits(section_hits.get(section.type, {}), hits)
+        return section_hits
+
+
+def merge_hits(*hit_sets: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Add scan() results together"""
+    merged: Dict[str, Dict[str, int]] = {}
+    for hits in hit_sets:
+        for category, terms in hits.items():
+            counts = merged.setdefault(category, {})
+            for term, count in terms.items():
+                counts[term] = counts.get(term, 0) + count
+    return merged
+
+
+def hits_for(section_hits: Dict[str, Dict[str, Dict[str, int]]], section_types: Iterable[str]) -> Dict[str, Dict[str, int]]:
+    """
+    Hits within the given section types
+
+    Falls back to every section when the text has none of them, so a resume
+    without headings is still matched as a whole.
+    """
+    selected = [section_hits[section_type] for section_type in section_types if section_type in section_hits]
+    return merge_hits(*(selected or section_hits.values()))
+
+
+def group_hits(hits: Dict[str, Dict[str, int]], group: str) -> Dict[str, Dict[str, int]]:
+    """Hits of the categories under a 'group/' prefix, keyed by the rest of the name"""
+    prefix = f"{group}/"
+    return {category[len(prefix):]: terms for category, terms in hits.items() if category.startswith(prefix)}
@@ -0,0 +1,237 @@
+import sys
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lexicon.automaton import KeywordAutomaton
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# One vocabulary shared by every analyzer; each analyzer groups it into its
+# own categories in LEXICONS below, so a term is added in exactly one place.
+
+# Technical skills in fine-grained groups
+TECH_SKILLS = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+        'kotlin', 'swift', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell'
+    ],
+    'web': [
+        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+        'spring', 'laravel', 'rails', 'asp.net', 'jquery', 'bootstrap', 'sass', 'less'
+    ],
+    'databases': [
+        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle', 'sqlite',
+        'cassandra', 'dynamodb', 'neo4j', 'couchdb', 'mariadb'
+    ],
+    'cloud_aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds', 'dynamodb', 'cloudformation'],
+    'cloud_azure': ['azure', 'microsoft azure', 'azure functions', 'cosmos db', 'azure sql'],
+    'cloud_gcp': ['gcp', 'google cloud', 'firebase', 'big query', 'cloud functions'],
+    'cloud_other': ['heroku', 'digitalocean'],
+    'infrastructure': ['docker', 'kubernetes', 'terraform', 'ansible'],
+    'ci_cd': ['jenkins', 'git', 'github', 'gitlab', 'ci/cd'],
+    'engineering_practices': [
+        'jira', 'confluence', 'agile', 'scrum', 'devops', 'rest api', 'graphql', 'microservices'
+    ],
+    'ml_ai': [
+        'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'keras',
+        'pandas', 'numpy', 'opencv', 'spark', 'nlp', 'computer vision', 'neural networks'
+    ],
+    'mobile': ['android', 'ios', 'react native', 'flutter', 'xamarin', 'swift', 'kotlin'],
+    'operating_systems': ['linux', 'windows'],
+    # Bare names that also match inside 'c++' and 'node.js' ('c', '+', '+'),
+    # so only resume_score, which always counted them, reads them
+    'short_names': ['c', 'node']
+}
+
+# Soft skills by category, with variations
+SOFT_SKILLS = {
+    'leadership': ['leadership', 'team lead', 'managing', 'supervising', 'mentoring', 'training'],
+    'communication': [
+        'communication', 'presentation', 'public speaking', 'writing', 'negotiation', 'customer service'
+    ],
+    'problem_solving': [
+        'problem solving', 'analytical', 'analytical thinking', 'critical thinking',
+        'troubleshooting', 'debugging'
+    ],
+    'teamwork': ['teamwork', 'collaboration', 'cross-functional', 'interpersonal'],
+    'project_management': [
+        'project management', 'planning', 'coordination', 'organizing', 'organized', 'time management'
+    ],
+    'adaptability': ['adaptable', 'flexible', 'learning', 'growth mindset'],
+    'initiative': [
+        'creative', 'innovation', 'innovative', 'self-motivated', 'detail oriented', 'detail-oriented'
+    ]
+}
+
+# Action verbs categorized by strength
+ACTION_VERBS = {
+    'strong': [
+        'achieved', 'accomplished', 'implemented', 'developed', 'created', 'designed', 'built',
+        'engineered', 'managed', 'led', 'directed', 'coordinated', 'organized', 'optimized',
+        'improved', 'increased', 'decreased', 'reduced', 'streamlined', 'automated', 'delivered',
+        'launched', 'established', 'initiated', 'transformed', 'revolutionized', 'spearheaded',
+        'executed', 'drove', 'mentored'
+    ],
+    'moderate': [
+        'worked', 'assisted', 'supported', 'contributed', 'participated', 'collaborated',
+        'helped', 'maintained', 'updated', 'modified', 'enhanced', 'researched'
+    ],
+    'weak': [
+        'responsible for', 'duties included', 'involved in', 'was tasked with',
+        'familiar with', 'exposure to', 'knowledge of', 'worked on', 'helped with'
+    ]
+}
+
+PASSIVE_PHRASES = ['was responsible', 'were involved', 'duties included']
+
+# Industry keywords
+INDUSTRY_KEYWORDS = {
+    'technology': ['software', 'engineering', 'development', 'programming', 'coding', 'tech'],
+    'data_science': ['data science', 'analytics', 'statistics', 'machine learning', 'ai'],
+    'cybersecurity': ['security', 'cybersecurity', 'penetration', 'encryption', 'firewall'],
+    'product_management': ['product', 'strategy', 'roadmap', 'stakeholder', 'user experience'],
+    'marketing': [
+        'marketing', 'advertising', 'branding', 'brand', 'campaign', 'campaigns',
+        'social media', 'content', 'seo'
+    ],
+    'finance': ['finance', 'accounting', 'investment', 'banking'],
+    'healthcare': ['healthcare', 'medical', 'clinical', 'patient'],
+    'education': ['teaching', 'curriculum', 'student', 'academic']
+}
+
+# Experience indicators
+EXPERIENCE_KEYWORDS = {
+    'indicators': [
+        'years of experience', 'years experience', 'experience in',
+        'worked at', 'employed at', 'position at'
+    ],
+    'work_history': ['work', 'employment', 'job', 'position']
+}
+
+# Degree types and education institutions
+EDUCATION_KEYWORDS = {
+    'degrees': ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'diploma'],
+    'institutions': ['university', 'college', 'institute', 'school'],
+    'gpa': ['gpa']
+}
+
+# Resume sections reported as has_<section>_section (detected by
+# data_processing/preprocessing.py; 'contact' from contact details instead)
+FEATURE_SECTIONS = [
+    'contact', 'summary', 'experience', 'education', 'skills', 'projects', 'certifications'
+]
+
+
+def union(*groups: Iterable[str]) -> list:
+    """Terms of several groups in order, without repeats"""
+    return list(dict.fromkeys(term for group in groups for term in group))
+
+
+TermGroup = Union[Dict[str, Iterable[str]], Iterable[str]]
+
+_ALL_CLOUD = union(TECH_SKILLS['cloud_aws'], TECH_SKILLS['cloud_azure'],
+                   TECH_SKILLS['cloud_gcp'], TECH_SKILLS['cloud_other'])
+_DEVOPS = union(TECH_SKILLS['infrastructure'], TECH_SKILLS['ci_cd'])
+
+# Each analyzer's categories over the shared vocabulary; a list becomes a
+# single category. Category names are what the analyzers report (and, for
+# 'features', the tech_skills_<category> / industry_<category>_keywords
+# columns). Every term a category held when each analyzer kept its own
+# lists is still in that category; sharing the vocabulary only added terms.
+LEXICONS: Dict[str, Dict[str, TermGroup]] = {
+    # SmartResumeAnalyzer (app.py, smart_app.py)
+    'smart': {
+        'tech': {
+            'programming_languages': TECH_SKILLS['programming_languages'],
+            'web_technologies': TECH_SKILLS['web'],
+            'databases': TECH_SKILLS['databases'],
+            # Containers and infrastructure as code count as cloud skills here
+            'cloud_platforms': union(_ALL_CLOUD, TECH_SKILLS['infrastructure']),
+            'ml_ai': TECH_SKILLS['ml_ai'],
+            'tools_frameworks': union(_DEVOPS, TECH_SKILLS['engineering_practices'])
+        },
+        'soft': SOFT_SKILLS,
+        'verbs': ACTION_VERBS,
+        'industry': {
+            'software_engineering': INDUSTRY_KEYWORDS['technology'],
+            **{industry: INDUSTRY_KEYWORDS[industry]
+               for industry in ('data_science', 'cybersecurity', 'product_management', 'marketing')}
+        }
+    },
+    # IntelligentResumeAnalyzer (intelligent_app.py)
+    'intelligent': {
+        'tech': {
+            'programming': TECH_SKILLS['programming_languages'],
+            'web_frameworks': TECH_SKILLS['web'],
+            'databases': TECH_SKILLS['databases'],
+            'cloud_aws': TECH_SKILLS['cloud_aws'],
+            'cloud_azure': TECH_SKILLS['cloud_azure'],
+            'cloud_gcp': TECH_SKILLS['cloud_gcp'],
+            'devops': _DEVOPS,
+            'ml_ai': TECH_SKILLS['ml_ai'],
+            'mobile': TECH_SKILLS['mobile']
+        },
+        'soft': union(*SOFT_SKILLS.values()),
+        # 'assisted' has always been a weak verb for this analyzer
+        'verbs': {'strong': ACTION_VERBS['strong'], 'weak': union(ACTION_VERBS['weak'], ['assisted'])},
+        'passive': PASSIVE_PHRASES
+    },
+    # ResumeFeatureExtractor (src/data_processing/feature_extraction.py)
+    'features': {
+        'tech': {
+            'programming_languages': TECH_SKILLS['programming_languages'],
+            'web_technologies': TECH_SKILLS['web'],
+            'databases': TECH_SKILLS['databases'],
+            'cloud_platforms': _ALL_CLOUD,
+            'devops_tools': _DEVOPS,
+            'data_science': TECH_SKILLS['ml_ai']
+        },
+        'soft': union(*SOFT_SKILLS.values()),
+        # Power words: the strong verbs, and 'collaborated' as it always was
+        'verbs': union(ACTION_VERBS['strong'], ['collaborated']),
+        'industry': {industry: INDUSTRY_KEYWORDS[industry]
+                     for industry in ('technology', 'marketing', 'finance', 'healthcare', 'education')},
+        'experience': EXPERIENCE_KEYWORDS,
+        'education': EDUCATION_KEYWORDS
+    },
+    # extract_keywords (resume_score/app.py)
+    'resume_score': {
+        'tech_skills': union(
+            TECH_SKILLS['programming_languages'], TECH_SKILLS['short_names'], TECH_SKILLS['web'],
+            TECH_SKILLS['databases'], _ALL_CLOUD, _DEVOPS, TECH_SKILLS['operating_systems'],
+            TECH_SKILLS['ml_ai'], INDUSTRY_KEYWORDS['data_science']
+        )
+    }
+}
+
+
+def flatten_groups(groups: Dict[str, TermGroup]) -> Dict[str, list]:
+    """Name categories '<group>/<category>', or '<group>' for a plain term list"""
+    categories = {}
+    for group, terms in groups.items():
+        if isinstance(terms, dict):
+            for category, category_terms in terms.items():
+                categories[f"{group}/{category}"] = list(category_terms)
+        else:
+            categories[group] = list(terms)
+    return categories
+
+
+@lru_cache(maxsize=None)
+def get_lexicon(name: str) -> KeywordAutomaton:
+    """
+    Compiled automaton for one analyzer's term sets
+
+    Compiled on first use and shared by every analyzer instance in the process.
+    """
+    if name not in LEXICONS:
+        raise ValueError(f"Unknown lexicon '{name}'. Available: {sorted(LEXICONS)}")
+    automaton = KeywordAutomaton(flatten_groups(LEXICONS[name]))
+    logger.info(f"Compiled lexicon '{name}': {len(automaton.term_categories)} terms")
+    return automaton
@@ -0,0 +1,167 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from sklearn.base import BaseEstimator
+from sklearn.ensemble import (
+    RandomForestRegressor, GradientBoostingRegressor,
+    HistGradientBoostingRegressor, VotingRegressor
+)
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler, MaxAbsScaler
+
+
+@dataclass
+class ModelBackend:
+    """
+    A scoring estimator that ResumeScorer can train and serve
+
+    Attributes:
+        name: Key used as ResumeScorer model_type
+        build: Factory taking n_jobs and returning an unfitted estimator
+        params: Hyperparameter grid (keys prefixed with 'model__')
+        supports_sparse: Whether fit/predict accept scipy sparse input
+        sparse_input: Whether ResumeScorer should feed it a sparse matrix
+        multithreaded: Whether fit/predict use multiple cores
+        scaler: 'standard', 'maxabs' (keeps sparsity) or None
+        estimators_param: Grid key counting the estimators or boosting
+            iterations, used as the 'n_estimators' halving budget (None if
+            the model has no such parameter)
+        description: Short human-readable summary
+    """
+    name: str
+    build: Callable[[int], BaseEstimator]
+    params: Dict[str, List] = field(default_factory=dict)
+    supports_sparse: bool = False
+    sparse_input: bool = False
+    multithreaded: bool = False
+    scaler: Optional[str] = 'standard'
+    estimators_param: Optional[str] = None
+    description: str = ''
+
+    def create_pipeline(self, n_jobs: int = -1, memory=None) -> Pipeline:
+        """Build the preprocessing + estimator pipeline for this backend"""
+        steps = []
+        if self.scaler == 'standard':
+            steps.append(('scaler', StandardScaler()))
+        elif self.scaler == 'maxabs':
+            steps.append(('scaler', MaxAbsScaler()))
+        steps.append(('model', self.build(n_jobs)))
+        return Pipeline(steps, memory=memory)
+
+
+MODEL_BACKENDS: Dict[str, ModelBackend] = {}
+
+
+def register_backend(backend: ModelBackend) -> ModelBackend:
+    """Add a backend to the registry (replacing any with the same name)"""
+    MODEL_BACKENDS[backend.name] = backend
+    return backend
+
+
+def get_backend(name: str) -> ModelBackend:
+    """Look up a registered backend by name"""
+    if name not in MODEL_BACKENDS:
+        raise ValueError(f"Unknown model backend '{name}'. Available: {', '.join(MODEL_BACKENDS)}")
+    return MODEL_BACKENDS[name]
+
+
+def list_backends() -> List[str]:
+    """Names of all registered backends"""
+    return list(MODEL_BACKENDS)
+
+
+def _build_ensemble(n_jobs: int) -> VotingRegressor:
+    return VotingRegressor([
+        ('rf', RandomForestRegressor(n_estimators=200, max_depth=20, random_state=42)),
+        ('gbm', GradientBoostingRegressor(n_estimators=150, learning_rate=0.1, max_depth=5, random_state=42)),
+        ('ridge', Ridge(alpha=10.0))
+    ], n_jobs=n_jobs)
+
+
+register_backend(ModelBackend(
+    name='rf',
+    build=lambda n_jobs: RandomForestRegressor(n_jobs=n_jobs),
+    params={
+        'model__n_estimators': [100, 200, 300],
+        'model__max_depth': [10, 20, None],
+        'model__min_samples_split': [2, 5, 10],
+        'model__min_samples_leaf': [1, 2, 4]
+    },
+    supports_sparse=True,
+    multithreaded=True,
+    estimators_param='model__n_estimators',
+    description='Random forest'
+))
+
+register_backend(ModelBackend(
+    name='gbm',
+    build=lambda n_jobs: GradientBoostingRegressor(),
+    params={
+        'model__n_estimators': [100, 200],
+        'model__learning_rate': [0.05, 0.1, 0.15],
+        'model__max_depth': [3, 5, 7],
+        'model__min_samples_split': [2, 5],
+        'model__min_samples_leaf': [1, 2]
+    },
+    estimators_param='model__n_estimators',
+    description='Classic gradient boosting'
+))
+
+register_backend(ModelBackend(
+    name='linear',
+    build=lambda n_jobs: Ridge(),
+    params={
+        'model__alpha': [0.1, 1.0, 10.0, 100.0]
+    },
+    description='Ridge regression on standardized features'
+))
+
+register_backend(ModelBackend(
+    name='ensemble',
+    build=_build_ensemble,
+    multithreaded=True,
+    description='Voting ensemble of random forest, gradient boosting and ridge'
+))
+
+register_backend(ModelBackend(
+    name='hgb',
+    build=lambda n_jobs: HistGradientBoostingRegressor(max_iter=200, learning_rate=0.1, random_state=42),
+    params={
+        'model__max_iter': [100, 200, 400],
+        'model__learning_rate': [0.05, 0.1, 0.2],
+        'model__max_leaf_nodes': [15, 31, 63],
+        'model__l2_regularization': [0.0, 1.0]
+    },
+    multithreaded=True,
+    scaler=None,
+    estimators_param='model__max_iter',
+    description='Histogram-based gradient boosting'
+))
+
+register_backend(ModelBackend(
+    name='sparse_linear',
+    build=lambda n_jobs: Ridge(alpha=1.0, solver='sparse_cg'),
+    params={
+        'model__alpha': [0.1, 1.0, 10.0]
+    },
+    supports_sparse=True,
+    sparse_input=True,
+    scaler='maxabs',
+    description='Ridge on sparse features (raw TF-IDF stays sparse)'
+))
+
+register_backend(ModelBackend(
+    name='shallow_rf',
+    build=lambda n_jobs: RandomForestRegressor(
+        n_estimators=100, max_depth=8, min_samples_leaf=2, random_state=42, n_jobs=n_jobs
+    ),
+    params={
+        'model__n_estimators': [50, 100, 200],
+        'model__max_depth': [6, 8, 10]
+    },
+    supports_sparse=True,
+    multithreaded=True,
+    estimators_param='model__n_estimators',
+    description='Shallow random forest for low-latency serving'
+))
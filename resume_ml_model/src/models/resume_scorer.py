@@ -1,70 +1,151 @@
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression, Ridge
-from sklearn.svm import SVR
-from sklearn.preprocessing import StandardScaler, RobustScaler
-from sklearn.model_selection import cross_val_score, GridSearchCV
+from scipy import sparse
+from sklearn.model_selection import GridSearchCV, KFold
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from sklearn.pipeline import Pipeline
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestRegressor, VotingRegressor
 import joblib
+from joblib import Parallel, delayed
 import logging
-from typing import Dict, List, Tuple, Optional
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Tuple, Optional, Iterable, Iterator
 import warnings
+import sys
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.backends import MODEL_BACKENDS, get_backend
+from utils.artifacts import save_artifact, load_artifact
+from utils.batching import MicroBatcher
+from utils.metrics import evaluate_predictions
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _fit_estimator(estimator, X: np.ndarray, y: np.ndarray) -> Tuple[object, Dict]:
+    """Fit a fresh clone of an estimator, with its wall/CPU time (runs in a joblib worker)"""
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    fitted = clone(estimator).fit(X, y)
+    return fitted, {'wall_s': time.perf_counter() - wall_start, 'cpu_s': time.process_time() - cpu_start}
+
+def _fit_and_score_fold(estimator, X: np.ndarray, y: np.ndarray,
+                        train_idx: np.ndarray, test_idx: np.ndarray) -> Tuple[float, Dict]:
+    """Fit on one CV fold and return its R² and wall/CPU time (runs in a joblib worker)"""
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    fitted = clone(estimator).fit(X[train_idx], y[train_idx])
+    score = r2_score(y[test_idx], fitted.predict(X[test_idx]))
+    return score, {'wall_s': time.perf_counter() - wall_start, 'cpu_s': time.process_time() - cpu_start}
+
+def _to_csr(df: pd.DataFrame) -> sparse.csr_matrix:
+    """
+    CSR matrix of a feature frame, taking sparse columns (e.g. TF-IDF) as they
+    are stored instead of densifying them
+    """
+    is_sparse = np.array([isinstance(dtype, pd.SparseDtype) for dtype in df.dtypes])
+    if not is_sparse.any():
+        return sparse.csr_matrix(df.values.astype(float))
+    
+    dense_part = sparse.csr_matrix(df.loc[:, ~is_sparse].values.astype(float))
+    sparse_part = df.loc[:, is_sparse].sparse.to_coo().tocsr()
+    matrix = sparse.hstack([dense_part, sparse_part], format='csr')
+    # Put the columns back in frame order
+    order = np.concatenate([np.flatnonzero(~is_sparse), np.flatnonzero(is_sparse)])
+    return matrix[:, np.argsort(order)]
+
 class ResumeScorer:
     """
     Machine Learning model for scoring resume quality
     """
     
-    def __init__(self, model_type: str = 'ensemble'):
+    def __init__(self, model_type: str = 'ensemble', n_jobs: int = -1):
         """
         Initialize the resume scorer
         
         Args:
-            model_type: Type of model to use ('rf', 'gbm', 'ensemble', 'linear')
+            model_type: Registered backend to use ('rf', 'gbm', 'ensemble', 'linear',
+                'hgb', 'sparse_linear', 'shallow_rf', ...)
+            n_jobs: Parallel jobs for CV folds and ensemble member fits (-1 = all cores)
         """
         self.model_type = model_type
+        self.n_jobs = n_jobs
         self.model = None
         self.scaler = None
         self.feature_names = []
         self.is_trained = False
+        self._feature_index = {}
+        self._indexed_names = None
         
-        # Model configurations
+        # Model configurations, derived from the backend registry
         self.model_configs = {
-            'rf': {
-                'model': RandomForestRegressor(),
-                'params': {
-                    'model__n_estimators': [100, 200, 300],
-                    'model__max_depth': [10, 20, None],
-                    'model__min_samples_split': [2, 5, 10],
-                    'model__min_samples_leaf': [1, 2, 4]
-                }
-            },
-            'gbm': {
-                'model': GradientBoostingRegressor(),
-                'params': {
-                    'model__n_estimators': [100, 200],
-                    'model__learning_rate': [0.05, 0.1, 0.15],
-                    'model__max_depth': [3, 5, 7],
-                    'model__min_samples_split': [2, 5],
-                    'model__min_samples_leaf': [1, 2]
-                }
-            },
-            'linear': {
-                'model': Ridge(),
-                'params': {
-                    'model__alpha': [0.1, 1.0, 10.0, 100.0]
-                }
-            }
+            name: {'model': backend.build(n_jobs), 'params': backend.params}
+            for name, backend in MODEL_BACKENDS.items()
         }
     
-    def prepare_features(self, X: pd.DataFrame) -> np.ndarray:
-        """Prepare features for training/prediction"""
+    def _column_index(self) -> Dict[str, int]:
+        """Feature name -> column position, rebuilt only when feature_names changes"""
+        if self._indexed_names is not self.feature_names:
+            self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+            self._indexed_names = self.feature_names
+        return self._feature_index
+    
+    def vectorize(self, features, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Map feature dicts straight into the model's column order, without pandas
+        
+        Args:
+            features: One feature dict or a list of them (unknown keys are
+                ignored, missing and None/NaN values become 0)
+            out: Optional preallocated (n_rows, n_features) float array to fill
+            
+        Returns:
+            Float array of shape (n_rows, n_features)
+        """
+        if not self.feature_names:
+            raise ValueError("Feature names are unknown until the model is trained")
+        
+        rows = [features] if isinstance(features, dict) else features
+        index = self._column_index()
+        
+        if out is None:
+            out = np.zeros((len(rows), len(index)))
+        else:
+            out[:] = 0.0
+        
+        for r, row in enumerate(rows):
+            out_row = out[r]
+            for name, value in row.items():
+                i = index.get(name)
+                if i is not None and value is not None and value == value:
+                    out_row[i] = value
+        
+        return out
+    
+    def prepare_features(self, X) -> np.ndarray:
+        """
+        Prepare features for training/prediction
+        
+        Args:
+            X: Feature DataFrame, a feature dict (or list of dicts), or an
+                array already in feature_names column order. Dicts and
+                arrays take a fast path that bypasses pandas.
+        """
+        sparse_input = self.model_type in MODEL_BACKENDS and get_backend(self.model_type).sparse_input
+        
+        if isinstance(X, (dict, list, np.ndarray)):
+            if isinstance(X, np.ndarray):
+                X_array = np.atleast_2d(X)
+                if X_array.shape[1] != len(self.feature_names):
+                    raise ValueError(f"Expected {len(self.feature_names)} feature columns, got {X_array.shape[1]}")
+            else:
+                X_array = self.vectorize(X)
+            return sparse.csr_matrix(X_array) if sparse_input else X_array
         
         # Handle missing values
         X_processed = X.fillna(0)
@@ -77,46 +158,83 @@ class ResumeScorer:
         if not self.feature_names:
             self.feature_names = list(X_processed.columns)
         
-        # Ensure feature consistency
-        if set(X_processed.columns) != set(self.feature_names):
-            logger.warning("Feature mismatch detected. Reordering features...")
+        # Ensure feature consistency (extra columns, e.g. ones a distilled
+        # student doesn't use, are dropped silently)
+        if list(X_processed.columns) != self.feature_names:
+            if not set(self.feature_names) <= set(X_processed.columns):
+                logger.warning("Feature mismatch detected. Reordering features...")
             X_processed = X_processed.reindex(columns=self.feature_names, fill_value=0)
         
-        return X_processed.values
-    
-    def create_ensemble_model(self) -> Pipeline:
-        """Create ensemble model combining multiple algorithms"""
+        if sparse_input:
+            return _to_csr(X_processed)
         
-        from sklearn.ensemble import VotingRegressor
+        return X_processed.to_numpy(dtype=float)
+    
+    def select_features(self, X: pd.DataFrame, y: pd.Series, k: int = 100,
+                        method: str = 'univariate') -> List[str]:
+        """
+        Choose the k most useful features and restrict the scorer to them
         
-        # Individual models
-        rf = RandomForestRegressor(n_estimators=200, max_depth=20, random_state=42)
-        gbm = GradientBoostingRegressor(n_estimators=150, learning_rate=0.1, max_depth=5, random_state=42)
-        ridge = Ridge(alpha=10.0)
+        Must be fitted on the training split only. The selection is kept in
+        feature_names, so it is saved with the model and applied by every
+        later train/predict call.
         
-        # Ensemble
-        ensemble = VotingRegressor([
-            ('rf', rf),
-            ('gbm', gbm),
-            ('ridge', ridge)
-        ])
+        Args:
+            X: Training feature matrix
+            y: Training scores
+            k: Number of features to keep
+            method: 'univariate' (F-test against the score) or 'model'
+                (random forest impurity importance)
+            
+        Returns:
+            Selected feature names, in their original column order
+        """
+        self.feature_names = []
+        X_processed = X.fillna(0)
+        bool_columns = X_processed.select_dtypes(include=['bool']).columns
+        X_processed[bool_columns] = X_processed[bool_columns].astype(int)
+        values = X_processed.values.astype(float)
+        k = min(k, values.shape[1])
+        
+        if method == 'univariate':
+            from sklearn.feature_selection import f_regression
+            scores, _ = f_regression(values, np.asarray(y, dtype=float))
+        elif method == 'model':
+            forest = RandomForestRegressor(n_estimators=100, max_depth=10, random_state=42, n_jobs=self.n_jobs)
+            scores = forest.fit(values, np.asarray(y, dtype=float)).feature_importances_
+        else:
+            raise ValueError(f"Unknown feature selection method: {method}")
         
-        # Create pipeline with scaling
-        pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('model', ensemble)
-        ])
+        # Constant columns get NaN F-scores
+        scores = np.nan_to_num(scores, nan=0.0)
+        keep = np.sort(np.argsort(scores)[::-1][:k])
+        self.feature_names = [X_processed.columns[i] for i in keep]
         
-        return pipeline
+        logger.info(f"Selected {len(self.feature_names)} of {values.shape[1]} features ({method})")
+        return self.feature_names
     
-    def train(self, X: pd.DataFrame, y: pd.Series, validation_split: float = 0.2) -> Dict:
+    def create_ensemble_model(self) -> Pipeline:
+        """Create ensemble model combining multiple algorithms"""
+        return get_backend('ensemble').create_pipeline(self.n_jobs)
+    
+    def create_model(self) -> Pipeline:
+        """Create the pipeline for this scorer's backend"""
+        return get_backend(self.model_type).create_pipeline(self.n_jobs)
+    
+    def train(self, X: pd.DataFrame, y: pd.Series, validation_split: float = 0.2,
+              cv_folds: Optional[int] = 5) -> Dict:
         """
         Train the resume scoring model
         
+        The final fit and the cross-validation fold fits run concurrently in
+        one joblib pool; the feature matrix is memory-mapped into the workers
+        rather than copied per fold.
+        
         Args:
             X: Feature matrix
             y: Target scores (0-100)
-            validation_split: Fraction of data for validation
+            validation_split: Fraction of data for validation (0 to skip)
+            cv_folds: Number of cross-validation folds (0 or None to skip)
             
         Returns:
             Training results dictionary
@@ -125,114 +243,215 @@ class ResumeScorer:
         
         # Prepare features
         X_processed = self.prepare_features(X)
+        y_values = np.asarray(y, dtype=float)
         
         # Split data for validation
-        from sklearn.model_selection import train_test_split
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_processed, y, test_size=validation_split, random_state=42
-        )
+        if validation_split:
+            from sklearn.model_selection import train_test_split
+            X_train, X_val, y_train, y_val = train_test_split(
+                X_processed, y_values, test_size=validation_split, random_state=42
+            )
+        else:
+            X_train, X_val, y_train, y_val = X_processed, None, y_values, None
         
         # Create model based on type
-        if self.model_type == 'ensemble':
-            self.model = self.create_ensemble_model()
-        else:
-            config = self.model_configs[self.model_type]
-            self.model = Pipeline([
-                ('scaler', StandardScaler()),
-                ('model', config['model'])
-            ])
+        template = self.create_model()
         
-        # Train the model
+        # Train the model, with the CV folds alongside it
         logger.info(f"Training {self.model_type} model...")
-        self.model.fit(X_train, y_train)
+        jobs = [delayed(_fit_estimator)(template, X_train, y_train)]
+        if cv_folds:
+            for train_idx, test_idx in KFold(n_splits=cv_folds).split(X_processed):
+                jobs.append(delayed(_fit_and_score_fold)(
+                    template, X_processed, y_values, train_idx, test_idx
+                ))
+        
+        if len(jobs) > 1:
+            outputs = Parallel(n_jobs=self.n_jobs, max_nbytes='1M', mmap_mode='r')(jobs)
+        else:
+            outputs = [_fit_estimator(template, X_train, y_train)]
+        self.model, fit_timing = outputs[0]
         
         # Validate the model
         train_pred = self.model.predict(X_train)
-        val_pred = self.model.predict(X_val)
         
         # Calculate metrics
         results = {
             'train_mse': mean_squared_error(y_train, train_pred),
             'train_mae': mean_absolute_error(y_train, train_pred),
             'train_r2': r2_score(y_train, train_pred),
-            'val_mse': mean_squared_error(y_val, val_pred),
-            'val_mae': mean_absolute_error(y_val, val_pred),
-            'val_r2': r2_score(y_val, val_pred),
-            'train_samples': len(X_train),
-            'val_samples': len(X_val)
+            'train_samples': X_train.shape[0],
+            'val_samples': X_val.shape[0] if X_val is not None else 0,
+            'timings': {'fit': fit_timing}
         }
         
+        if X_val is not None:
+            val_pred = self.model.predict(X_val)
+            results.update({
+                'val_mse': mean_squared_error(y_val, val_pred),
+                'val_mae': mean_absolute_error(y_val, val_pred),
+                'val_r2': r2_score(y_val, val_pred)
+            })
+        
         # Cross-validation scores
-        cv_scores = cross_val_score(self.model, X_processed, y, cv=5, scoring='r2')
-        results['cv_mean'] = cv_scores.mean()
-        results['cv_std'] = cv_scores.std()
+        if cv_folds:
+            cv_scores = np.array([score for score, _ in outputs[1:]])
+            results['cv_mean'] = cv_scores.mean()
+            results['cv_std'] = cv_scores.std()
+            results['timings']['cv_folds'] = [timing for _, timing in outputs[1:]]
         
         self.is_trained = True
         
-        logger.info(f"Training completed. Validation R²: {results['val_r2']:.3f}")
-        logger.info(f"Cross-validation R²: {results['cv_mean']:.3f} ± {results['cv_std']:.3f}")
+        if 'val_r2' in results:
+            logger.info(f"Training completed. Validation R²: {results['val_r2']:.3f}")
+        else:
+            logger.info(f"Training completed. Train R²: {results['train_r2']:.3f}")
+        if cv_folds:
+            logger.info(f"Cross-validation R²: {results['cv_mean']:.3f} ± {results['cv_std']:.3f}")
         
         return results
     
-    def hyperparameter_tuning(self, X: pd.DataFrame, y: pd.Series) -> Dict:
+    def hyperparameter_tuning(self, X: pd.DataFrame, y: pd.Series, search: str = 'grid',
+                              resource: str = 'n_samples', factor: int = 3,
+                              cache_dir: Optional[str] = None) -> Dict:
         """
-        Perform hyperparameter tuning using GridSearchCV
+        Perform hyperparameter tuning using GridSearchCV or successive halving
         
         Args:
             X: Feature matrix
             y: Target scores
+            search: 'grid' for exhaustive search, 'halving' for successive halving
+            resource: Budget grown between halving rounds: 'n_samples' or
+                'n_estimators' (the backend's estimators_param: trees, or
+                boosting iterations for hgb)
+            factor: Fraction of candidates kept (1/factor) per halving round
+            cache_dir: Directory for caching the fitted scaler between
+                candidates (a temporary directory if None)
             
         Returns:
-            Best parameters and scores
+            Best parameters and scores, plus per-candidate wall times
+            
+        Raises:
+            ValueError: Unknown search or resource, or an 'n_estimators'
+                budget for a backend without an estimator-count parameter
         """
-        if self.model_type == 'ensemble':
-            logger.info("Hyperparameter tuning not available for ensemble model")
+        if resource not in ('n_samples', 'n_estimators'):
+            raise ValueError(f"Unknown halving resource: {resource}")
+        backend = get_backend(self.model_type)
+        if not backend.params:
+            logger.info(f"Hyperparameter tuning not available for {self.model_type} model")
             return {}
         
-        logger.info(f"Performing hyperparameter tuning for {self.model_type}...")
+        logger.info(f"Performing {search} hyperparameter search for {self.model_type}...")
         
         X_processed = self.prepare_features(X)
-        config = self.model_configs[self.model_type]
-        
-        # Create pipeline
-        pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('model', config['model'])
-        ])
-        
-        # Grid search
-        grid_search = GridSearchCV(
-            pipeline,
-            config['params'],
-            cv=5,
-            scoring='r2',
-            n_jobs=-1,
-            verbose=1
-        )
-        
-        grid_search.fit(X_processed, y)
-        
-        # Update model with best parameters
-        self.model = grid_search.best_estimator_
+        param_grid = dict(backend.params)
+        
+        # Cache the fitted scaler so candidates sharing a fold don't refit it
+        cache_location = cache_dir or tempfile.mkdtemp(prefix='resume_scorer_cache_')
+        memory = joblib.Memory(location=cache_location, verbose=0)
+        
+        pipeline = backend.create_pipeline(self.n_jobs, memory=memory)
+        
+        if search == 'halving':
+            from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+            from sklearn.model_selection import HalvingGridSearchCV
+            
+            halving_kwargs = {'resource': 'n_samples'}
+            if resource == 'n_estimators':
+                budget_param = backend.estimators_param
+                if budget_param not in param_grid:
+                    raise ValueError(
+                        f"The {self.model_type} backend has no estimator-count parameter; "
+                        f"use resource='n_samples'"
+                    )
+                # The budget replaces that grid dimension
+                max_estimators = max(param_grid.pop(budget_param))
+                halving_kwargs = {
+                    'resource': budget_param,
+                    'max_resources': max_estimators,
+                    'min_resources': max(10, max_estimators // factor ** 2)
+                }
+            
+            searcher = HalvingGridSearchCV(
+                pipeline,
+                param_grid,
+                cv=5,
+                scoring='r2',
+                factor=factor,
+                n_jobs=-1,
+                verbose=1,
+                random_state=42,
+                **halving_kwargs
+            )
+        elif search == 'grid':
+            searcher = GridSearchCV(
+                pipeline,
+                param_grid,
+                cv=5,
+                scoring='r2',
+                n_jobs=-1,
+                verbose=1
+            )
+        else:
+            raise ValueError(f"Unknown search strategy: {search}")
+        
+        start_time = time.perf_counter()
+        try:
+            searcher.fit(X_processed, y)
+        finally:
+            if cache_dir is None:
+                shutil.rmtree(cache_location, ignore_errors=True)
+        search_time = time.perf_counter() - start_time
+        
+        # Update model with best parameters (without the cache reference)
+        self.model = searcher.best_estimator_
+        self.model.set_params(memory=None)
         self.is_trained = True
         
         results = {
-            'best_params': grid_search.best_params_,
-            'best_score': grid_search.best_score_,
-            'cv_results': grid_search.cv_results_
+            'best_params': searcher.best_params_,
+            'best_score': searcher.best_score_,
+            'cv_results': searcher.cv_results_,
+            'candidate_timings': self._candidate_timings(searcher),
+            'search_time': search_time
         }
         
         logger.info(f"Best parameters: {results['best_params']}")
         logger.info(f"Best CV score: {results['best_score']:.3f}")
+        logger.info(f"Search finished in {search_time:.1f}s over {len(results['candidate_timings'])} candidate fits")
         
         return results
     
-    def predict(self, X: pd.DataFrame) -> np.ndarray:
+    def _candidate_timings(self, searcher) -> List[Dict]:
+        """Wall time per evaluated candidate (and halving round) from cv_results_"""
+        cv_results = searcher.cv_results_
+        n_splits = searcher.n_splits_
+        timings = []
+        
+        for i, params in enumerate(cv_results['params']):
+            fit_time = cv_results['mean_fit_time'][i]
+            score_time = cv_results['mean_score_time'][i]
+            timing = {
+                'params': params,
+                'mean_score': cv_results['mean_test_score'][i],
+                'fit_time': fit_time,
+                'score_time': score_time,
+                'wall_time': (fit_time + score_time) * n_splits
+            }
+            if 'iter' in cv_results:
+                timing['iteration'] = int(cv_results['iter'][i])
+                timing['n_resources'] = int(cv_results['n_resources'][i])
+            timings.append(timing)
+        
+        return timings
+    
+    def predict(self, X) -> np.ndarray:
         """
         Predict resume scores
         
         Args:
-            X: Feature matrix
+            X: Feature matrix, feature dict(s) or array (see prepare_features)
             
         Returns:
             Predicted scores (0-100)
@@ -248,36 +467,126 @@ class ResumeScorer:
         
         return predictions
     
-    def predict_with_confidence(self, X: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    def predict_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[np.ndarray]:
         """
-        Predict scores with confidence intervals (for ensemble models)
+        Predict scores for a stream of feature chunks
         
         Args:
-            X: Feature matrix
+            chunks: Feature matrices, e.g. from ResumeFeatureExtractor.iter_process_dataset
+            
+        Yields:
+            Predicted scores (0-100) for each chunk
+        """
+        for chunk in chunks:
+            yield self.predict(chunk)
+    
+    def create_batcher(self, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> MicroBatcher:
+        """
+        Create a micro-batcher for scoring concurrent single-resume requests
+        
+        Request threads call the batcher with one feature dict each; requests
+        that queue up while a batch is being scored go into the next predict
+        call together, and a request arriving to an idle batcher is scored at once.
+        
+        Args:
+            max_batch_size: Most feature dicts scored together
+            max_wait_ms: Longest extra latency added to a request under load
             
         Returns:
-            Tuple of (predictions, confidence_intervals)
+            MicroBatcher returning one predicted score (0-100) per feature dict
         """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
         
-        predictions = self.predict(X)
+        def score_batch(feature_dicts: List[Dict]) -> np.ndarray:
+            return self.predict(feature_dicts)
         
-        # For ensemble models, we can estimate confidence from individual predictors
-        if self.model_type == 'ensemble':
-            X_processed = self.prepare_features(X)
-            X_scaled = self.model.named_steps['scaler'].transform(X_processed)
+        return MicroBatcher(score_batch, max_batch_size=max_batch_size,
+                            max_wait_ms=max_wait_ms, name='resume-scorer-batcher')
+    
+    def _predict_estimator(self, estimator, X) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Predict with one fitted estimator, returning (predictions, per-tree std)
+        
+        Random forests are evaluated tree by tree, so their mean prediction and
+        spread across trees come from the same pass.
+        """
+        if isinstance(estimator, RandomForestRegressor):
+            X_tree = X.astype(np.float32) if sparse.issparse(X) else np.asarray(X, dtype=np.float32)
+            if sparse.issparse(X_tree):
+                X_tree = X_tree.tocsr()
+            tree_preds = np.stack([
+                tree.predict(X_tree, check_input=False) for tree in estimator.estimators_
+            ])
+            return tree_preds.mean(axis=0), tree_preds.std(axis=0)
+        
+        return estimator.predict(X), None
+    
+    def predict_breakdown(self, X: pd.DataFrame) -> Dict:
+        """
+        Predict scores in a single pass over the preprocessed matrix
+        
+        Args:
+            X: Feature matrix
             
-            # Get predictions from individual models
-            individual_preds = []
-            for name, estimator in self.model.named_steps['model'].estimators_:
-                pred = estimator.predict(X_scaled)
-                individual_preds.append(pred)
+        Returns:
+            Dictionary with the clipped 'prediction', raw per-member
+            predictions under 'members' (ensemble only) and the per-tree
+            standard deviation of the random forest under 'tree_std' (None
+            if the model has no random forest)
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
+        
+        X_processed = self.prepare_features(X)
+        
+        # Run the preprocessing steps once
+        final_estimator = self.model.steps[-1][1]
+        X_transformed = self.model[:-1].transform(X_processed) if len(self.model.steps) > 1 else X_processed
+        
+        members = {}
+        tree_std = None
+        
+        if isinstance(final_estimator, VotingRegressor):
+            member_preds = []
+            for name, estimator in final_estimator.named_estimators_.items():
+                pred, std = self._predict_estimator(estimator, X_transformed)
+                members[name] = pred
+                member_preds.append(pred)
+                if std is not None:
+                    tree_std = std
+            prediction = np.average(np.column_stack(member_preds), axis=1,
+                                    weights=final_estimator.weights)
+        else:
+            prediction, tree_std = self._predict_estimator(final_estimator, X_transformed)
+        
+        return {
+            'prediction': np.clip(prediction, 0, 100),
+            'members': members,
+            'tree_std': tree_std
+        }
+    
+    def predict_with_confidence(self, X: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict scores with confidence intervals (for ensemble models)
+        
+        Args:
+            X: Feature matrix
             
-            # Calculate standard deviation as confidence measure
-            confidence = np.std(individual_preds, axis=0)
+        Returns:
+            Tuple of (predictions, confidence_intervals)
+        """
+        breakdown = self.predict_breakdown(X)
+        predictions = breakdown['prediction']
+        
+        if breakdown['members']:
+            # For ensemble models, the spread of the individual predictors
+            confidence = np.std(list(breakdown['members'].values()), axis=0)
+        elif breakdown['tree_std'] is not None:
+            # For random forests, the spread across trees
+            confidence = breakdown['tree_std']
         else:
-            # For non-ensemble models, use a fixed confidence based on validation error
+            # For other models, use a fixed confidence based on validation error
             confidence = np.full(len(predictions), 5.0)  # Default confidence interval
         
         return predictions, confidence
@@ -308,7 +617,7 @@ class ResumeScorer:
         elif hasattr(actual_model, 'estimators_'):
             # Ensemble models
             importance_list = []
-            for name, estimator in actual_model.estimators_:
+            for estimator in actual_model.estimators_:
                 if hasattr(estimator, 'feature_importances_'):
                     importance_list.append(estimator.feature_importances_)
                 elif hasattr(estimator, 'coef_'):
@@ -333,7 +642,7 @@ class ResumeScorer:
         return importance_df
     
     def save_model(self, filepath: str):
-        """Save the trained model"""
+        """Save the trained model as a memory-mappable, checksummed artifact"""
         if not self.is_trained:
             raise ValueError("Model must be trained before saving")
         
@@ -344,12 +653,22 @@ class ResumeScorer:
             'is_trained': self.is_trained
         }
         
-        joblib.dump(model_data, filepath)
+        save_artifact(model_data, filepath, metadata={
+            'model_type': self.model_type,
+            'n_features': len(self.feature_names) if self.feature_names else 0
+        })
         logger.info(f"Model saved to {filepath}")
     
-    def load_model(self, filepath: str):
-        """Load a trained model"""
-        model_data = joblib.load(filepath)
+    def load_model(self, filepath: str, mmap: bool = True):
+        """
+        Load a trained model
+        
+        Args:
+            filepath: Path written by save_model
+            mmap: Memory-map the model arrays so worker processes share one copy
+                (ndarray-backed models only; see utils/artifacts.save_artifact)
+        """
+        model_data = load_artifact(filepath, mmap=mmap)
         
         self.model = model_data['model']
         self.model_type = model_data['model_type']
@@ -358,39 +677,27 @@ class ResumeScorer:
         
         logger.info(f"Model loaded from {filepath}")
     
-    def evaluate_model(self, X: pd.DataFrame, y: pd.Series) -> Dict:
+    def evaluate_model(self, X: pd.DataFrame, y: pd.Series, n_resamples: int = 0,
+                       confidence: float = 0.95) -> Dict:
         """
         Evaluate model performance on test data
         
         Args:
             X: Test features
             y: True scores
+            n_resamples: Bootstrap resamples for confidence intervals (0 = none)
+            confidence: Confidence interval coverage
             
         Returns:
-            Evaluation metrics
+            Evaluation metrics, per-score-band error and, with n_resamples,
+            bootstrap confidence intervals (see utils/metrics.py)
         """
         if not self.is_trained:
             raise ValueError("Model must be trained before evaluation")
         
         predictions = self.predict(X)
         
-        metrics = {
-            'mse': mean_squared_error(y, predictions),
-            'mae': mean_absolute_error(y, predictions),
-            'r2': r2_score(y, predictions),
-            'rmse': np.sqrt(mean_squared_error(y, predictions))
-        }
-        
-        # Score distribution analysis
-        score_diff = predictions - y
-        metrics.update({
-            'mean_error': np.mean(score_diff),
-            'std_error': np.std(score_diff),
-            'max_overestimate': np.max(score_diff),
-            'max_underestimate': np.min(score_diff)
-        })
-        
-        return metrics
+        return evaluate_predictions(y, predictions, n_resamples=n_resamples, confidence=confidence)
 
 if __name__ == "__main__":
     # Example usage
@@ -0,0 +1,351 @@
+import sys
+import json
+import time
+import argparse
+import importlib
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data_processing.feature_extraction import ResumeFeatureExtractor, FEATURE_GROUPS
+from data_processing.ingestion import extract_text, SUPPORTED_EXTENSIONS
+from models.resume_scorer import ResumeScorer
+from training.distill import load_serving_config, serving_model_path
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+# Flask services whose module-level `analyzer` exposes analyze_text(text)
+ANALYZER_MODULES = ['app', 'smart_app', 'intelligent_app']
+
+TEXT_COLUMNS = ['resume_text', 'Resume_str', 'Resume', 'text']
+
+
+def summarize(timings: Sequence[float], docs_per_call: int = 1) -> Dict:
+    """
+    Latency percentiles and throughput from per-call timings in seconds
+
+    Returns:
+        p50/p95/p99/mean in milliseconds per call, docs/sec and call count
+    """
+    timings_ms = np.asarray(timings) * 1000
+    total_s = float(np.sum(timings))
+    return {
+        'calls': len(timings_ms),
+        'docs_per_call': docs_per_call,
+        'p50_ms': float(np.percentile(timings_ms, 50)),
+        'p95_ms': float(np.percentile(timings_ms, 95)),
+        'p99_ms': float(np.percentile(timings_ms, 99)),
+        'mean_ms': float(np.mean(timings_ms)),
+        'docs_per_s': len(timings_ms) * docs_per_call / total_s if total_s > 0 else float('inf')
+    }
+
+
+def load_corpus(source: Optional[str] = None, n_synthetic: int = 200,
+                limit: Optional[int] = None) -> List[str]:
+    """
+    Build a benchmark corpus of resume texts
+
+    Args:
+        source: Directory of PDF/DOCX/TXT resumes, or a CSV/JSON/JSONL/parquet
+            file with a resume text column (optional)
+        n_synthetic: Synthetic resumes from ResumeDataLoader to add
+        limit: Maximum number of real resumes to read
+
+    Returns:
+        Resume texts, real ones first
+    """
+    texts = []
+
+    if source:
+        path = Path(source)
+        if path.is_dir():
+            for file_path in sorted(path.rglob('*')):
+                if limit and len(texts) >= limit:
+                    break
+                suffix = file_path.suffix.lower()
+                try:
+                    if suffix in SUPPORTED_EXTENSIONS:
+                        texts.append(extract_text(str(file_path)))
+                    elif suffix == '.txt':
+                        texts.append(file_path.read_text(errors='ignore'))
+                except Exception as e:
+                    logger.warning(f"Skipping {file_path}: {e}")
+        else:
+            if path.suffix == '.parquet':
+                df = pd.read_parquet(path)
+            elif path.suffix == '.jsonl':
+                df = pd.read_json(path, lines=True)
+            elif path.suffix == '.json':
+                df = pd.read_json(path)
+            else:
+                df = pd.read_csv(path, nrows=limit)
+            column = next((c for c in TEXT_COLUMNS if c in df.columns), None)
+            if column is None:
+                raise ValueError(f"{source} has none of the text columns {TEXT_COLUMNS}")
+            texts.extend(df[column].dropna().astype(str).tolist()[:limit])
+
+    if n_synthetic:
+        from data_processing.data_loader import ResumeDataLoader
+        synthetic = ResumeDataLoader().create_synthetic_dataset(num_samples=n_synthetic)
+        texts.extend(synthetic['resume_text'].tolist())
+
+    texts = [text for text in texts if text and text.strip()]
+    logger.info(f"Benchmark corpus: {len(texts)} resumes")
+    return texts
+
+
+class BenchmarkSuite:
+    """
+    End-to-end latency and throughput benchmarks for resume scoring
+
+    Covers text extraction, each feature extractor group, TF-IDF
+    vectorization, feature vectorization, model prediction and the Flask
+    analyzers' analyze_text, with batched stages timed at several batch sizes.
+    """
+
+    def __init__(self, corpus: List[str], scorer: Optional[ResumeScorer] = None,
+                 feature_extractor: Optional[ResumeFeatureExtractor] = None,
+                 files: Optional[List[str]] = None, batch_sizes: Sequence[int] = (1, 16, 128),
+                 min_calls: int = 30, warmup: int = 3):
+        """
+        Initialize the suite
+
+        Args:
+            corpus: Resume texts
+            scorer: Trained scorer (prediction benchmarks are skipped without one)
+            feature_extractor: Extractor, with fitted vectorizers for the TF-IDF benchmark
+            files: PDF/DOCX files for the extraction benchmark
+            batch_sizes: Batch sizes for vectorization and prediction
+            min_calls: Minimum timed calls per batched benchmark
+            warmup: Untimed calls before each benchmark
+        """
+        if not corpus:
+            raise ValueError("Benchmark corpus is empty")
+
+        self.corpus = corpus
+        self.scorer = scorer
+        self.feature_extractor = feature_extractor or ResumeFeatureExtractor()
+        self.files = files or []
+        self.batch_sizes = batch_sizes
+        self.min_calls = min_calls
+        self.warmup = warmup
+        self.results: Dict[str, Dict] = {}
+
+    def _time_calls(self, name: str, fn: Callable, inputs: List, docs_per_call: int = 1):
+        """Time fn over each input and store the summary under name"""
+        for item in inputs[:self.warmup]:
+            fn(item)
+
+        timings = []
+        for item in inputs:
+            start = time.perf_counter()
+            fn(item)
+            timings.append(time.perf_counter() - start)
+
+        self.results[name] = summarize(timings, docs_per_call)
+
+    def _batches(self, items: List, batch_size: int) -> List[List]:
+        """Consecutive batches cycling over items until min_calls batches exist"""
+        n_calls = max(self.min_calls, len(items) // batch_size)
+        return [
+            [items[(i * batch_size + j) % len(items)] for j in range(batch_size)]
+            for i in range(n_calls)
+        ]
+
+    def bench_extraction(self):
+        """Text extraction from PDF/DOCX files"""
+        if not self.files:
+            logger.info("No resume files given, skipping text extraction benchmark")
+            return
+        self._time_calls('extract_text', extract_text, self.files)
+
+    def bench_feature_groups(self):
+        """Each extractor group, and extract_all_features as a whole, per document"""
+        for group in FEATURE_GROUPS:
+            self._time_calls(f'features/{group}',
+                             getattr(self.feature_extractor, f'extract_{group}_features'), self.corpus)
+        self._time_calls('features/all', self.feature_extractor.extract_all_features, self.corpus)
+
+    def bench_tfidf(self):
+        """TF-IDF transform at each batch size"""
+        if self.feature_extractor.tfidf_vectorizer is None:
+            logger.info("TF-IDF vectorizer not fitted, skipping TF-IDF benchmark")
+            return
+        for batch_size in self.batch_sizes:
+            self._time_calls(f'tfidf[b={batch_size}]', self.feature_extractor.tfidf_vectorizer.transform,
+                             self._batches(self.corpus, batch_size), batch_size)
+
+    def bench_scoring(self):
+        """Feature dict vectorization and model prediction at each batch size"""
+        if self.scorer is None or not self.scorer.is_trained:
+            logger.info("No trained scorer, skipping vectorization and prediction benchmarks")
+            return
+
+        feature_dicts = [
+            self.feature_extractor.extract_selected_features(text, self.scorer.feature_names)
+            for text in self.corpus
+        ]
+        for batch_size in self.batch_sizes:
+            batches = self._batches(feature_dicts, batch_size)
+            self._time_calls(f'vectorize[b={batch_size}]', self.scorer.vectorize, batches, batch_size)
+            arrays = [self.scorer.vectorize(batch) for batch in batches]
+            self._time_calls(f'predict[b={batch_size}]', self.scorer.predict, arrays, batch_size)
+
+    def bench_analyzers(self, modules: Sequence[str] = ANALYZER_MODULES):
+        """analyze_text of each Flask service's analyzer, per document"""
+        if str(PROJECT_ROOT) not in sys.path:
+            sys.path.append(str(PROJECT_ROOT))
+
+        for module_name in modules:
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                logger.warning(f"Skipping analyzer '{module_name}': {e}")
+                continue
+
+            # Per-request info logging is part of the service cost but floods the output
+            logging.getLogger(module.__name__).setLevel(logging.WARNING)
+            self._time_calls(f'analyze/{module_name}', module.analyzer.analyze_text, self.corpus)
+
+    def run(self, include_analyzers: bool = True) -> Dict[str, Dict]:
+        """Run every benchmark and return the summaries by name"""
+        self.bench_extraction()
+        self.bench_feature_groups()
+        self.bench_tfidf()
+        self.bench_scoring()
+        if include_analyzers:
+            self.bench_analyzers()
+        return self.results
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        tolerance: float = 0.25,
+                        metrics: Sequence[str] = ('p50_ms', 'p95_ms')) -> List[Dict]:
+    """
+    Find benchmarks that got slower than the baseline
+
+    Args:
+        results: Current summaries
+        baseline: Stored summaries
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+        metrics: Latency metrics to check
+
+    Returns:
+        One entry per regressed benchmark metric
+    """
+    regressions = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        for metric in metrics:
+            base_value, value = baseline[name].get(metric), current.get(metric)
+            if base_value and value is not None and value > base_value * (1 + tolerance):
+                regressions.append({
+                    'benchmark': name,
+                    'metric': metric,
+                    'baseline': base_value,
+                    'current': value,
+                    'ratio': value / base_value
+                })
+    return regressions
+
+
+def print_results(results: Dict[str, Dict], baseline: Optional[Dict[str, Dict]] = None):
+    """Print benchmark summaries, with the change against a baseline if given"""
+
+    print("\n" + "="*60)
+    print("BENCHMARK RESULTS")
+    print("="*60)
+
+    print(f"\n{'benchmark':<26} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'docs/s':>10} {'vs base':>8}")
+    for name, stats in results.items():
+        change = ''
+        if baseline and name in baseline and baseline[name].get('p50_ms'):
+            change = f"{stats['p50_ms'] / baseline[name]['p50_ms']:.2f}x"
+        print(f"{name:<26} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} "
+              f"{stats['p99_ms']:>9.3f} {stats['docs_per_s']:>10.1f} {change:>8}")
+
+    print("\n" + "="*60)
+
+
+def main():
+    """Run the benchmark suite and check it against a stored baseline"""
+
+    parser = argparse.ArgumentParser(description="Resume scoring latency/throughput benchmarks")
+    parser.add_argument('--model', help="Trained scorer (default: the serving config's interactive model)")
+    parser.add_argument('--config', default='config/model_config.yaml', help="Training config with a serving section")
+    parser.add_argument('--vectorizers', default='models/trained/feature_extractor.joblib',
+                        help="Saved feature extractor vectorizers")
+    parser.add_argument('--corpus', help="Resume directory or dataset file (e.g. data/raw)")
+    parser.add_argument('--files', help="Directory of PDF/DOCX resumes for the extraction benchmark")
+    parser.add_argument('--synthetic', type=int, default=200, help="Synthetic resumes to add to the corpus")
+    parser.add_argument('--limit', type=int, help="Maximum real resumes to read")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 16, 128])
+    parser.add_argument('--no-analyzers', action='store_true', help="Skip the Flask analyzers")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument('--output', help="Optional JSON path for the results")
+    args = parser.parse_args()
+
+    feature_extractor = ResumeFeatureExtractor()
+    if Path(args.vectorizers).exists():
+        feature_extractor.load_vectorizers(args.vectorizers)
+
+    model_path = args.model or str(serving_model_path('models', load_serving_config(args.config), 'interactive'))
+    scorer = None
+    if Path(model_path).exists():
+        scorer = ResumeScorer()
+        scorer.load_model(model_path)
+    else:
+        logger.warning(f"Model not found at {model_path}, skipping scoring benchmarks")
+
+    files = []
+    if args.files:
+        files = [str(p) for p in sorted(Path(args.files).rglob('*')) if p.suffix.lower() in SUPPORTED_EXTENSIONS]
+
+    suite = BenchmarkSuite(
+        load_corpus(args.corpus, n_synthetic=args.synthetic, limit=args.limit),
+        scorer=scorer,
+        feature_extractor=feature_extractor,
+        files=files,
+        batch_sizes=args.batch_sizes
+    )
+    results = suite.run(include_analyzers=not args.no_analyzers)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+    print_results(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2))
+        logger.info(f"Baseline saved to {baseline_path}")
+        return results
+
+    if baseline:
+        regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['benchmark']} {regression['metric']}: "
+                  f"{regression['baseline']:.3f} -> {regression['current']:.3f} ms ({regression['ratio']:.2f}x)")
+        if regressions:
+            sys.exit(1)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
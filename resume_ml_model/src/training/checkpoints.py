@@ -0,0 +1,111 @@
+import sys
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.artifacts import save_artifact, load_artifact, ArtifactIntegrityError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _update_digest(digest, value: Any):
+    """Feed a value into a hash in a type-stable way"""
+    if isinstance(value, pd.DataFrame):
+        digest.update(json.dumps([str(c) for c in value.columns]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(str(value.name).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(str((value.dtype, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Path):
+        digest.update(str(value).encode())
+        if value.is_file():
+            with open(value, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+    elif isinstance(value, bytes):
+        digest.update(value)
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Hash stage inputs: config dicts, DataFrames, arrays, file paths (by content)
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(type(part).__name__.encode())
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    Content-addressed checkpoints for training pipeline stages
+
+    Each stage's output is stored under the hash of its inputs, so a rerun
+    with the same data, code and relevant config loads it instead of
+    recomputing it.
+    """
+
+    def __init__(self, cache_dir: str = "models/checkpoints", enabled: bool = True):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory holding one artifact per stage and key
+            enabled: When False every stage is recomputed and nothing is stored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.last_hit = False
+        if enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, stage: str, key: str) -> Path:
+        """Checkpoint file for a stage and input hash"""
+        return self.cache_dir / f"{stage}-{key[:16]}.joblib"
+
+    def load(self, stage: str, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for a stage checkpoint"""
+        path = self.path(stage, key)
+        if not self.enabled or not path.exists():
+            return False, None
+        try:
+            return True, load_artifact(str(path), mmap=False)
+        except (ArtifactIntegrityError, EOFError, OSError) as e:
+            logger.warning(f"Discarding unreadable checkpoint {path}: {e}")
+            return False, None
+
+    def save(self, stage: str, key: str, value: Any):
+        """Store a stage's output"""
+        if self.enabled:
+            save_artifact(value, str(self.path(stage, key)), metadata={'stage': stage, 'key': key})
+
+    def run(self, stage: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Load a stage's output from its checkpoint, or compute and store it"""
+        hit, value = self.load(stage, key)
+        self.last_hit = hit
+        if hit:
+            logger.info(f"Stage '{stage}': reusing checkpoint {key[:16]}")
+            return value
+
+        logger.info(f"Stage '{stage}': computing ({key[:16]})")
+        value = compute()
+        self.save(stage, key, value)
+        return value
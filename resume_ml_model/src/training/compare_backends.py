@@ -0,0 +1,112 @@
+import sys
+import time
+import pickle
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, r2_score
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.backends import get_backend, list_backends
+from models.resume_scorer import ResumeScorer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def measure_latency(scorer: ResumeScorer, X, n_samples: int = 200) -> Dict:
+    """Time single-row predictions and return p50/p99 latency in milliseconds"""
+    timings = []
+    for i in range(min(n_samples, len(X))):
+        row = X.iloc[[i]] if isinstance(X, pd.DataFrame) else X[i:i + 1]
+        start = time.perf_counter()
+        scorer.predict(row)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'p50_ms': float(np.percentile(timings, 50)),
+        'p99_ms': float(np.percentile(timings, 99))
+    }
+
+
+def compare_backends(X_train: pd.DataFrame, y_train: pd.Series,
+                     X_test: pd.DataFrame, y_test: pd.Series,
+                     backends: Optional[List[str]] = None,
+                     latency_samples: int = 200) -> pd.DataFrame:
+    """
+    Train every backend on the same split and report accuracy and cost
+
+    Returns:
+        One row per backend with R², MAE, fit time, p50/p99 single-row
+        predict latency and pickled model size
+    """
+    rows = []
+    for name in backends or list_backends():
+        backend = get_backend(name)
+        logger.info(f"Benchmarking backend '{name}'...")
+
+        scorer = ResumeScorer(model_type=name)
+        start = time.perf_counter()
+        scorer.train(X_train, y_train, validation_split=0.0, cv_folds=0)
+        fit_time = time.perf_counter() - start
+
+        predictions = scorer.predict(X_test)
+        latency = measure_latency(scorer, X_test, latency_samples)
+
+        rows.append({
+            'backend': name,
+            'r2': r2_score(y_test, predictions),
+            'mae': mean_absolute_error(y_test, predictions),
+            'fit_time_s': fit_time,
+            **latency,
+            'model_size_kb': len(pickle.dumps(scorer.model)) / 1024,
+            'supports_sparse': backend.supports_sparse,
+            'multithreaded': backend.multithreaded
+        })
+
+    return pd.DataFrame(rows).sort_values('r2', ascending=False).reset_index(drop=True)
+
+
+def main():
+    """Compare registered model backends on the training dataset"""
+
+    parser = argparse.ArgumentParser(description="Compare resume scoring model backends")
+    parser.add_argument('--config', default='config/model_config.yaml', help="Training config file")
+    parser.add_argument('--backends', nargs='*', help=f"Backends to compare (default: all of {list_backends()})")
+    parser.add_argument('--latency-samples', type=int, default=200, help="Single-row predictions to time")
+    parser.add_argument('--output', help="Optional CSV path for the comparison table")
+    args = parser.parse_args()
+
+    from training.train_scorer import ResumeModelTrainer
+
+    trainer = ResumeModelTrainer(args.config)
+    _, features_df, targets = trainer.prepare_data()
+    X_train, X_val, X_test, y_train, y_val, y_test = trainer.split_data(features_df, targets)
+
+    results = compare_backends(
+        pd.concat([X_train, X_val]), pd.concat([y_train, y_val]),
+        X_test, y_test,
+        backends=args.backends,
+        latency_samples=args.latency_samples
+    )
+
+    print("\n" + "="*60)
+    print("MODEL BACKEND COMPARISON")
+    print("="*60)
+    print(results.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+    if args.output:
+        results.to_csv(args.output, index=False)
+        logger.info(f"Comparison saved to {args.output}")
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
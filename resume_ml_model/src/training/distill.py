@@ -0,0 +1,263 @@
+import sys
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import yaml
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.neighbors import NearestNeighbors
+from sklearn.preprocessing import StandardScaler
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.resume_scorer import ResumeScorer
+from training.compare_backends import measure_latency
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Model file served for each serving config value
+SERVING_MODEL_FILES = {
+    'teacher': 'resume_scorer.joblib',
+    'student': 'resume_scorer_student.joblib'
+}
+
+# Model served per scoring mode (the 'serving' section of the training config)
+DEFAULT_SERVING = {
+    'interactive_model': 'student',  # 'student' or 'teacher'
+    'batch_model': 'teacher'
+}
+
+
+def load_serving_config(config_path: str = "config/model_config.yaml") -> Dict:
+    """The 'serving' section of a training config, or DEFAULT_SERVING"""
+    try:
+        with open(config_path) as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    return config.get('serving') or dict(DEFAULT_SERVING)
+
+
+def serving_model_path(models_dir: str = "models", serving: Optional[Dict] = None,
+                       mode: str = 'interactive') -> Path:
+    """
+    Model file to load for 'interactive' or 'batch' scoring
+
+    Used by the scoring entry points (training/benchmark.py for
+    interactive, training/evaluate.py for both); the Flask analyzers are
+    rule-based and load no trained scorer. Falls back to the teacher when
+    the configured student hasn't been trained.
+
+    Args:
+        models_dir: Directory holding trained/
+        serving: Serving config (see DEFAULT_SERVING)
+        mode: 'interactive' or 'batch'
+    """
+    serving = DEFAULT_SERVING if serving is None else serving
+    choice = serving.get(f'{mode}_model', 'teacher')
+    if choice not in SERVING_MODEL_FILES:
+        raise ValueError(f"Unknown {mode}_model '{choice}'. Use one of {sorted(SERVING_MODEL_FILES)}")
+    trained_dir = Path(models_dir) / 'trained'
+    path = trained_dir / SERVING_MODEL_FILES[choice]
+    if not path.exists():
+        path = trained_dir / SERVING_MODEL_FILES['teacher']
+    return path
+
+
+class ModelDistiller:
+    """
+    Distill a trained (ensemble) ResumeScorer into a compact student model
+
+    The student is trained on the teacher's predictions over a transfer set
+    made of real and synthetic resumes plus MUNGE-style perturbations of
+    them (Bucila et al., "Model Compression"), so it learns the teacher's
+    function rather than the noisy labels.
+    """
+
+    def __init__(self, teacher: ResumeScorer, student_type: str = 'hgb',
+                 top_k_features: Optional[int] = None, random_state: int = 42):
+        """
+        Initialize the distiller
+
+        Args:
+            teacher: Trained scorer whose predictions become the student's targets
+            student_type: Registered backend for the student ('hgb', 'linear', ...)
+            top_k_features: Train the student on the teacher's k most important
+                features only (None for all features)
+            random_state: Seed for the transfer set augmentation
+        """
+        if not teacher.is_trained:
+            raise ValueError("Teacher model must be trained before distillation")
+
+        self.teacher = teacher
+        self.student_type = student_type
+        self.top_k_features = top_k_features
+        self.random_state = random_state
+        self.student = None
+        self.selected_features: List[str] = []
+
+    def augment(self, X: pd.DataFrame, factor: int = 4, swap_prob: float = 0.5,
+                noise_scale: float = 1.0) -> pd.DataFrame:
+        """
+        Generate synthetic feature rows around the given ones (MUNGE)
+
+        Each copy swaps a random subset of features with the row's nearest
+        neighbour and adds noise proportional to their distance. Binary
+        features are only swapped.
+
+        Args:
+            X: Feature rows to perturb
+            factor: Number of perturbed copies per row
+            swap_prob: Probability of taking each feature from the neighbour
+            noise_scale: Divisor of the neighbour distance used as noise std
+
+        Returns:
+            factor * len(X) new rows with X's columns
+        """
+        if factor <= 0 or len(X) < 2:
+            return X.iloc[:0]
+
+        rng = np.random.RandomState(self.random_state)
+        values = X.fillna(0).astype(float).values
+
+        scaled = StandardScaler().fit_transform(values)
+        _, neighbors = NearestNeighbors(n_neighbors=2).fit(scaled).kneighbors(scaled)
+        partner = values[neighbors[:, 1]]
+
+        binary = np.all(np.isin(values, (0.0, 1.0)), axis=0)
+        spread = np.abs(values - partner) / noise_scale
+
+        copies = []
+        for _ in range(factor):
+            swap = rng.rand(*values.shape) < swap_prob
+            noise = rng.normal(0.0, 1.0, values.shape) * spread
+            noise[:, binary] = 0.0
+            copies.append(np.where(swap, partner + noise, values))
+
+        return pd.DataFrame(np.vstack(copies), columns=X.columns)
+
+    def build_transfer_set(self, X_real: pd.DataFrame, X_synthetic: Optional[pd.DataFrame] = None,
+                           augment_factor: int = 4) -> pd.DataFrame:
+        """
+        Combine real and synthetic features and enlarge them by augmentation
+
+        Returns:
+            Unlabeled feature rows for the teacher to label
+        """
+        frames = [X_real.reset_index(drop=True)]
+        if X_synthetic is not None and len(X_synthetic):
+            frames.append(X_synthetic.reindex(columns=X_real.columns, fill_value=0).reset_index(drop=True))
+
+        base = pd.concat(frames, ignore_index=True)
+        transfer = pd.concat([base, self.augment(base, factor=augment_factor)], ignore_index=True)
+
+        logger.info(f"Transfer set: {len(base)} real/synthetic rows + "
+                    f"{len(transfer) - len(base)} augmented rows")
+        return transfer
+
+    def select_features(self, columns: List[str]) -> List[str]:
+        """The teacher's top_k most important features (all columns if top_k is None)"""
+        if not self.top_k_features:
+            return list(columns)
+
+        importance_df = self.teacher.get_feature_importance()
+        return importance_df['feature'].head(self.top_k_features).tolist()
+
+    def distill(self, X_transfer: pd.DataFrame) -> ResumeScorer:
+        """
+        Label the transfer set with the teacher and fit the student on it
+
+        Returns:
+            The trained student scorer
+        """
+        logger.info(f"Labeling {len(X_transfer)} transfer rows with the teacher...")
+        teacher_scores = self.teacher.predict(X_transfer)
+
+        self.selected_features = self.select_features(list(X_transfer.columns))
+        logger.info(f"Training {self.student_type} student on {len(self.selected_features)} features...")
+
+        self.student = ResumeScorer(model_type=self.student_type, n_jobs=self.teacher.n_jobs)
+        self.student.train(
+            X_transfer[self.selected_features], pd.Series(teacher_scores),
+            validation_split=0.0, cv_folds=0
+        )
+        return self.student
+
+    def fidelity_report(self, X_eval: pd.DataFrame, y_eval: Optional[pd.Series] = None,
+                        latency_samples: int = 200) -> Dict:
+        """
+        Compare the student with the teacher on held-out data
+
+        Returns:
+            Fidelity (student vs teacher R²/MAE), accuracy against the true
+            scores when given, and single-row p50/p99 latency of both models
+        """
+        if self.student is None:
+            raise ValueError("Student must be distilled before reporting fidelity")
+
+        teacher_pred = self.teacher.predict(X_eval)
+        student_pred = self.student.predict(X_eval)
+
+        report = {
+            'student_type': self.student_type,
+            'n_features': len(self.selected_features),
+            'fidelity_r2': r2_score(teacher_pred, student_pred),
+            'fidelity_mae': mean_absolute_error(teacher_pred, student_pred)
+        }
+
+        if y_eval is not None:
+            report.update({
+                'teacher_r2': r2_score(y_eval, teacher_pred),
+                'student_r2': r2_score(y_eval, student_pred),
+                'teacher_mae': mean_absolute_error(y_eval, teacher_pred),
+                'student_mae': mean_absolute_error(y_eval, student_pred)
+            })
+
+        teacher_latency = measure_latency(self.teacher, X_eval, latency_samples)
+        student_latency = measure_latency(self.student, X_eval, latency_samples)
+        report.update({
+            'teacher_p50_ms': teacher_latency['p50_ms'],
+            'teacher_p99_ms': teacher_latency['p99_ms'],
+            'student_p50_ms': student_latency['p50_ms'],
+            'student_p99_ms': student_latency['p99_ms'],
+            'speedup_p50': teacher_latency['p50_ms'] / max(student_latency['p50_ms'], 1e-9)
+        })
+
+        # Batch throughput, as used by the offline scoring path
+        for name, scorer in (('teacher', self.teacher), ('student', self.student)):
+            start = time.perf_counter()
+            scorer.predict(X_eval)
+            elapsed = time.perf_counter() - start
+            report[f'{name}_batch_rows_per_s'] = len(X_eval) / max(elapsed, 1e-9)
+
+        return report
+
+
+def print_distillation_report(report: Dict):
+    """Print a distillation report"""
+
+    print("\n" + "="*60)
+    print("MODEL DISTILLATION RESULTS")
+    print("="*60)
+
+    print(f"\nStudent: {report['student_type']} on {report['n_features']} features")
+    print(f"\nFidelity to teacher:")
+    print(f"  R²: {report['fidelity_r2']:.4f}")
+    print(f"  MAE: {report['fidelity_mae']:.2f}")
+
+    if 'teacher_r2' in report:
+        print(f"\nAccuracy on true scores:")
+        print(f"  Teacher R²: {report['teacher_r2']:.4f}  MAE: {report['teacher_mae']:.2f}")
+        print(f"  Student R²: {report['student_r2']:.4f}  MAE: {report['student_mae']:.2f}")
+
+    print(f"\nSingle-row latency:")
+    print(f"  Teacher p50/p99: {report['teacher_p50_ms']:.2f} / {report['teacher_p99_ms']:.2f} ms")
+    print(f"  Student p50/p99: {report['student_p50_ms']:.2f} / {report['student_p99_ms']:.2f} ms")
+    print(f"  Speedup (p50): {report['speedup_p50']:.1f}x")
+
+    print("\n" + "="*60)
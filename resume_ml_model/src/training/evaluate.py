@@ -1,4 +1,4 @@
- import sys
+import sys
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -6,17 +6,134 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.metrics import classification_report, confusion_matrix
 import joblib
+from joblib import Parallel, delayed
+import argparse
+import json
 import logging
+import time
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.resume_scorer import ResumeScorer
 from data_processing.feature_extraction import ResumeFeatureExtractor
+from training.benchmark import TEXT_COLUMNS
+from training.distill import load_serving_config, serving_model_path
+from utils.metrics import evaluate_predictions, print_metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Model and extractor per worker process, loaded once and reused across shards
+_SHARD_MODELS = {}
+
+def _load_shard_model(model_path: str, feature_extractor_path: str = None):
+    key = (model_path, feature_extractor_path)
+    if key not in _SHARD_MODELS:
+        scorer = ResumeScorer()
+        scorer.load_model(model_path)
+        extractor = ResumeFeatureExtractor()
+        if feature_extractor_path and Path(feature_extractor_path).exists():
+            extractor.load_vectorizers(feature_extractor_path)
+        _SHARD_MODELS[key] = (scorer, extractor)
+    return _SHARD_MODELS[key]
+
+def _score_shard(model_path: str, feature_extractor_path: str, shard: pd.DataFrame,
+                 text_column: str = None) -> np.ndarray:
+    """Predict one shard of a corpus (runs in a joblib worker)"""
+    scorer, extractor = _load_shard_model(model_path, feature_extractor_path)
+    
+    # Precomputed feature columns are scored directly, otherwise features come from the text
+    if all(name in shard.columns for name in scorer.feature_names):
+        return scorer.predict(shard[scorer.feature_names])
+    features = [
+        extractor.extract_selected_features(str(text), scorer.feature_names)
+        for text in shard[text_column]
+    ]
+    return scorer.predict(features)
+
+def load_labeled_corpus(data_path: str) -> pd.DataFrame:
+    """Read a labeled corpus from parquet, feather, JSON/JSONL or CSV"""
+    path = Path(data_path)
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    if path.suffix == '.feather':
+        return pd.read_feather(path)
+    if path.suffix == '.jsonl':
+        return pd.read_json(path, lines=True)
+    if path.suffix == '.json':
+        return pd.read_json(path)
+    return pd.read_csv(path)
+
+def evaluate_corpus(model_path: str, data_path: str, feature_extractor_path: str = None,
+                    label_column: str = 'quality_score', text_column: str = None,
+                    n_jobs: int = -1, n_shards: int = None, n_resamples: int = 1000,
+                    confidence: float = 0.95) -> dict:
+    """
+    Score a large held-out corpus in parallel shards and evaluate it
+    
+    Args:
+        model_path: Path to trained model
+        data_path: Labeled corpus with the model's feature columns, or with
+            resume text to extract them from
+        feature_extractor_path: Fitted vectorizers, needed when scoring text
+            with a model that uses TF-IDF features
+        label_column: True score column
+        text_column: Resume text column (default: first of TEXT_COLUMNS present)
+        n_jobs: Worker processes (-1 = all cores)
+        n_shards: Number of shards (default: 4 per worker)
+        n_resamples: Bootstrap resamples for confidence intervals (0 = none)
+        confidence: Confidence interval coverage
+        
+    Returns:
+        evaluate_predictions() metrics plus scoring throughput
+        
+    Raises:
+        ValueError: No labeled rows, or the corpus has neither the model's
+            feature columns nor a usable text column
+    """
+    corpus = load_labeled_corpus(data_path)
+    if label_column not in corpus.columns:
+        raise ValueError(f"{data_path} has no label column '{label_column}'")
+    corpus = corpus[corpus[label_column].notna()].reset_index(drop=True)
+    if corpus.empty:
+        raise ValueError(f"{data_path} has no rows with a '{label_column}' label")
+    
+    # Check up front how the shards will be scored, rather than failing in a worker
+    scorer, _ = _load_shard_model(model_path, feature_extractor_path)
+    has_features = all(name in corpus.columns for name in scorer.feature_names)
+    if text_column is not None and text_column not in corpus.columns:
+        raise ValueError(f"{data_path} has no text column '{text_column}'")
+    text_column = text_column or next((c for c in TEXT_COLUMNS if c in corpus.columns), None)
+    if not has_features and text_column is None:
+        raise ValueError(
+            f"{data_path} has neither the model's {len(scorer.feature_names)} feature columns "
+            f"nor a text column ({', '.join(TEXT_COLUMNS)}); pass text_column"
+        )
+    workers = joblib.cpu_count() if n_jobs == -1 else max(1, n_jobs)
+    n_shards = min(len(corpus), n_shards or workers * 4)
+    shards = np.array_split(np.arange(len(corpus)), n_shards)
+    
+    logger.info(f"Scoring {len(corpus)} resumes in {n_shards} shards on {workers} worker(s)...")
+    start = time.perf_counter()
+    predictions = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_score_shard)(model_path, feature_extractor_path, corpus.iloc[shard], text_column)
+        for shard in shards
+    )
+    predictions = np.concatenate(predictions)
+    scoring_s = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    metrics = evaluate_predictions(
+        corpus[label_column].to_numpy(dtype=float), predictions,
+        n_resamples=n_resamples, confidence=confidence
+    )
+    metrics['scoring_s'] = scoring_s
+    metrics['rows_per_s'] = len(corpus) / scoring_s if scoring_s > 0 else float('inf')
+    metrics['metrics_s'] = time.perf_counter() - start
+    
+    return metrics
+
 class ModelEvaluator:
     """
     Comprehensive evaluation of trained resume scoring model
@@ -160,11 +277,12 @@ class ModelEvaluator:
         results = {}
         for resume_name, resume_data in test_resumes.items():
             # Extract features
-            features = self.feature_extractor.extract_all_features(resume_data['text'])
-            features_df = pd.DataFrame([features])
+            features = self.feature_extractor.extract_selected_features(
+                resume_data['text'], self.scorer.feature_names
+            )
             
             # Predict score
-            predicted_score = self.scorer.predict(features_df)[0]
+            predicted_score = self.scorer.predict(features)[0]
             expected_min, expected_max = resume_data['expected_range']
             
             # Check if prediction is in expected range
@@ -246,9 +364,10 @@ class ModelEvaluator:
         results = {}
         for case_name, resume_text in edge_cases.items():
             try:
-                features = self.feature_extractor.extract_all_features(resume_text)
-                features_df = pd.DataFrame([features])
-                predicted_score = self.scorer.predict(features_df)[0]
+                features = self.feature_extractor.extract_selected_features(
+                    resume_text, self.scorer.feature_names
+                )
+                predicted_score = self.scorer.predict(features)[0]
                 
                 results[case_name] = {
                     'predicted_score': predicted_score,
@@ -269,45 +388,23 @@ class ModelEvaluator:
         
         return results
     
-    def benchmark_performance(self, n_samples: int = 1000):
-        """Benchmark model prediction performance"""
+    def benchmark_performance(self, n_samples: int = 200, batch_sizes=(1, 16, 128)):
+        """Benchmark feature extraction and prediction latency with the benchmark suite"""
         
-        import time
+        from training.benchmark import BenchmarkSuite, load_corpus, print_results
         
-        logger.info(f"Benchmarking performance with {n_samples} samples...")
-        
-        # Create sample data
-        sample_resume = """
-        John Doe
-        Software Engineer with 5 years experience
-        Skills: Python, JavaScript, React, Node.js
-        Experience: Developed web applications, led team projects
-        Education: Computer Science degree
-        """
+        logger.info(f"Benchmarking performance on {n_samples} synthetic resumes...")
         
-        features = self.feature_extractor.extract_all_features(sample_resume)
-        features_df = pd.DataFrame([features] * n_samples)
+        suite = BenchmarkSuite(
+            load_corpus(n_synthetic=n_samples),
+            scorer=self.scorer,
+            feature_extractor=self.feature_extractor,
+            batch_sizes=batch_sizes
+        )
+        results = suite.run(include_analyzers=False)
+        print_results(results)
         
-        # Time prediction
-        start_time = time.time()
-        predictions = self.scorer.predict(features_df)
-        end_time = time.time()
-        
-        total_time = end_time - start_time
-        time_per_prediction = total_time / n_samples
-        predictions_per_second = n_samples / total_time
-        
-        print(f"\nPerformance Benchmark:")
-        print(f"  Total time: {total_time:.3f} seconds")
-        print(f"  Time per prediction: {time_per_prediction*1000:.2f} ms")
-        print(f"  Predictions per second: {predictions_per_second:.0f}")
-        
-        return {
-            'total_time': total_time,
-            'time_per_prediction': time_per_prediction,
-            'predictions_per_second': predictions_per_second,
-            'n_samples': n_samples
-        }
+        return results
     
     def generate_evaluation_report(self):
         """Generate comprehensive evaluation report"""
@@ -355,9 +452,30 @@ class ModelEvaluator:
 def main():
     """Main evaluation function"""
     
-    # Model paths
-    model_path = "models/trained/resume_scorer.joblib"
-    feature_path = "models/trained/feature_extractor.joblib"
+    parser = argparse.ArgumentParser(description="Evaluate the trained resume scoring model")
+    parser.add_argument('--model', help="Trained model (default: the serving config's model, "
+                        "interactive for 'report', batch for 'corpus')")
+    parser.add_argument('--config', default="config/model_config.yaml", help="Training config with a serving section")
+    parser.add_argument('--feature-extractor', default="models/trained/feature_extractor.joblib",
+                        help="Fitted feature extractor")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('report', help="Sample resumes, feature importance, edge cases and benchmark (default)")
+    
+    corpus_parser = subparsers.add_parser('corpus', help="Score a labeled held-out corpus in parallel shards")
+    corpus_parser.add_argument('data', help="Labeled corpus (parquet, feather, CSV, JSON or JSONL)")
+    corpus_parser.add_argument('--label-column', default='quality_score')
+    corpus_parser.add_argument('--text-column', help="Resume text column, if features must be extracted")
+    corpus_parser.add_argument('--n-jobs', type=int, default=-1, help="Worker processes (-1 = all cores)")
+    corpus_parser.add_argument('--shards', type=int, help="Number of shards (default: 4 per worker)")
+    corpus_parser.add_argument('--resamples', type=int, default=1000, help="Bootstrap resamples (0 = none)")
+    corpus_parser.add_argument('--confidence', type=float, default=0.95)
+    corpus_parser.add_argument('--output', help="Optional JSON path for the metrics")
+    
+    args = parser.parse_args()
+    mode = 'batch' if args.command == 'corpus' else 'interactive'
+    model_path = args.model or str(serving_model_path("models", load_serving_config(args.config), mode))
+    feature_path = args.feature_extractor
     
     # Check if model exists
     if not Path(model_path).exists():
@@ -365,6 +483,28 @@ def main():
         logger.info("Please train the model first using: python src/training/train_scorer.py")
         return
     
+    if args.command == 'corpus':
+        metrics = evaluate_corpus(
+            model_path, args.data, feature_extractor_path=feature_path,
+            label_column=args.label_column, text_column=args.text_column,
+            n_jobs=args.n_jobs, n_shards=args.shards,
+            n_resamples=args.resamples, confidence=args.confidence
+        )
+        
+        print("\n" + "="*60)
+        print("HELD-OUT CORPUS EVALUATION")
+        print("="*60)
+        print_metrics(metrics)
+        print(f"\nScoring: {metrics['scoring_s']:.2f}s ({metrics['rows_per_s']:.0f} resumes/s), "
+              f"metrics: {metrics['metrics_s']:.2f}s")
+        print("="*60)
+        
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(metrics, f, indent=2)
+            logger.info(f"Metrics saved to {args.output}")
+        return metrics
+    
     # Initialize evaluator
     evaluator = ModelEvaluator(model_path, feature_path)
     
@@ -374,4 +514,4 @@ def main():
     return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,350 @@
+import sys
+import json
+import time
+import uuid
+import argparse
+import logging
+import resource
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER = "models/run_ledger.jsonl"
+
+
+def _max_rss_mb() -> float:
+    """Process high-water mark RSS in MB (ru_maxrss is KB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _RSSSampler:
+    """
+    Sample RSS and CPU time of the process and its workers in a background thread
+
+    Worker processes (joblib/loky pools) are found with psutil children(), so
+    persistent workers that never exit during the stage, and so never show up
+    in RUSAGE_CHILDREN, are still counted.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self.peak_children = 0
+        # pid -> [CPU seconds when first seen, CPU seconds when last seen]
+        self.worker_cpu: Dict[int, List[float]] = {}
+        self._stop = threading.Event()
+        self._process = psutil.Process()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        children_rss = 0
+        try:
+            children = self._process.children(recursive=True)
+        except psutil.Error:
+            children = []
+        for child in children:
+            try:
+                with child.oneshot():
+                    children_rss += child.memory_info().rss
+                    times = child.cpu_times()
+            except psutil.Error:
+                # Exited between listing and reading
+                continue
+            cpu = times.user + times.system
+            self.worker_cpu.setdefault(child.pid, [cpu, cpu])[1] = cpu
+
+        self.peak_children = max(self.peak_children, children_rss)
+        self.peak = max(self.peak, self._process.memory_info().rss + children_rss)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def live_worker_cpu(self) -> float:
+        """CPU seconds used during the stage by workers still alive at its end"""
+        try:
+            alive = {child.pid for child in self._process.children(recursive=True)}
+        except psutil.Error:
+            alive = set()
+        return sum(last - first for pid, (first, last) in self.worker_cpu.items() if pid in alive)
+
+    def __enter__(self):
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+class RunLedger:
+    """
+    Record per-stage resource usage of a training run
+
+    Each stage gets wall time, CPU time (including worker processes), peak
+    RSS of the process and its workers and, with trace_memory, the
+    tracemalloc allocation sites that grew most. finish() appends the run as
+    one line of a JSON-lines ledger.
+    """
+
+    def __init__(self, ledger_path: str = DEFAULT_LEDGER, trace_memory: bool = False,
+                 top_allocators: int = 5, run_id: Optional[str] = None, enabled: bool = True):
+        """
+        Initialize the ledger for one run
+
+        Args:
+            ledger_path: Append-only JSON-lines file shared by all runs
+            trace_memory: Record tracemalloc top allocators (slows Python code)
+            top_allocators: Allocation sites kept per stage
+            run_id: Identifier for this run (generated if None)
+            enabled: When False stages are not measured and nothing is written
+        """
+        self.enabled = enabled
+        self.ledger_path = Path(ledger_path)
+        self.trace_memory = trace_memory and enabled
+        self.top_allocators = top_allocators
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+        self.stages: List[Dict] = []
+        self.started_at = datetime.now(timezone.utc).isoformat()
+
+        self._started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measure the enclosed block as one stage
+
+        Yields:
+            The stage record, so callers can attach extra fields (e.g. 'cached')
+        """
+        record = {'stage': name}
+        if not self.enabled:
+            yield record
+            return
+
+        snapshot = tracemalloc.take_snapshot() if self.trace_memory else None
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        children_start = resource.getrusage(resource.RUSAGE_CHILDREN)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        sampler = _RSSSampler() if PSUTIL_AVAILABLE else None
+
+        try:
+            if sampler:
+                with sampler:
+                    yield record
+            else:
+                yield record
+        finally:
+            children_end = resource.getrusage(resource.RUSAGE_CHILDREN)
+            record['wall_s'] = time.perf_counter() - wall_start
+            record['cpu_s'] = time.process_time() - cpu_start
+            # Workers that exited (and were reaped) during the stage
+            record['children_cpu_s'] = (
+                (children_end.ru_utime + children_end.ru_stime)
+                - (children_start.ru_utime + children_start.ru_stime)
+            )
+            if sampler:
+                # plus workers still running, e.g. persistent loky pools
+                record['children_cpu_s'] += sampler.live_worker_cpu()
+                record['peak_rss_mb'] = sampler.peak / (1024 * 1024)
+                record['peak_children_rss_mb'] = sampler.peak_children / (1024 * 1024)
+            else:
+                # Without psutil only the process-lifetime high-water mark is available
+                record['max_rss_mb'] = _max_rss_mb()
+
+            if self.trace_memory:
+                record['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                record['top_allocators'] = self._top_allocators(snapshot)
+
+            self.stages.append(record)
+
+    def _top_allocators(self, start_snapshot) -> List[Dict]:
+        """Allocation sites with the largest growth since the stage started"""
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+        ])
+        stats = snapshot.compare_to(start_snapshot, 'lineno')[:self.top_allocators]
+        return [
+            {
+                'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'size_diff_kb': stat.size_diff / 1024,
+                'count_diff': stat.count_diff
+            }
+            for stat in stats
+        ]
+
+    def add_timings(self, parent: str, timings: Dict[str, Dict]):
+        """Record timings measured elsewhere (e.g. per extractor group) as sub-stages"""
+        if not self.enabled:
+            return
+        for name, timing in timings.items():
+            self.stages.append({'stage': f"{parent}/{name}", **timing})
+
+    def finish(self, metrics: Optional[Dict] = None, config: Optional[Dict] = None) -> Dict:
+        """Append this run to the ledger and return its record"""
+        run = {
+            'run_id': self.run_id,
+            'started_at': self.started_at,
+            'finished_at': datetime.now(timezone.utc).isoformat(),
+            'config': config or {},
+            'metrics': metrics or {},
+            'stages': self.stages
+        }
+        if not self.enabled:
+            return run
+
+        try:
+            self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.ledger_path, 'a') as f:
+                f.write(json.dumps(run, default=str) + '\n')
+        finally:
+            self.close()
+
+        logger.info(f"Run {self.run_id} appended to {self.ledger_path}")
+        return run
+
+    def close(self):
+        """Stop tracemalloc if this ledger started it (safe to call more than once)"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def load_runs(ledger_path: str = DEFAULT_LEDGER) -> List[Dict]:
+    """All runs recorded in a ledger, oldest first"""
+    with open(ledger_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_run(runs: List[Dict], ref: str) -> Dict:
+    """Look up a run by id, id prefix or negative index ('-1' is the latest)"""
+    if ref.lstrip('-').isdigit() and ref.startswith('-'):
+        return runs[int(ref)]
+    matches = [run for run in runs if run['run_id'].startswith(ref)]
+    if len(matches) != 1:
+        raise ValueError(f"Run reference '{ref}' matches {len(matches)} runs")
+    return matches[0]
+
+
+def diff_runs(run_a: Dict, run_b: Dict, threshold: float = 1.5) -> List[Dict]:
+    """
+    Compare two runs stage by stage
+
+    Args:
+        run_a: Baseline run
+        run_b: Run to compare against it
+        threshold: Ratio of run_b to run_a flagged as a regression
+
+    Returns:
+        One row per stage with both values and ratios for wall time,
+        CPU time and peak memory
+    """
+    stages_a = {stage['stage']: stage for stage in run_a['stages']}
+    stages_b = {stage['stage']: stage for stage in run_b['stages']}
+    fields = ['wall_s', 'cpu_s', 'children_cpu_s', 'peak_rss_mb', 'traced_peak_mb']
+
+    rows = []
+    for name in list(stages_a) + [s for s in stages_b if s not in stages_a]:
+        a, b = stages_a.get(name, {}), stages_b.get(name, {})
+        row = {'stage': name, 'regression': False}
+        for field in fields:
+            if field not in a and field not in b:
+                continue
+            value_a, value_b = a.get(field), b.get(field)
+            row[f'{field}_a'], row[f'{field}_b'] = value_a, value_b
+            if value_a and value_b is not None:
+                ratio = value_b / value_a
+                row[f'{field}_ratio'] = ratio
+                # Ignore noise on stages too small to matter
+                if ratio >= threshold and value_b - value_a > (0.05 if field.endswith('_s') else 5.0):
+                    row['regression'] = True
+        rows.append(row)
+
+    return rows
+
+
+def print_diff(run_a: Dict, run_b: Dict, rows: List[Dict]):
+    """Print a run diff as a table"""
+
+    print("\n" + "="*60)
+    print(f"RUN DIFF: {run_a['run_id']} -> {run_b['run_id']}")
+    print("="*60)
+
+    def fmt(value):
+        return '-' if value is None else f"{value:.2f}"
+
+    print(f"\n{'stage':<32} {'wall_s':>16} {'cpu_s':>16} {'peak_mb':>18}")
+    for row in rows:
+        memory_field = 'peak_rss_mb' if 'peak_rss_mb_a' in row or 'peak_rss_mb_b' in row else 'traced_peak_mb'
+        cells = [
+            f"{fmt(row.get(f'{field}_a'))} -> {fmt(row.get(f'{field}_b'))}"
+            for field in ('wall_s', 'cpu_s', memory_field)
+        ]
+        flag = '  <-- regression' if row['regression'] else ''
+        print(f"{row['stage']:<32} {cells[0]:>16} {cells[1]:>16} {cells[2]:>18}{flag}")
+
+    metrics_a, metrics_b = run_a.get('metrics', {}), run_b.get('metrics', {})
+    shared = [key for key in metrics_a if key in metrics_b and isinstance(metrics_a[key], (int, float))]
+    if shared:
+        print(f"\nMetrics:")
+        for key in shared:
+            print(f"  {key}: {metrics_a[key]:.4f} -> {metrics_b[key]:.4f}")
+
+    print("\n" + "="*60)
+
+
+def main():
+    """List runs in the ledger or diff two of them"""
+
+    parser = argparse.ArgumentParser(description="Training run telemetry ledger")
+    parser.add_argument('--ledger', default=DEFAULT_LEDGER, help="Run ledger file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help="List recorded runs")
+
+    diff_parser = subparsers.add_parser('diff', help="Compare two runs stage by stage")
+    diff_parser.add_argument('run_a', nargs='?', default='-2', help="Baseline run id, prefix or index (default: -2)")
+    diff_parser.add_argument('run_b', nargs='?', default='-1', help="Compared run id, prefix or index (default: -1)")
+    diff_parser.add_argument('--threshold', type=float, default=1.5, help="Ratio flagged as a regression")
+
+    args = parser.parse_args()
+    runs = load_runs(args.ledger)
+
+    if args.command == 'list':
+        for run in runs:
+            total = sum(stage.get('wall_s', 0) for stage in run['stages'] if '/' not in stage['stage'])
+            print(f"{run['run_id']}  {run['started_at']}  {total:8.1f}s  {len(run['stages'])} stages")
+        return runs
+
+    run_a, run_b = find_run(runs, args.run_a), find_run(runs, args.run_b)
+    rows = diff_runs(run_a, run_b, threshold=args.threshold)
+    print_diff(run_a, run_b, rows)
+
+    # Non-zero exit lets CI fail on a regression
+    if any(row['regression'] for row in rows):
+        sys.exit(1)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 import os
 import sys
+import time
+import pickle
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
+from typing import Optional, Tuple
 import yaml
 import joblib
+from joblib import Parallel, delayed
+from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.model_selection import train_test_split
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -13,13 +18,99 @@ import seaborn as sns
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from data_processing.data_loader import ResumeDataLoader
+from data_processing.data_loader import ResumeDataLoader, TRAINING_DATASET_FILE
 from data_processing.feature_extraction import ResumeFeatureExtractor
 from models.resume_scorer import ResumeScorer
+from models.backends import list_backends
+from training.distill import (
+    ModelDistiller, print_distillation_report, serving_model_path,
+    SERVING_MODEL_FILES, DEFAULT_SERVING
+)
+from training.checkpoints import StageCache, content_hash
+from training.compare_backends import measure_latency
+from training.telemetry import RunLedger, DEFAULT_LEDGER
+from utils.metrics import print_metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SRC_DIR = Path(__file__).parent.parent
+
+# Source files whose changes invalidate each checkpointed stage. Every stage
+# runs code in this file (prepare_data, split_data, train_model/_train_backend/
+# train_leaderboard, evaluate_model, distill_model), so it is listed for all.
+STAGE_SOURCES = {
+    'prepare_data': ['training/train_scorer.py', 'data_processing/data_loader.py',
+                     'data_processing/feature_extraction.py', 'data_processing/preprocessing.py',
+                     'lexicon/automaton.py', 'lexicon/terms.py'],
+    'split': ['training/train_scorer.py'],
+    'train': ['training/train_scorer.py', 'models/resume_scorer.py', 'models/backends.py',
+              'training/compare_backends.py', 'utils/metrics.py'],
+    'evaluate': ['training/train_scorer.py', 'utils/metrics.py'],
+    'distill': ['training/train_scorer.py', 'training/distill.py', 'models/resume_scorer.py',
+                'models/backends.py', 'training/compare_backends.py']
+}
+
+def _train_backend(model_type: str, feature_names: list, X_train: np.ndarray, y_train: np.ndarray,
+                   X_val: np.ndarray, y_val: np.ndarray) -> dict:
+    """
+    Train one backend and score it on the validation split (runs in a worker process)
+    
+    Latency is not measured here: the other backends are still fitting on
+    the same cores, so the parent times every scorer once all fits are done.
+    """
+    scorer = ResumeScorer(model_type=model_type, n_jobs=1)
+    scorer.feature_names = list(feature_names)
+    
+    start = time.perf_counter()
+    scorer.train(X_train, y_train, validation_split=0.0, cv_folds=0)
+    fit_time = time.perf_counter() - start
+    
+    predictions = scorer.predict(X_val)
+    
+    return {
+        'backend': model_type,
+        'val_r2': r2_score(y_val, predictions),
+        'val_mae': mean_absolute_error(y_val, predictions),
+        'fit_time_s': fit_time,
+        'artifact_kb': len(pickle.dumps(scorer.model)) / 1024,
+        'scorer': scorer
+    }
+
+
+def promote_backend(leaderboard: pd.DataFrame, rule: str = 'accuracy',
+                    r2_tolerance: float = 0.01, max_p99_ms: float = None) -> str:
+    """
+    Choose the winning backend from a leaderboard
+    
+    Args:
+        leaderboard: One row per backend with val_r2 and p50_ms/p99_ms
+        rule: 'accuracy' (best validation R²), 'tolerance' (fastest p50 among
+            backends within r2_tolerance of the best R²) or 'latency_budget'
+            (best R² among backends with p99 <= max_p99_ms)
+        
+    Returns:
+        Name of the promoted backend
+    """
+    if rule == 'accuracy':
+        candidates = leaderboard
+    elif rule == 'tolerance':
+        best_r2 = leaderboard['val_r2'].max()
+        candidates = leaderboard[leaderboard['val_r2'] >= best_r2 - r2_tolerance]
+        return candidates.sort_values('p50_ms').iloc[0]['backend']
+    elif rule == 'latency_budget':
+        if max_p99_ms is None:
+            raise ValueError("latency_budget promotion needs max_p99_ms")
+        candidates = leaderboard[leaderboard['p99_ms'] <= max_p99_ms]
+        if candidates.empty:
+            logger.warning(f"No backend meets p99 <= {max_p99_ms} ms, promoting the fastest")
+            return leaderboard.sort_values('p99_ms').iloc[0]['backend']
+    else:
+        raise ValueError(f"Unknown promotion rule: {rule}")
+    
+    return candidates.sort_values('val_r2', ascending=False).iloc[0]['backend']
+
+
 class ResumeModelTrainer:
     """
     Main trainer class for resume analysis model
@@ -35,6 +126,7 @@ class ResumeModelTrainer:
         self.data_loader = ResumeDataLoader()
         self.feature_extractor = ResumeFeatureExtractor()
         self.scorer = None
+        self.student = None
         
         # Paths
         self.data_dir = Path("data")
@@ -59,27 +151,68 @@ class ResumeModelTrainer:
                 'synthetic_samples': 2000,
                 'test_size': 0.2,
                 'validation_size': 0.2,
-                'random_state': 42
+                'random_state': 42,
+                # Drop resumes at least this similar to an earlier one (None = exact
+                # duplicates only). Keep it off for synthetic-only data: resumes
+                # generated from the same template are near-duplicates by design.
+                'near_duplicate_threshold': None
             },
             'model': {
-                'type': 'ensemble',  # 'rf', 'gbm', 'ensemble', 'linear'
+                'type': 'ensemble',  # any registered backend, see models/backends.py
                 'hyperparameter_tuning': True,
-                'cross_validation_folds': 5
+                'search_strategy': 'halving',  # 'grid' or 'halving'
+                'halving_resource': 'n_samples',  # 'n_samples' or 'n_estimators'
+                'cross_validation_folds': 5,
+                'leaderboard': {
+                    'enabled': False,  # train every backend concurrently and promote the winner
+                    'backends': None,  # None = all registered backends
+                    'max_workers': -1,
+                    'latency_samples': 200,
+                    'promotion_rule': 'accuracy',  # 'accuracy', 'tolerance' or 'latency_budget'
+                    'r2_tolerance': 0.01,
+                    'max_p99_ms': None
+                }
             },
             'features': {
                 'max_tfidf_features': 1000,
                 'include_text_features': True,
                 'feature_selection': False,
-                'feature_selection_k': 100
+                'feature_selection_k': 100,
+                'feature_selection_method': 'univariate'  # 'univariate' or 'model'
+            },
+            'distillation': {
+                'enabled': False,
+                'student_type': 'hgb',  # any registered backend; 'linear' is fastest
+                'top_k_features': 50,
+                'synthetic_samples': 2000,
+                'augment_factor': 4
+            },
+            'serving': dict(DEFAULT_SERVING),
+            'evaluation': {
+                'bootstrap_resamples': 1000,  # 0 disables confidence intervals
+                'confidence': 0.95
             },
             'training': {
                 'save_model': True,
                 'save_features': True,
                 'create_plots': True,
-                'verbose': True
+                'verbose': True,
+                'checkpoints': True,  # reuse stage outputs whose inputs are unchanged
+                'checkpoint_dir': 'models/checkpoints',
+                'telemetry': True,  # per-stage time/memory, see training/telemetry.py
+                'trace_memory': False,  # tracemalloc allocation sites (slows training)
+                'ledger_path': 'models/run_ledger.jsonl'
             }
         }
     
+    def existing_dataset_file(self) -> Optional[Path]:
+        """Processed training dataset on disk, if one has been created"""
+        processed_dir = self.data_dir / "processed"
+        for filename in [TRAINING_DATASET_FILE, 'training_dataset.csv']:
+            if (processed_dir / filename).exists():
+                return processed_dir / filename
+        return None
+    
     def prepare_data(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
         """
         Prepare training data
@@ -89,15 +222,19 @@ class ResumeModelTrainer:
         """
         logger.info("Preparing training data...")
         
-        # Load or create dataset
-        processed_data_path = self.data_dir / "processed" / "training_dataset.csv"
+        # Load or create dataset, reading only the columns training needs
+        existing_file = self.existing_dataset_file()
         
-        if processed_data_path.exists():
-            logger.info("Loading existing training dataset...")
-            training_data = pd.read_csv(processed_data_path)
+        if existing_file:
+            logger.info(f"Loading existing training dataset from {existing_file.name}...")
+            training_data = self.data_loader.load_processed_data(
+                existing_file.name, columns=['resume_id', 'resume_text', 'quality_score']
+            )
         else:
             logger.info("Creating new training dataset...")
-            training_data = self.data_loader.create_training_dataset()
+            training_data = self.data_loader.create_training_dataset(
+                near_duplicate_threshold=self.config['data'].get('near_duplicate_threshold')
+            )
         
         if training_data.empty:
             raise ValueError("No training data available")
@@ -116,6 +253,10 @@ class ResumeModelTrainer:
         
         logger.info(f"Feature extraction complete: {features_df.shape[1]} features")
         
+        # Keep ids out of the model's feature columns
+        if 'resume_id' in features_df.columns:
+            features_df = features_df.set_index('resume_id')
+        
         return training_data, features_df, targets
     
     def split_data(self, features_df: pd.DataFrame, targets: pd.Series) -> Tuple:
@@ -158,16 +299,39 @@ class ResumeModelTrainer:
         """
         model_config = self.config['model']
         
+        if model_config.get('leaderboard', {}).get('enabled', False):
+            return self.train_leaderboard(X_train, y_train, X_val, y_val)
+        
         # Initialize scorer
         self.scorer = ResumeScorer(model_type=model_config['type'])
         
+        # Fit feature selection on the training split only
+        features_config = self.config.get('features', {})
+        if features_config.get('feature_selection', False):
+            self.scorer.select_features(
+                X_train, y_train,
+                k=features_config.get('feature_selection_k', 100),
+                method=features_config.get('feature_selection_method', 'univariate')
+            )
+        
         if model_config['hyperparameter_tuning'] and model_config['type'] != 'ensemble':
             logger.info("Performing hyperparameter tuning...")
-            tuning_results = self.scorer.hyperparameter_tuning(X_train, y_train)
+            tuning_results = self.scorer.hyperparameter_tuning(
+                X_train, y_train,
+                search=model_config.get('search_strategy', 'grid'),
+                resource=model_config.get('halving_resource', 'n_samples')
+            )
             logger.info(f"Best hyperparameters: {tuning_results.get('best_params', {})}")
+            timings = {'hyperparameter_search': {'wall_s': tuning_results.get('search_time', 0.0)}}
         else:
             logger.info("Training model with default parameters...")
-            training_results = self.scorer.train(X_train, y_train, validation_split=0.0)
+            training_results = self.scorer.train(
+                X_train, y_train, validation_split=0.0,
+                cv_folds=model_config.get('cross_validation_folds', 5)
+            )
+            timings = {'model_fit': training_results['timings']['fit']}
+            for fold, timing in enumerate(training_results['timings'].get('cv_folds', [])):
+                timings[f'cv_fold_{fold}'] = timing
         
         # Evaluate on validation set
         val_metrics = self.scorer.evaluate_model(X_val, y_val)
@@ -175,7 +339,76 @@ class ResumeModelTrainer:
         
         return {
             'validation_metrics': val_metrics,
-            'model_type': model_config['type']
+            'model_type': model_config['type'],
+            'timings': timings
+        }
+    
+    def train_leaderboard(self, X_train: pd.DataFrame, y_train: pd.Series,
+                          X_val: pd.DataFrame, y_val: pd.Series) -> dict:
+        """
+        Train several backends concurrently and promote the winner
+        
+        Backends train in a process pool over one shared feature matrix
+        (memory-mapped into the workers), with default hyperparameters.
+        Latency is measured afterwards in this process, one backend at a time.
+        
+        Returns:
+            Training results with the winner's validation metrics and the leaderboard
+        """
+        config = self.config['model']['leaderboard']
+        backends = config.get('backends') or list_backends()
+        
+        # Feature selection (if enabled) is fitted once and shared by every backend
+        selector = ResumeScorer(model_type=backends[0])
+        features_config = self.config.get('features', {})
+        if features_config.get('feature_selection', False):
+            selector.select_features(
+                X_train, y_train,
+                k=features_config.get('feature_selection_k', 100),
+                method=features_config.get('feature_selection_method', 'univariate')
+            )
+        X_train_matrix = selector.prepare_features(X_train).astype(float)
+        X_val_matrix = selector.prepare_features(X_val).astype(float)
+        if hasattr(X_train_matrix, 'toarray'):
+            X_train_matrix, X_val_matrix = X_train_matrix.toarray(), X_val_matrix.toarray()
+        feature_names = selector.feature_names
+        
+        logger.info(f"Training {len(backends)} backends concurrently: {', '.join(backends)}")
+        entries = Parallel(n_jobs=config.get('max_workers', -1), backend='loky',
+                           max_nbytes='1M', mmap_mode='r')(
+            delayed(_train_backend)(
+                name, feature_names, X_train_matrix, np.asarray(y_train, dtype=float),
+                X_val_matrix, np.asarray(y_val, dtype=float)
+            )
+            for name in backends
+        )
+        
+        scorers = {entry['backend']: entry.pop('scorer') for entry in entries}
+        
+        # Time predictions serially here, after every fit has finished, so no
+        # backend is measured while others compete for the CPU
+        logger.info("Measuring single-row latency...")
+        for entry in entries:
+            entry.update(measure_latency(scorers[entry['backend']], X_val_matrix,
+                                         config.get('latency_samples', 200)))
+        leaderboard = pd.DataFrame(entries).sort_values('val_r2', ascending=False).reset_index(drop=True)
+        
+        winner = promote_backend(
+            leaderboard,
+            rule=config.get('promotion_rule', 'accuracy'),
+            r2_tolerance=config.get('r2_tolerance', 0.01),
+            max_p99_ms=config.get('max_p99_ms')
+        )
+        logger.info(f"Promoted backend: {winner}")
+        
+        self.scorer = scorers[winner]
+        self.scorer.n_jobs = -1
+        val_metrics = self.scorer.evaluate_model(X_val, y_val)
+        
+        return {
+            'validation_metrics': val_metrics,
+            'model_type': winner,
+            'leaderboard': leaderboard
         }
     
     def evaluate_model(self, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
@@ -187,7 +420,12 @@ class ResumeModelTrainer:
         """
         logger.info("Evaluating model on test set...")
         
-        test_metrics = self.scorer.evaluate_model(X_test, y_test)
+        evaluation_config = self.config.get('evaluation', {})
+        test_metrics = self.scorer.evaluate_model(
+            X_test, y_test,
+            n_resamples=evaluation_config.get('bootstrap_resamples', 0),
+            confidence=evaluation_config.get('confidence', 0.95)
+        )
         predictions = self.scorer.predict(X_test)
         
         # Additional analysis
@@ -204,6 +442,48 @@ class ResumeModelTrainer:
         
         return test_metrics, predictions
     
+    def distill_model(self, X_train: pd.DataFrame, X_test: pd.DataFrame,
+                      y_test: pd.Series) -> dict:
+        """
+        Distill the trained model into a compact student for interactive serving
+        
+        Returns:
+            Distillation report (fidelity to the teacher and latency gain)
+        """
+        config = self.config.get('distillation', {})
+        logger.info("Distilling model into a student...")
+        
+        # Synthetic resumes go through the same (already fitted) feature extractor
+        synthetic_features = None
+        if config.get('synthetic_samples', 0):
+            synthetic_df = self.data_loader.create_synthetic_dataset(num_samples=config['synthetic_samples'])
+            synthetic_features = self.feature_extractor.process_dataset(synthetic_df)
+            synthetic_features = synthetic_features.drop(columns=['resume_id'], errors='ignore')
+        
+        distiller = ModelDistiller(
+            self.scorer,
+            student_type=config.get('student_type', 'hgb'),
+            top_k_features=config.get('top_k_features'),
+            random_state=self.config['data']['random_state']
+        )
+        transfer_set = distiller.build_transfer_set(
+            X_train, synthetic_features, augment_factor=config.get('augment_factor', 4)
+        )
+        self.student = distiller.distill(transfer_set)
+        
+        report = distiller.fidelity_report(X_test, y_test)
+        print_distillation_report(report)
+        
+        return report
+    
+    def serving_model_path(self, mode: str = 'interactive') -> Path:
+        """
+        Model file to serve for 'interactive' or 'batch' scoring
+        
+        Falls back to the teacher when the configured student hasn't been trained.
+        """
+        return serving_model_path(self.models_dir, self.config.get('serving', {}), mode)
+    
     def create_visualizations(self, y_test: pd.Series, predictions: np.ndarray, 
                             test_metrics: dict):
         """Create training and evaluation visualizations"""
@@ -272,6 +552,11 @@ class ResumeModelTrainer:
         model_path = self.models_dir / 'trained' / 'resume_scorer.joblib'
         self.scorer.save_model(str(model_path))
         
+        # Save the distilled student alongside it
+        if self.student is not None:
+            student_path = self.models_dir / 'trained' / SERVING_MODEL_FILES['student']
+            self.student.save_model(str(student_path))
+        
         # Save feature extractor and vectorizers
         if self.config['training']['save_features']:
             feature_path = self.models_dir / 'trained' / 'feature_extractor.joblib'
@@ -284,45 +569,142 @@ class ResumeModelTrainer:
         
         logger.info("Model artifacts saved successfully!")
     
+    def stage_keys(self) -> dict:
+        """
+        Content hash of each pipeline stage's inputs
+        
+        A stage's key covers its upstream stage's key, the config sections it
+        reads and its source files, so e.g. changing model.type reuses the
+        prepared features and splits, and plotting options affect no key.
+        """
+        def sources(stage):
+            return [SRC_DIR / path for path in STAGE_SOURCES.get(stage, [])]
+        
+        features_config = {
+            key: value for key, value in self.config.get('features', {}).items()
+            if not key.startswith('feature_selection')
+        }
+        selection_config = {
+            key: value for key, value in self.config.get('features', {}).items()
+            if key.startswith('feature_selection')
+        }
+        
+        keys = {}
+        keys['prepare_data'] = content_hash(
+            'prepare_data', self.config['data'], features_config,
+            self.existing_dataset_file() or 'synthetic', *sources('prepare_data')
+        )
+        keys['split'] = content_hash('split', keys['prepare_data'], self.config['data'], *sources('split'))
+        keys['train'] = content_hash(
+            'train', keys['split'], self.config['model'], selection_config, *sources('train')
+        )
+        keys['evaluate'] = content_hash(
+            'evaluate', keys['train'], self.config.get('evaluation', {}), *sources('evaluate')
+        )
+        keys['distill'] = content_hash(
+            'distill', keys['train'], self.config.get('distillation', {}), *sources('distill')
+        )
+        return keys
+    
     def run_full_training_pipeline(self):
         """
         Run the complete training pipeline
         """
         logger.info("Starting full training pipeline...")
         
+        training_config = self.config['training']
+        cache = StageCache(
+            training_config.get('checkpoint_dir', 'models/checkpoints'),
+            enabled=training_config.get('checkpoints', False)
+        )
+        keys = self.stage_keys()
+        ledger = RunLedger(
+            training_config.get('ledger_path', DEFAULT_LEDGER),
+            trace_memory=training_config.get('trace_memory', False),
+            enabled=training_config.get('telemetry', False)
+        )
+        
         try:
             # 1. Prepare data
-            training_data, features_df, targets = self.prepare_data()
+            def prepare():
+                training_data, features_df, targets = self.prepare_data()
+                return (training_data, features_df, targets,
+                        self.feature_extractor.tfidf_vectorizer, self.feature_extractor.count_vectorizer)
+            
+            with ledger.stage('prepare_data') as record:
+                (training_data, features_df, targets,
+                 self.feature_extractor.tfidf_vectorizer,
+                 self.feature_extractor.count_vectorizer) = cache.run('prepare_data', keys['prepare_data'], prepare)
+                record['cached'] = cache.last_hit
+            ledger.add_timings('prepare_data', self.feature_extractor.pop_group_timings())
             
             # 2. Split data
-            X_train, X_val, X_test, y_train, y_val, y_test = self.split_data(features_df, targets)
+            with ledger.stage('split') as record:
+                X_train, X_val, X_test, y_train, y_val, y_test = cache.run(
+                    'split', keys['split'], lambda: self.split_data(features_df, targets)
+                )
+                record['cached'] = cache.last_hit
             
             # 3. Train model
-            training_results = self.train_model(X_train, y_train, X_val, y_val)
+            def train():
+                training_results = self.train_model(X_train, y_train, X_val, y_val)
+                return self.scorer, training_results
+            
+            with ledger.stage('train') as record:
+                self.scorer, training_results = cache.run('train', keys['train'], train)
+                record['cached'] = cache.last_hit
+            if not cache.last_hit:
+                ledger.add_timings('train', training_results.get('timings', {}))
             
             # 4. Evaluate model
-            test_metrics, predictions = self.evaluate_model(X_test, y_test)
+            with ledger.stage('evaluate') as record:
+                test_metrics, predictions = cache.run(
+                    'evaluate', keys['evaluate'], lambda: self.evaluate_model(X_test, y_test)
+                )
+                record['cached'] = cache.last_hit
+            
+            # 5. Distill a student for interactive serving
+            distillation_report = None
+            if self.config.get('distillation', {}).get('enabled', False):
+                def distill():
+                    report = self.distill_model(X_train, X_test, y_test)
+                    return self.student, report
+                
+                with ledger.stage('distill') as record:
+                    self.student, distillation_report = cache.run('distill', keys['distill'], distill)
+                    record['cached'] = cache.last_hit
             
-            # 5. Create visualizations
-            self.create_visualizations(y_test, predictions, test_metrics)
+            # 6. Create visualizations
+            with ledger.stage('visualize'):
+                self.create_visualizations(y_test, predictions, test_metrics)
             
-            # 6. Save model artifacts
-            self.save_model_artifacts()
+            # 7. Save model artifacts
+            with ledger.stage('save_artifacts'):
+                self.save_model_artifacts()
             
-            # 7. Print final results
+            # 8. Print final results
             self.print_final_results(training_results, test_metrics)
             
+            ledger.finish(
+                metrics={key: test_metrics[key] for key in ('r2', 'rmse', 'mae') if key in test_metrics},
+                config=self.config
+            )
+            
             logger.info("Training pipeline completed successfully!")
             
             return {
                 'training_results': training_results,
                 'test_metrics': test_metrics,
-                'model_path': str(self.models_dir / 'trained' / 'resume_scorer.joblib')
+                'distillation_report': distillation_report,
+                'model_path': str(self.models_dir / 'trained' / 'resume_scorer.joblib'),
+                'serving_model_path': str(self.serving_model_path('interactive'))
             }
             
         except Exception as e:
             logger.error(f"Training pipeline failed: {str(e)}")
             raise
+        finally:
+            ledger.close()
     
     def print_final_results(self, training_results: dict, test_metrics: dict):
         """Print comprehensive training results"""
@@ -331,14 +713,15 @@ class ResumeModelTrainer:
         print("RESUME SCORING MODEL - TRAINING RESULTS")
         print("="*60)
         
+        if 'leaderboard' in training_results:
+            print(f"\nBackend Leaderboard (validation):")
+            print(training_results['leaderboard'].to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+        
         print(f"\nModel Type: {training_results['model_type']}")
         print(f"Features Used: {len(self.scorer.feature_names)}")
         
         print(f"\nTest Set Performance:")
-        print(f"  R² Score: {test_metrics['r2']:.4f}")
-        print(f"  RMSE: {test_metrics['rmse']:.2f}")
-        print(f"  MAE: {test_metrics['mae']:.2f}")
-        print(f"  Mean Error: {test_metrics['mean_error']:.2f}")
+        print_metrics(test_metrics)
         
         print(f"\nPrediction Statistics:")
         stats = test_metrics['predictions_stats']
@@ -373,19 +756,44 @@ def main():
             'model': {
                 'type': 'ensemble',
                 'hyperparameter_tuning': False,  # Set to True for better results but longer training
-                'cross_validation_folds': 5
+                'search_strategy': 'halving',
+                'halving_resource': 'n_samples',
+                'cross_validation_folds': 5,
+                'leaderboard': {
+                    'enabled': False,  # train every backend concurrently and promote the winner
+                    'backends': None,  # None = all registered backends
+                    'max_workers': -1,
+                    'latency_samples': 200,
+                    'promotion_rule': 'accuracy',  # 'accuracy', 'tolerance' or 'latency_budget'
+                    'r2_tolerance': 0.01,
+                    'max_p99_ms': None
+                }
             },
             'features': {
                 'max_tfidf_features': 1000,
                 'include_text_features': True,
                 'feature_selection': False,
-                'feature_selection_k': 100
+                'feature_selection_k': 100,
+                'feature_selection_method': 'univariate'  # 'univariate' or 'model'
+            },
+            'distillation': {
+                'enabled': False,
+                'student_type': 'hgb',  # any registered backend; 'linear' is fastest
+                'top_k_features': 50,
+                'synthetic_samples': 2000,
+                'augment_factor': 4
             },
+            'serving': dict(DEFAULT_SERVING),
             'training': {
                 'save_model': True,
                 'save_features': True,
                 'create_plots': True,
-                'verbose': True
+                'verbose': True,
+                'checkpoints': True,  # reuse stage outputs whose inputs are unchanged
+                'checkpoint_dir': 'models/checkpoints',
+                'telemetry': True,  # per-stage time/memory, see training/telemetry.py
+                'trace_memory': False,  # tracemalloc allocation sites (slows training)
+                'ledger_path': 'models/run_ledger.jsonl'
             }
         }
         
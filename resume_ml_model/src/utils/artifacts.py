@@ -0,0 +1,154 @@
+import os
+import json
+import hashlib
+import logging
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+
+
+class ArtifactIntegrityError(Exception):
+    """Raised when an artifact does not match its manifest checksum"""
+
+
+# Resolved path -> ((size, mtime_ns), sha256) of files whose checksum matched
+_verified: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def manifest_path(filepath: str) -> Path:
+    """Path of the manifest stored next to an artifact"""
+    return Path(f"{filepath}.manifest.json")
+
+
+def file_sha256(filepath: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def library_versions() -> Dict[str, str]:
+    """Versions of the libraries an artifact depends on"""
+    versions = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'joblib': joblib.__version__
+    }
+    try:
+        import sklearn
+        versions['scikit-learn'] = sklearn.__version__
+    except ImportError:
+        pass
+    return versions
+
+
+def save_artifact(obj: Any, filepath: str, metadata: Optional[Dict] = None) -> Dict:
+    """
+    Save an object uncompressed with a checksummed manifest
+
+    NumPy arrays inside the object are written uncompressed and aligned,
+    so load_artifact can memory-map them and every process loading the
+    file shares one physical copy of those pages. This covers models whose
+    state is plain ndarrays (linear coefficients, scaler statistics, IDF
+    vectors, HistGradientBoosting predictors). Tree models (rf, gbm,
+    ensemble, shallow_rf) are not shared: sklearn's Tree.__setstate__ copies
+    the node arrays into private buffers, so only the read from disk is.
+
+    Returns:
+        The manifest written next to the artifact
+    """
+    joblib.dump(obj, filepath, compress=0)
+
+    manifest = {
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'sha256': file_sha256(filepath),
+        'size_bytes': Path(filepath).stat().st_size,
+        'versions': library_versions(),
+        'metadata': metadata or {}
+    }
+    with open(manifest_path(filepath), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def load_manifest(filepath: str) -> Optional[Dict]:
+    """Read an artifact's manifest, or None for legacy artifacts without one"""
+    path = manifest_path(filepath)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def verify_artifact(filepath: str, manifest: Dict):
+    """
+    Check an artifact against its manifest
+
+    The size is compared on every call. The SHA-256 is computed once per
+    version of the file: later calls in this process (and in workers forked
+    after it) skip hashing while the size and mtime are unchanged.
+
+    Raises:
+        ArtifactIntegrityError: If the size or checksum does not match
+    """
+    stat = os.stat(filepath)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    if stat.st_size != manifest.get('size_bytes', stat.st_size):
+        raise ArtifactIntegrityError(
+            f"Size mismatch for {filepath}: {stat.st_size} bytes, manifest says {manifest['size_bytes']}"
+        )
+
+    key = str(Path(filepath).resolve())
+    if _verified.get(key) == (stamp, manifest['sha256']):
+        return
+
+    if file_sha256(filepath) != manifest['sha256']:
+        raise ArtifactIntegrityError(f"Checksum mismatch for {filepath}")
+    _verified[key] = (stamp, manifest['sha256'])
+
+
+def load_artifact(filepath: str, mmap: bool = True, verify: bool = True) -> Any:
+    """
+    Load an artifact, memory-mapping its arrays read-only
+
+    Args:
+        filepath: Artifact written by save_artifact (or a plain joblib file)
+        mmap: Memory-map arrays instead of reading them into private memory
+        verify: Check the file against its manifest (see verify_artifact)
+
+    Raises:
+        ArtifactIntegrityError: If the size or checksum does not match
+    """
+    manifest = load_manifest(filepath)
+
+    if manifest is None:
+        logger.info(f"No manifest for {filepath}, loading without verification")
+    else:
+        if manifest.get('format_version', 0) > ARTIFACT_FORMAT_VERSION:
+            logger.warning(f"{filepath} uses a newer artifact format ({manifest['format_version']})")
+
+        saved_sklearn = manifest.get('versions', {}).get('scikit-learn')
+        current_sklearn = library_versions().get('scikit-learn')
+        if saved_sklearn and current_sklearn and saved_sklearn != current_sklearn:
+            logger.warning(
+                f"{filepath} was saved with scikit-learn {saved_sklearn}, "
+                f"running {current_sklearn}"
+            )
+
+        if verify:
+            verify_artifact(filepath, manifest)
+
+    return joblib.load(filepath, mmap_mode='r' if mmap else None)
@@ -0,0 +1,149 @@
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Gather concurrent single-item requests into batched calls
+
+    Request threads call submit() (or the batcher itself) with one item. A
+    background thread takes every item already queued, runs batch_fn once
+    over them and hands each caller its own result.
+
+    Batching is adaptive: a request that finds the worker idle and nothing
+    else queued is dispatched at once, so light traffic pays no added
+    latency. Only under load (other items already waiting) does the worker
+    linger up to max_wait_ms, measured from the first item, to fill the
+    batch towards max_batch_size.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                 name: str = 'micro-batcher'):
+        """
+        Initialize the batcher and start its worker thread
+
+        Args:
+            batch_fn: Maps a list of items to a sequence of results in the same order
+            max_batch_size: Largest batch passed to batch_fn
+            max_wait_ms: Longest time the first item of a batch waits for company
+                when other items are already queued
+            name: Worker thread name
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """Queue one item and return a future for its result"""
+        if self._closed.is_set():
+            raise RuntimeError("MicroBatcher is closed")
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item: Any, timeout: Optional[float] = None) -> Any:
+        """Submit one item and wait for its result"""
+        return self.submit(item).result(timeout=timeout)
+
+    def _collect(self) -> List:
+        """
+        Block for the first item and take whatever else is queued; linger for
+        more only if there was something else queued (see the class docstring)
+        """
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # A lone request goes out immediately
+        if len(batch) == 1:
+            return batch
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._collect()
+            if not batch:
+                continue
+
+            # Skip requests whose callers already gave up
+            batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            items = [item for item, _ in batch]
+            try:
+                results = self.batch_fn(items)
+                if len(results) != len(items):
+                    raise ValueError(f"batch_fn returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                logger.error(f"Batch of {len(items)} failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+            with self._stats_lock:
+                self._batches += 1
+                self._items += len(items)
+
+    def stats(self) -> Dict:
+        """Batches run, items scored and mean batch size so far"""
+        with self._stats_lock:
+            return {
+                'batches': self._batches,
+                'items': self._items,
+                'mean_batch_size': self._items / self._batches if self._batches else 0.0
+            }
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop accepting items and wait for queued ones to finish"""
+        self._closed.set()
+        self._worker.join(timeout)
+
+        # Items that raced with close() never reach the worker
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future.cancel()
@@ -1 +1,224 @@
- 
\ No newline at end of file
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Quality bands over the true score: (label, lower bound inclusive, upper bound exclusive)
+SCORE_BANDS: Tuple[Tuple[str, float, float], ...] = (
+    ('poor', 0, 40),
+    ('fair', 40, 60),
+    ('good', 60, 80),
+    ('excellent', 80, float('inf'))
+)
+
+# Largest resample matrix (resamples x rows) materialised at once
+MAX_RESAMPLE_ELEMENTS = 10_000_000
+
+
+def regression_metrics(y_true, y_pred) -> Dict[str, float]:
+    """
+    Point estimates of the regression metrics
+
+    Args:
+        y_true: True scores
+        y_pred: Predicted scores
+
+    Returns:
+        MSE, MAE, RMSE, R² and signed error statistics
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    error = y_pred - y_true
+
+    mse = float(np.mean(error ** 2))
+    sst = float(np.sum((y_true - y_true.mean()) ** 2))
+    return {
+        'mse': mse,
+        'mae': float(np.mean(np.abs(error))),
+        'r2': 1 - float(np.sum(error ** 2)) / sst if sst > 0 else 0.0,
+        'rmse': float(np.sqrt(mse)),
+        'mean_error': float(np.mean(error)),
+        'std_error': float(np.std(error)),
+        'max_overestimate': float(np.max(error)),
+        'max_underestimate': float(np.min(error))
+    }
+
+
+def assign_bands(y_true, bands: Sequence[Tuple[str, float, float]] = SCORE_BANDS) -> np.ndarray:
+    """Index into `bands` of each true score (-1 if it falls in none)"""
+    y_true = np.asarray(y_true, dtype=float)
+    band_ids = np.full(len(y_true), -1, dtype=np.int8)
+    for band_id, (_, lower, upper) in enumerate(bands):
+        band_ids[(y_true >= lower) & (y_true < upper)] = band_id
+    return band_ids
+
+
+def band_metrics(y_true, y_pred, bands: Sequence[Tuple[str, float, float]] = SCORE_BANDS) -> Dict[str, Dict]:
+    """
+    Error per true-score band
+
+    Returns:
+        {band: {'count', 'mae', 'rmse', 'mean_error'}}; bands without samples are omitted
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    error = np.asarray(y_pred, dtype=float) - y_true
+    band_ids = assign_bands(y_true, bands)
+
+    results = {}
+    for band_id, (label, _, _) in enumerate(bands):
+        band_error = error[band_ids == band_id]
+        if len(band_error):
+            results[label] = {
+                'count': int(len(band_error)),
+                'mae': float(np.mean(np.abs(band_error))),
+                'rmse': float(np.sqrt(np.mean(band_error ** 2))),
+                'mean_error': float(np.mean(band_error))
+            }
+    return results
+
+
+def _resample_counts(rng: np.random.Generator, n: int, n_resamples: int) -> np.ndarray:
+    """
+    How often each row is drawn in each resample, as a (n_resamples, n) matrix
+
+    Equivalent to drawing n indices with replacement per resample; a single
+    bincount over offset indices avoids a Python loop over resamples.
+    """
+    idx = rng.integers(0, n, size=(n_resamples, n), dtype=np.int64)
+    idx += (np.arange(n_resamples, dtype=np.int64) * n)[:, None]
+    return np.bincount(idx.ravel(), minlength=n_resamples * n).reshape(n_resamples, n).astype(float)
+
+
+def _resample_statistics(counts: np.ndarray, columns: np.ndarray, n: int, n_bands: int) -> Dict[str, np.ndarray]:
+    """
+    Metrics for a block of resamples from their draw counts
+
+    `columns` holds per-row terms (centred y, its square, |error|, error²,
+    then a band indicator and its |error| per band), so one matrix product
+    gives every resample's sums at once.
+    """
+    sums = counts @ columns
+    sum_y, sum_y2, sum_abs, sse = sums[:, 0], sums[:, 1], sums[:, 2], sums[:, 3]
+    sst = sum_y2 - sum_y ** 2 / n
+
+    stats = {
+        'mae': sum_abs / n,
+        'rmse': np.sqrt(sse / n),
+        'r2': 1 - np.divide(sse, sst, out=np.full_like(sse, np.nan), where=sst > 0)
+    }
+    for band_id in range(n_bands):
+        band_counts = sums[:, 4 + 2 * band_id]
+        band_abs = sums[:, 5 + 2 * band_id]
+        stats[f'band_{band_id}'] = np.divide(band_abs, band_counts, out=np.full_like(band_abs, np.nan),
+                                             where=band_counts > 0)
+    return stats
+
+
+def bootstrap_ci(y_true, y_pred, n_resamples: int = 1000, confidence: float = 0.95,
+                 bands: Sequence[Tuple[str, float, float]] = SCORE_BANDS,
+                 random_state: Optional[int] = 42) -> Dict[str, Dict]:
+    """
+    Percentile bootstrap confidence intervals for MAE, RMSE, R² and per-band MAE
+
+    Resamples are represented as a matrix of per-row draw counts, so every
+    metric of every resample comes out of one matrix product with the
+    per-row error terms. The matrix is built in blocks of at most
+    MAX_RESAMPLE_ELEMENTS entries to bound memory on large corpora.
+
+    Args:
+        y_true: True scores
+        y_pred: Predicted scores
+        n_resamples: Number of bootstrap resamples
+        confidence: Interval coverage, e.g. 0.95
+        bands: True-score bands for the per-band MAE
+        random_state: Seed for the resample indices
+
+    Returns:
+        {metric: {'lower', 'upper', 'std'}} for 'mae', 'rmse', 'r2' and
+        'band_mae/<band>'
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    error = np.asarray(y_pred, dtype=float) - y_true
+    n = len(y_true)
+    if n == 0:
+        raise ValueError("Cannot bootstrap an empty sample")
+
+    band_ids = assign_bands(y_true, bands)
+    abs_error = np.abs(error)
+    y_centred = y_true - y_true.mean()
+    columns = [y_centred, y_centred ** 2, abs_error, error ** 2]
+    for band_id in range(len(bands)):
+        in_band = (band_ids == band_id).astype(float)
+        columns.extend([in_band, in_band * abs_error])
+    columns = np.column_stack(columns)
+
+    rng = np.random.default_rng(random_state)
+    block = max(1, min(n_resamples, MAX_RESAMPLE_ELEMENTS // n))
+
+    blocks = []
+    for start in range(0, n_resamples, block):
+        counts = _resample_counts(rng, n, min(block, n_resamples - start))
+        blocks.append(_resample_statistics(counts, columns, n, len(bands)))
+
+    alpha = (1 - confidence) / 2
+    names = {'mae': 'mae', 'rmse': 'rmse', 'r2': 'r2'}
+    names.update({f'band_{band_id}': f'band_mae/{label}' for band_id, (label, _, _) in enumerate(bands)})
+
+    intervals = {}
+    for key, name in names.items():
+        values = np.concatenate([stats[key] for stats in blocks])
+        values = values[np.isfinite(values)]
+        if not len(values):
+            continue
+        lower, upper = np.quantile(values, [alpha, 1 - alpha])
+        intervals[name] = {'lower': float(lower), 'upper': float(upper), 'std': float(values.std())}
+
+    return intervals
+
+
+def evaluate_predictions(y_true, y_pred, n_resamples: int = 1000, confidence: float = 0.95,
+                         bands: Sequence[Tuple[str, float, float]] = SCORE_BANDS,
+                         random_state: Optional[int] = 42) -> Dict:
+    """
+    Point metrics, per-band error and (if n_resamples > 0) bootstrap intervals
+
+    Returns:
+        regression_metrics() plus 'bands' and 'confidence_intervals'
+    """
+    metrics = regression_metrics(y_true, y_pred)
+    metrics['n_samples'] = int(len(np.asarray(y_true)))
+    metrics['bands'] = band_metrics(y_true, y_pred, bands)
+    if n_resamples:
+        metrics['confidence'] = confidence
+        metrics['n_resamples'] = n_resamples
+        metrics['confidence_intervals'] = bootstrap_ci(
+            y_true, y_pred, n_resamples=n_resamples, confidence=confidence,
+            bands=bands, random_state=random_state
+        )
+    return metrics
+
+
+def print_metrics(metrics: Dict):
+    """Print evaluate_predictions() output as a table"""
+
+    intervals = metrics.get('confidence_intervals', {})
+
+    def interval(name):
+        ci = intervals.get(name)
+        return f"  [{ci['lower']:.3f}, {ci['upper']:.3f}]" if ci else ''
+
+    print(f"\nSamples: {metrics['n_samples']}")
+    if intervals:
+        print(f"{metrics['confidence']:.0%} bootstrap intervals from {metrics['n_resamples']} resamples")
+    for name in ('mae', 'rmse', 'r2'):
+        print(f"  {name.upper():<5} {metrics[name]:>8.3f}{interval(name)}")
+    print(f"  Mean Error: {metrics['mean_error']:.3f}")
+
+    if metrics.get('bands'):
+        print(f"\n  {'band':<10} {'count':>8} {'MAE':>8} {'mean err':>9}")
+        for label, band in metrics['bands'].items():
+            print(f"  {label:<10} {band['count']:>8} {band['mae']:>8.3f} {band['mean_error']:>9.3f}"
+                  f"{interval(f'band_mae/{label}')}")
@@ -1 +1,63 @@
- 
\ No newline at end of file
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet
+
+import nltk
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# NLTK resource name -> path checked with nltk.data.find
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'wordnet': 'corpora/wordnet'
+}
+
+_nltk_lock = threading.Lock()
+_nltk_status: Dict[str, bool] = {}
+
+
+def ensure_nltk_resources(resources: Dict[str, str] = NLTK_RESOURCES) -> bool:
+    """
+    Make NLTK resources available, once per process
+
+    Each resource is looked up locally and only downloaded when missing, so
+    importing several services into one process does not repeat the
+    downloads (nltk.download contacts the index server on every call).
+
+    Returns:
+        True if every resource is available
+    """
+    with _nltk_lock:
+        for name, path in resources.items():
+            if name in _nltk_status:
+                continue
+            try:
+                nltk.data.find(path)
+                _nltk_status[name] = True
+            except LookupError:
+                try:
+                    _nltk_status[name] = bool(nltk.download(name, quiet=True))
+                except Exception as e:
+                    logger.warning(f"Could not download NLTK resource '{name}': {e}")
+                    _nltk_status[name] = False
+        return all(_nltk_status[name] for name in resources)
+
+
+def nltk_status() -> Dict[str, bool]:
+    """Availability of each NLTK resource checked so far"""
+    with _nltk_lock:
+        return dict(_nltk_status)
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str = 'english') -> FrozenSet[str]:
+    """NLTK stopwords, loaded once and shared (empty if unavailable)"""
+    if not ensure_nltk_resources({'stopwords': NLTK_RESOURCES['stopwords']}):
+        return frozenset()
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words(language))
+
@@ -1 +1,128 @@
- 
\ No newline at end of file
+import sys
+import time
+import signal
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from data_processing import ingestion
+from data_processing.ingestion import ResumeIngestionEngine
+from data_processing.data_loader import KAGGLE_RESUME_DTYPES, ResumeDataLoader
+from data_processing.deduplication import NearDuplicateDetector
+from data_processing.preprocessing import segment_resume
+
+
+def _hang_in_c(file_path):
+    """Stand-in for an extractor stuck in C code: SIGALRM cannot reach it"""
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+    time.sleep(60)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="workers must inherit the patched extractor")
+def test_ingestion_kills_worker_hung_past_deadline(tmp_path, monkeypatch):
+    (tmp_path / 'stuck.pdf').write_bytes(b'%PDF-1.4')
+    monkeypatch.setattr(ingestion, 'extract_text', _hang_in_c)
+
+    engine = ResumeIngestionEngine(max_workers=1, timeout=0.5, kill_grace=0.5, memory_limit_mb=None)
+    start = time.monotonic()
+    records = list(engine.iter_records(str(tmp_path)))
+
+    assert time.monotonic() - start < 10
+    assert [record['status'] for record in records] == ['timeout']
+
+
+def test_near_duplicates_found_when_first_bucket_member_differs(monkeypatch):
+    detector = NearDuplicateDetector(threshold=0.75, num_perm=4)
+    detector.bands, detector.rows = 2, 2
+    # All three share band 0; only documents 1 and 2 are similar overall
+    signatures = np.array([[1, 1, 9, 9], [1, 1, 5, 6], [1, 1, 5, 7]], dtype=np.uint64)
+    monkeypatch.setattr(detector, 'signatures', lambda texts: signatures)
+
+    assert detector.find_clusters(['a', 'b', 'c']) == [[1, 2]]
+
+
+def test_remove_near_duplicates_keeps_first_of_each_cluster():
+    base = ' '.join(f"skill{i}" for i in range(100))
+    df = pd.DataFrame({
+        'resume_id': ['r1', 'r2', 'r3'],
+        'resume_text': [base, base + " Also mentors junior engineers.",
+                        "Registered nurse with ten years of intensive care experience and patient advocacy"]
+    })
+    loader = ResumeDataLoader.__new__(ResumeDataLoader)
+
+    result = loader.remove_near_duplicates(df, threshold=0.8)
+
+    assert result['resume_id'].tolist() == ['r1', 'r3']
+    assert loader.duplicate_clusters == [{'kept': 'r1', 'duplicates': ['r2'], 'size': 2}]
+
+
+@pytest.mark.parametrize('filename', ['data.feather', 'data.parquet', 'data.csv'])
+def test_load_processed_data_reads_only_requested_columns(tmp_path, filename):
+    loader = ResumeDataLoader.__new__(ResumeDataLoader)
+    loader.processed_dir = tmp_path
+    df = pd.DataFrame({'resume_id': ['r1', 'r2'], 'resume_text': ['a', 'b'], 'quality_score': [50, 70]})
+    loader.save_processed_data(df, filename)
+
+    result = loader.load_processed_data(filename, columns=['resume_id', 'quality_score', 'missing'])
+
+    assert result.columns.tolist() == ['resume_id', 'quality_score']
+    assert result['quality_score'].tolist() == [50, 70]
+
+
+
+@pytest.mark.parametrize('filename', ['data.csv', 'data.jsonl', 'data.parquet', 'data.feather'])
+def test_streamed_chunks_are_typed_the_same_for_every_format(tmp_path, filename):
+    df = pd.DataFrame({'ID': [1, 2, 3], 'Resume_str': ['a', 'b', 'c'], 'Category': ['HR', 'IT', 'HR']})
+    path = str(tmp_path / filename)
+    if filename.endswith('.csv'):
+        df.to_csv(path, index=False)
+    elif filename.endswith('.jsonl'):
+        df.to_json(path, orient='records', lines=True)
+    elif filename.endswith('.parquet'):
+        df.to_parquet(path)
+    else:
+        df.to_feather(path)
+    loader = ResumeDataLoader.__new__(ResumeDataLoader)
+
+    chunks = list(loader.iter_real_resume_dataset(path, chunksize=2, columns=['Category', 'ID'],
+                                                  dtypes=KAGGLE_RESUME_DTYPES))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    for chunk in chunks:
+        assert chunk.columns.tolist() == ['Category', 'ID']
+        assert isinstance(chunk['Category'].dtype, pd.CategoricalDtype)
+        assert chunk['ID'].dtype == 'int64'
+
+def _section_types(text):
+    return [(section.type, section.heading) for section in segment_resume(text).sections]
+
+
+def test_segmenter_finds_standalone_and_inline_headings():
+    text = ("Jane Doe\njane@example.com\n## Professional Summary\nEngineer.\n"
+            "Work Experience:\nAcme\nSkills: Python, SQL\nLanguages\nEnglish\n")
+
+    assert _section_types(text) == [
+        ('contact', ''), ('summary', 'Professional Summary'), ('experience', 'Work Experience'),
+        ('skills', 'Skills'), ('other', 'Languages')
+    ]
+
+
+@pytest.mark.parametrize('line', [
+    '- Tools: Airflow, Spark',
+    '* Skills: mentoring, hiring',
+    'Experience: 10 years leading data teams',
+    'Technologies: Python, Kafka',
+    'Portfolio: janedoe.dev',
+    'Languages: Python, Go',
+])
+def test_segmenter_keeps_labelled_body_lines_in_their_section(line):
+    text = f"Summary\nData engineer.\n{line}\nExperience\nAcme Corp\n{line}\n"
+
+    assert _section_types(text) == [('summary', 'Summary'), ('experience', 'Experience')]
@@ -0,0 +1,118 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from data_processing.preprocessing import Section
+from lexicon.automaton import KeywordAutomaton, hits_for
+from lexicon.terms import (
+    ACTION_VERBS, EDUCATION_KEYWORDS, EXPERIENCE_KEYWORDS, INDUSTRY_KEYWORDS, LEXICONS,
+    PASSIVE_PHRASES, SOFT_SKILLS, TECH_SKILLS, flatten_groups, get_lexicon
+)
+
+
+def _regex_counts(terms, text):
+    """Counts from the per-term rf'\\b{term}\\b' regexes the automaton replaced"""
+    counts = {}
+    for term in terms:
+        found = len(re.findall(rf'(?<!\w){re.escape(term)}(?!\w)', text.lower()))
+        if found:
+            counts[term] = found
+    return counts
+
+
+def test_automaton_matches_whole_words_only():
+    automaton = KeywordAutomaton({'tech': ['go', 'r', 'java', 'machine learning']})
+    text = "Good Java and JavaScript; Go, R. Machine learnings and machine learning."
+
+    assert automaton.scan(text) == {'tech': {'java': 1, 'go': 1, 'r': 1, 'machine learning': 1}}
+
+
+def test_automaton_matches_terms_with_punctuation():
+    automaton = KeywordAutomaton({'tech': ['c', 'c++', 'c#', 'node.js', 'ci/cd']})
+
+    hits = automaton.scan("C++ and C# services on Node.js, built with CI/CD")
+
+    assert hits['tech'] == {'c++': 1, 'c#': 1, 'node.js': 1, 'ci/cd': 1, 'c': 2}
+
+
+def test_automaton_reports_overlapping_terms_in_every_category():
+    automaton = KeywordAutomaton({
+        'ml': ['machine learning', 'deep learning'],
+        'soft': ['learning'],
+        'lang': ['swift'],
+        'mobile': ['swift']
+    })
+
+    hits = automaton.scan("Deep learning and machine learning in Swift")
+
+    assert hits == {
+        'ml': {'deep learning': 1, 'machine learning': 1},
+        'soft': {'learning': 2},
+        'lang': {'swift': 1},
+        'mobile': {'swift': 1}
+    }
+
+
+def test_lexicon_scan_matches_per_term_regexes():
+    categories = flatten_groups(LEXICONS['smart'])
+    text = ("Led a team building Python, C++ and React apps on AWS (EC2, S3) with Docker; "
+            "responsible for machine learning pipelines in TensorFlow, pandas and Go. "
+            "Strong communication, problem solving and project management.")
+
+    hits = get_lexicon('smart').scan(text)
+
+    for category, terms in categories.items():
+        assert hits.get(category, {}) == _regex_counts(terms, text), category
+
+
+def test_scan_sections_counts_hits_per_section_type():
+    text = "Skills\nPython, SQL\nExperience\nBuilt Python services\nSkills\nDocker\n"
+    first, second, third = text.index('Skills'), text.index('Experience'), text.rindex('Skills')
+    sections = [Section('skills', first, second), Section('experience', second, third),
+                Section('skills', third, len(text))]
+    automaton = KeywordAutomaton({'tech': ['python', 'docker']})
+
+    section_hits = automaton.scan_sections(text, sections)
+
+    assert section_hits == {'skills': {'tech': {'python': 1, 'docker': 1}},
+                            'experience': {'tech': {'python': 1}}}
+    assert hits_for(section_hits, ['skills']) == {'tech': {'python': 1, 'docker': 1}}
+    # No projects section: every section counts
+    assert hits_for(section_hits, ['projects']) == {'tech': {'python': 2, 'docker': 1}}
+
+
+@pytest.mark.parametrize('name', sorted(LEXICONS))
+def test_analyzer_categories_come_from_shared_vocabulary(name):
+    vocabulary = set()
+    for groups in (TECH_SKILLS, SOFT_SKILLS, ACTION_VERBS, INDUSTRY_KEYWORDS,
+                   EXPERIENCE_KEYWORDS, EDUCATION_KEYWORDS, {'passive': PASSIVE_PHRASES}):
+        vocabulary.update(term for terms in groups.values() for term in terms)
+
+    for category, terms in flatten_groups(LEXICONS[name]).items():
+        assert terms and set(terms) <= vocabulary, category
+
+
+@pytest.mark.parametrize('name, category, terms', [
+    ('smart', 'tech/cloud_platforms', ['docker', 'kubernetes', 'terraform', 'ansible']),
+    ('intelligent', 'tech/cloud_aws', ['dynamodb']),
+    ('intelligent', 'verbs/weak', ['assisted', 'responsible for']),
+    ('features', 'verbs', ['collaborated', 'spearheaded']),
+    ('resume_score', 'tech_skills', ['c', 'c++', 'sql', 'node', 'linux', 'windows', 'ai', 'data science']),
+])
+def test_analyzers_keep_terms_they_matched_before_sharing(name, category, terms):
+    assert set(terms) <= set(flatten_groups(LEXICONS[name])[category])
+
+
+def test_views_over_one_group_share_its_terms():
+    assert LEXICONS['smart']['tech']['programming_languages'] is TECH_SKILLS['programming_languages']
+    assert LEXICONS['features']['tech']['data_science'] is LEXICONS['intelligent']['tech']['ml_ai']
+
+
+def test_unknown_lexicon_is_rejected():
+    with pytest.raises(ValueError):
+        get_lexicon('missing')
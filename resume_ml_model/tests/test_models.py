@@ -1 +1,84 @@
- 
\ No newline at end of file
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn.model_selection
+from scipy import sparse
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from models.resume_scorer import ResumeScorer
+
+
+def _features_with_sparse_tfidf():
+    tfidf = sparse.random(6, 4, density=0.3, format='csr', random_state=0)
+    tfidf_df = pd.DataFrame.sparse.from_spmatrix(tfidf, columns=[f'tfidf_{i}' for i in range(4)]).fillna(0.0)
+    dense_df = pd.DataFrame({'word_count': np.arange(6) * 100, 'has_email': [True, False] * 3})
+    # Interleave dense and sparse columns to check column order is kept
+    return pd.concat([tfidf_df.iloc[:, :2], dense_df, tfidf_df.iloc[:, 2:]], axis=1)
+
+
+def test_sparse_backend_gets_csr_without_densifying_tfidf():
+    X = _features_with_sparse_tfidf()
+    scorer = ResumeScorer(model_type='sparse_linear')
+
+    matrix = scorer.prepare_features(X)
+
+    assert sparse.isspmatrix_csr(matrix)
+    assert scorer.feature_names == list(X.columns)
+    np.testing.assert_allclose(matrix.toarray(), X.astype(float).to_numpy(dtype=float))
+
+
+def test_dense_backend_gets_same_values_from_sparse_columns():
+    X = _features_with_sparse_tfidf()
+    dense = ResumeScorer(model_type='linear').prepare_features(X)
+    csr = ResumeScorer(model_type='sparse_linear').prepare_features(X)
+
+    assert isinstance(dense, np.ndarray)
+    np.testing.assert_allclose(dense, csr.toarray())
+
+
+class _SearchStarted(Exception):
+    pass
+
+
+def _halving_arguments(model_type, monkeypatch):
+    """Grid and keyword arguments a halving search would be built with"""
+    captured = {}
+
+    def fake_search(estimator, param_grid, **kwargs):
+        captured.update(kwargs, param_grid=param_grid)
+        raise _SearchStarted()
+
+    monkeypatch.setattr(sklearn.model_selection, 'HalvingGridSearchCV', fake_search)
+    X = pd.DataFrame({'word_count': np.arange(20) * 10.0, 'has_email': [1.0, 0.0] * 10})
+    with pytest.raises(_SearchStarted):
+        ResumeScorer(model_type=model_type).hyperparameter_tuning(
+            X, pd.Series(np.arange(20.0)), search='halving', resource='n_estimators'
+        )
+    return captured
+
+
+@pytest.mark.parametrize('model_type, budget_param, max_budget', [
+    ('rf', 'model__n_estimators', 300),
+    ('hgb', 'model__max_iter', 400),
+])
+def test_halving_estimator_budget_uses_backend_parameter(model_type, budget_param, max_budget, monkeypatch):
+    captured = _halving_arguments(model_type, monkeypatch)
+
+    assert captured['resource'] == budget_param
+    assert captured['max_resources'] == max_budget
+    assert budget_param not in captured['param_grid']
+
+
+def test_halving_estimator_budget_rejected_without_estimator_count():
+    X = pd.DataFrame({'word_count': np.arange(20) * 10.0})
+
+    with pytest.raises(ValueError):
+        ResumeScorer(model_type='linear').hyperparameter_tuning(
+            X, pd.Series(np.arange(20.0)), search='halving', resource='n_estimators'
+        )
@@ -0,0 +1,174 @@
+import sys
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+from starlette.testclient import TestClient
+
+# The service modules live at the project root, next to src/
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+import app
+import async_app
+import engines
+import load_test
+import smart_app
+from sessions import AnalysisSession
+
+
+class _FakeProcess:
+    def terminate(self):
+        pass
+
+    def wait(self, timeout=None):
+        return 0
+
+
+def test_flask_server_runs_worker_sweep_once(monkeypatch):
+    started = []
+
+    def fake_start(service, workers, port, server='flask'):
+        started.append((service, workers))
+        return _FakeProcess()
+
+    def not_ready(base_url, process):
+        raise RuntimeError("not started in tests")
+
+    monkeypatch.setattr(load_test, 'start_service', fake_start)
+    monkeypatch.setattr(load_test, 'wait_until_ready', not_ready)
+
+    load_test.load_test('smart', [1, 2, 4], [1], 0.1, ['text'], server='flask')
+    load_test.load_test('smart', [1, 2], [1], 0.1, ['text'], server='gunicorn')
+    load_test.load_test('async', [1, 2], [1], 0.1, ['text'], server='flask')
+
+    assert started == [('smart', 1), ('smart', 1), ('smart', 2), ('async', 1), ('async', 2)]
+
+
+
+def test_failed_level_reports_no_latency(monkeypatch, capsys):
+    class FailingSession:
+        def post(self, url, json=None, timeout=None):
+            raise load_test.requests.ConnectionError()
+
+    monkeypatch.setattr(load_test.requests, 'Session', FailingSession)
+
+    level = load_test.run_level('http://127.0.0.1:1/analyze-text', ['text'], 1, 0.05)
+    load_test.print_report([{'service': 'smart', 'server': 'flask', 'workers': 1, 'levels': [level],
+                             'saturation_concurrency': None, 'peak_throughput_rps': 0.0}])
+
+    assert level['error_rate'] == 1.0
+    assert level['p50_ms'] is None and level['p95_ms'] is None and level['p99_ms'] is None
+    lines = capsys.readouterr().out.splitlines()
+    row = lines[next(i for i, line in enumerate(lines) if 'clients' in line) + 1].split()
+    assert row[2:5] == ['-', '-', '-']
+
+class _FakeExecutor:
+    """Executor whose submitted work fails as if its worker had died"""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool())
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_pool_restarts_once_when_concurrent_requests_see_broken_worker(monkeypatch):
+    created = []
+
+    def create_executor():
+        created.append(_FakeExecutor())
+        return created[-1]
+
+    pool = async_app.AnalysisPool(2, 4, 1.0, ['smart'])
+    monkeypatch.setattr(pool, '_create_executor', create_executor)
+
+    async def run_both():
+        pool.start()
+        return await asyncio.gather(pool.run(['smart'], 'a'), pool.run(['smart'], 'b'),
+                                    return_exceptions=True)
+
+    results = asyncio.run(run_both())
+
+    assert all(isinstance(result, BrokenProcessPool) for result in results)
+    assert len(created) == 2
+    assert created[0].shut_down and not created[1].shut_down
+    assert pool.executor is created[1]
+
+
+def test_analysis_cancelled_with_its_pool_returns_503(monkeypatch):
+    async def cancelled_run(engines, text):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(async_app.pool, 'run', cancelled_run)
+
+    response = TestClient(async_app.app).post('/analyze-text', json={'text': 'Python developer ' * 10})
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+
+RESUME = """Jane Doe
+jane@example.com | 555-123-4567 | linkedin.com/in/janedoe
+Summary
+Backend engineer with 6 years of experience building data platforms
+Experience
+Senior Engineer, Acme Corp
+- Led a team of 5 engineers building Python services on AWS
+- Reduced latency by 40% and saved $200K per year. Was responsible for on-call.
+- Implemented CI/CD with Docker and Kubernetes
+Skills
+Python, Java, SQL, React, communication, leadership
+Education
+BSc Computer Science, State University
+"""
+
+
+@pytest.mark.parametrize('engine', [app, smart_app])
+def test_session_analysis_matches_full_analysis_after_edits(engine):
+    session = AnalysisSession('smart', engine.analyzer, RESUME)
+    assert session.analysis == engine.analyzer.analyze_text(RESUME)
+
+    recomputed = session.apply_edits([
+        {'section': 'skills', 'text': 'Skills\nPython, Go, Terraform, mentoring. Was a lead.\n'}
+    ])
+
+    assert [session.sections[index][0] for index in recomputed] == ['skills']
+    assert session.analysis == engine.analyzer.analyze_text(session.text)
+
+
+@pytest.mark.parametrize('engine', [app, smart_app])
+def test_contact_section_comes_from_contact_details(engine):
+    with_details = engine.analyzer.ats_stats(RESUME)
+    preamble_only = engine.analyzer.ats_stats("Jane Doe\nBackend engineer\nExperience\nAcme Corp\n")
+    heading_only = engine.analyzer.ats_stats("Experience\nAcme Corp\nContact\njane@example.com\n")
+
+    assert with_details['sections_found']['contact']
+    assert not preamble_only['sections_found']['contact']
+    assert heading_only['sections_found']['contact']
+
+
+def test_ml_engine_is_smart_analyzer_with_contact_details():
+    analysis = app.analyzer.analyze_text(RESUME)
+
+    assert isinstance(app.analyzer, smart_app.SmartResumeAnalyzer)
+    assert analysis['contactInfo']['emails'] == ['jane@example.com']
+    assert 'contactInfo' not in smart_app.analyzer.analyze_text(RESUME)
+
+
+def test_resume_score_engine_runs_through_registry():
+    pytest.importorskip('fitz')
+
+    analyses, _ = engines.run_engines(['resume_score'], RESUME)
+
+    assert 0 <= analyses['resume_score']['score'] <= 10
+    assert 'python' in analyses['resume_score']['keywords']
+    with pytest.raises(ValueError):
+        engines.analyze('resume_score', 'too short')
@@ -1 +1,167 @@
- 
\ No newline at end of file
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from models.resume_scorer import ResumeScorer
+from training import train_scorer
+from training.evaluate import evaluate_corpus
+from training.distill import SERVING_MODEL_FILES, load_serving_config, serving_model_path
+from training.telemetry import PSUTIL_AVAILABLE, RunLedger
+from training.train_scorer import ResumeModelTrainer, SRC_DIR, STAGE_SOURCES
+
+
+def test_serving_model_path_picks_student_for_interactive_and_falls_back(tmp_path):
+    trained = tmp_path / 'trained'
+    trained.mkdir()
+    serving = {'interactive_model': 'student', 'batch_model': 'teacher'}
+
+    assert serving_model_path(tmp_path, serving, 'interactive') == trained / SERVING_MODEL_FILES['teacher']
+
+    (trained / SERVING_MODEL_FILES['student']).touch()
+    assert serving_model_path(tmp_path, serving, 'interactive') == trained / SERVING_MODEL_FILES['student']
+    assert serving_model_path(tmp_path, serving, 'batch') == trained / SERVING_MODEL_FILES['teacher']
+
+    with pytest.raises(ValueError):
+        serving_model_path(tmp_path, {'batch_model': 'tiny'}, 'batch')
+
+
+def test_load_serving_config_reads_serving_section(tmp_path):
+    config = tmp_path / 'model_config.yaml'
+    config.write_text("serving:\n  interactive_model: teacher\n  batch_model: student\n")
+
+    assert load_serving_config(str(config)) == {'interactive_model': 'teacher', 'batch_model': 'student'}
+    assert load_serving_config(str(tmp_path / 'missing.yaml'))['interactive_model'] == 'student'
+
+
+def _trainer(tmp_path):
+    trainer = ResumeModelTrainer.__new__(ResumeModelTrainer)
+    trainer.config = trainer.get_default_config()
+    trainer.data_dir = tmp_path
+    return trainer
+
+
+def test_stage_sources_exist_and_cover_the_trainer():
+    for stage, paths in STAGE_SOURCES.items():
+        for path in paths:
+            assert (SRC_DIR / path).is_file(), f"{stage}: {path} missing"
+        assert 'training/train_scorer.py' in paths
+
+
+def test_stage_keys_follow_source_changes(tmp_path, monkeypatch):
+    source = tmp_path / 'backend.py'
+    source.write_text("VERSION = 1\n")
+    monkeypatch.setattr(train_scorer, 'STAGE_SOURCES', {'train': [str(source)]})
+    trainer = _trainer(tmp_path)
+
+    before = trainer.stage_keys()
+    source.write_text("VERSION = 2\n")
+    after = trainer.stage_keys()
+
+    assert before['prepare_data'] == after['prepare_data']
+    assert before['split'] == after['split']
+    for stage in ('train', 'evaluate', 'distill'):
+        assert before[stage] != after[stage]
+
+
+def test_stage_keys_ignore_plotting_options(tmp_path):
+    trainer = _trainer(tmp_path)
+    before = trainer.stage_keys()
+    trainer.config['training']['create_plots'] = False
+
+    assert trainer.stage_keys() == before
+
+
+def test_leaderboard_latency_is_measured_in_parent_after_fits(tmp_path, monkeypatch):
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.rand(120, 5), columns=[f'f{i}' for i in range(5)])
+    y = pd.Series(X.sum(axis=1) * 20)
+    measured = []
+
+    def fake_latency(scorer, X_eval, n_samples):
+        measured.append((scorer.model_type, os.getpid()))
+        return {'p50_ms': 1.0, 'p99_ms': 2.0}
+
+    monkeypatch.setattr(train_scorer, 'measure_latency', fake_latency)
+    trainer = _trainer(tmp_path)
+    trainer.config['model']['leaderboard'].update(backends=['linear', 'sparse_linear'], max_workers=2)
+
+    results = trainer.train_leaderboard(X[:90], y[:90], X[90:], y[90:])
+
+    assert sorted(measured) == [('linear', os.getpid()), ('sparse_linear', os.getpid())]
+    assert set(results['leaderboard'][['p50_ms', 'p99_ms']].stack()) == {1.0, 2.0}
+
+
+def _spin(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+    return os.getpid()
+
+
+@pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="worker sampling needs psutil")
+def test_ledger_counts_persistent_workers(tmp_path):
+    ledger = RunLedger(str(tmp_path / 'ledger.jsonl'))
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        # Start the workers before the stage, as a persistent pool would be
+        list(pool.map(_spin, [0.0, 0.0]))
+        with ledger.stage('fit') as record:
+            list(pool.map(_spin, [0.3, 0.3]))
+
+    assert record['children_cpu_s'] >= 0.4
+    assert record['peak_children_rss_mb'] > 0
+    assert record['peak_rss_mb'] > record['peak_children_rss_mb']
+
+
+def test_ledger_stops_tracemalloc_even_if_the_run_fails(tmp_path):
+    assert not RunLedger(str(tmp_path / 'ledger.jsonl')).trace_memory
+
+    ledger = RunLedger(str(tmp_path / 'ledger.jsonl'), trace_memory=True)
+    assert tracemalloc.is_tracing()
+    with pytest.raises(RuntimeError):
+        try:
+            with ledger.stage('train'):
+                raise RuntimeError("boom")
+        finally:
+            ledger.close()
+    assert not tracemalloc.is_tracing()
+
+
+def _saved_linear_model(tmp_path):
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.rand(60, 3), columns=['f0', 'f1', 'f2'])
+    y = pd.Series(X.sum(axis=1) * 30)
+    scorer = ResumeScorer(model_type='linear', n_jobs=1)
+    scorer.train(X, y, validation_split=0.0, cv_folds=0)
+    path = str(tmp_path / 'model.joblib')
+    scorer.save_model(path)
+    return path, X.assign(quality_score=y)
+
+
+def test_evaluate_corpus_scores_feature_columns(tmp_path):
+    model_path, corpus = _saved_linear_model(tmp_path)
+    corpus.to_csv(tmp_path / 'corpus.csv', index=False)
+
+    metrics = evaluate_corpus(model_path, str(tmp_path / 'corpus.csv'), n_jobs=1, n_resamples=0)
+
+    assert metrics['n_samples'] == 60
+    assert metrics['r2'] > 0.99
+
+
+def test_evaluate_corpus_rejects_corpus_it_cannot_score(tmp_path):
+    model_path, corpus = _saved_linear_model(tmp_path)
+    corpus[['f0', 'quality_score']].to_csv(tmp_path / 'partial.csv', index=False)
+
+    with pytest.raises(ValueError, match='text column'):
+        evaluate_corpus(model_path, str(tmp_path / 'partial.csv'), n_jobs=1, n_resamples=0)
+    with pytest.raises(ValueError, match="no text column 'body'"):
+        evaluate_corpus(model_path, str(tmp_path / 'partial.csv'), text_column='body', n_jobs=1)
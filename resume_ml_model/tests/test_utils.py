@@ -0,0 +1,127 @@
+import sys
+import time
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from utils import artifacts, metrics
+from utils.artifacts import ArtifactIntegrityError, load_artifact, save_artifact
+from utils.batching import MicroBatcher
+from utils.metrics import SCORE_BANDS, assign_bands, bootstrap_ci, regression_metrics
+
+
+def test_artifact_checksum_is_computed_once_per_file_version(tmp_path, monkeypatch):
+    path = str(tmp_path / 'model.joblib')
+    save_artifact({'coef': np.arange(10.0)}, path)
+    calls = []
+    real_sha256 = artifacts.file_sha256
+    monkeypatch.setattr(artifacts, 'file_sha256', lambda p: calls.append(p) or real_sha256(p))
+
+    first = load_artifact(path)
+    second = load_artifact(path)
+
+    assert len(calls) == 1
+    assert isinstance(first['coef'], np.memmap)
+    np.testing.assert_array_equal(first['coef'], second['coef'])
+
+
+def test_artifact_modified_after_save_is_rejected(tmp_path):
+    path = tmp_path / 'model.joblib'
+    save_artifact({'coef': np.arange(10.0)}, str(path))
+    load_artifact(str(path))
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ArtifactIntegrityError):
+        load_artifact(str(path))
+
+
+def test_batcher_dispatches_lone_request_without_waiting():
+    batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_wait_ms=2000)
+    try:
+        start = time.monotonic()
+        assert batcher(21, timeout=5) == 42
+        assert time.monotonic() - start < 1.0
+    finally:
+        batcher.close()
+
+
+def test_batcher_groups_requests_queued_while_busy():
+    release = threading.Event()
+    sizes = []
+
+    def batch_fn(items):
+        sizes.append(len(items))
+        release.wait(5)
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+    try:
+        first = batcher.submit(0)
+        while not sizes:
+            time.sleep(0.01)
+        # These queue while the worker is busy with the first item
+        rest = [batcher.submit(i) for i in range(1, 6)]
+        release.set()
+
+        assert [f.result(timeout=5) for f in [first] + rest] == list(range(6))
+        assert sizes == [1, 5]
+    finally:
+        batcher.close()
+
+
+def _naive_bootstrap(y_true, y_pred, n_resamples, confidence, random_state):
+    """One resample at a time, straight from the definitions"""
+    rng = np.random.default_rng(random_state)
+    band_ids = assign_bands(y_true)
+    values = {'mae': [], 'rmse': [], 'r2': []}
+    values.update({f'band_mae/{label}': [] for label, _, _ in SCORE_BANDS})
+    for _ in range(n_resamples):
+        idx = rng.integers(0, len(y_true), size=len(y_true))
+        metrics = regression_metrics(y_true[idx], y_pred[idx])
+        for name in ('mae', 'rmse', 'r2'):
+            values[name].append(metrics[name])
+        error = np.abs(y_pred[idx] - y_true[idx])
+        for band_id, (label, _, _) in enumerate(SCORE_BANDS):
+            in_band = band_ids[idx] == band_id
+            if in_band.any():
+                values[f'band_mae/{label}'].append(error[in_band].mean())
+    alpha = (1 - confidence) / 2
+    return {
+        name: dict(zip(('lower', 'upper'), np.quantile(v, [alpha, 1 - alpha])))
+        for name, v in values.items() if v
+    }
+
+
+def test_bootstrap_ci_matches_naive_resampling_loop():
+    rng = np.random.default_rng(0)
+    y_true = rng.uniform(0, 100, 300)
+    y_pred = y_true + rng.normal(0, 8, 300)
+
+    fast = bootstrap_ci(y_true, y_pred, n_resamples=200, confidence=0.9, random_state=7)
+    naive = _naive_bootstrap(y_true, y_pred, 200, 0.9, random_state=7)
+
+    assert set(fast) == set(naive)
+    for name, interval in naive.items():
+        assert fast[name]['lower'] == pytest.approx(interval['lower'])
+        assert fast[name]['upper'] == pytest.approx(interval['upper'])
+
+
+def test_bootstrap_ci_blocks_give_valid_intervals(monkeypatch):
+    monkeypatch.setattr(metrics, 'MAX_RESAMPLE_ELEMENTS', 1000)
+    rng = np.random.default_rng(1)
+    y_true = rng.uniform(0, 100, 400)
+    y_pred = y_true + rng.normal(0, 5, 400)
+
+    intervals = bootstrap_ci(y_true, y_pred, n_resamples=50)
+    point = regression_metrics(y_true, y_pred)
+
+    for name in ('mae', 'rmse', 'r2'):
+        assert intervals[name]['lower'] <= point[name] <= intervals[name]['upper']
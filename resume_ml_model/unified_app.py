@@ -0,0 +1,208 @@
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+import os
+import time
+import logging
+import traceback
+
+from engines import DEFAULT_ENGINE, get_analyzer, parse_engines, run_engines, preload, engine_status
+from lexicon.terms import get_lexicon
+from utils.text_utils import nltk_status
+from sessions import AnalysisSession, SessionStore, supports_incremental
+
+app = Flask(__name__)
+CORS(app)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Engines imported at startup (comma-separated, or 'all'); the rest load on first request
+PRELOAD_ENGINES = os.environ.get('PRELOAD_ENGINES', DEFAULT_ENGINE)
+
+sessions = SessionStore()
+
+@app.route('/', methods=['GET'])
+def health_check():
+    status = {
+        'status': 'healthy',
+        'service': 'Unified Resume Analysis API',
+        'version': '1.0.0',
+        'default_engine': DEFAULT_ENGINE,
+        'engines': engine_status(),
+        'shared_resources': {
+            'nltk': nltk_status(),
+            'compiled_lexicons': get_lexicon.cache_info().currsize
+        },
+        'active_sessions': len(sessions)
+    }
+    if status['engines']['intelligent']['loaded']:
+        status['spacy'] = get_analyzer('intelligent').entity_extractor.status()
+    return jsonify(status)
+
+@app.route('/analyze-text', methods=['POST'])
+def analyze_text():
+    """
+    Analyze resume text with one or more engines
+
+    ?engine=ml|smart|intelligent|resume_score selects the engine; a comma-separated list
+    or 'all' runs several on the same text for comparison.
+    """
+    try:
+        data = request.get_json()
+        if not data or 'text' not in data:
+            return jsonify({
+                'error': 'No text provided for analysis'
+            }), 400
+
+        text = data['text']
+        if not text or len(text.strip()) < 50:
+            return jsonify({
+                'error': 'Text too short for meaningful analysis (minimum 50 characters)'
+            }), 400
+
+        try:
+            engines = parse_engines(request.args.get('engine') or data.get('engine'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        logger.info(f"🔍 Analyzing resume text of length {len(text)} with {', '.join(engines)}")
+
+        analyses, timings_ms = run_engines(engines, text)
+
+        if len(engines) == 1:
+            return jsonify({
+                'success': True,
+                'engine': engines[0],
+                'analysis': analyses[engines[0]]
+            })
+
+        return jsonify({
+            'success': True,
+            'analyses': analyses,
+            'scores': {engine: analysis['score'] for engine, analysis in analyses.items()},
+            'timings_ms': timings_ms
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Analysis failed: {str(e)}")
+        logger.error(traceback.format_exc())
+
+        return jsonify({
+            'error': 'Internal server error during analysis',
+            'details': str(e)
+        }), 500
+
+@app.route('/sessions', methods=['POST'])
+def create_session():
+    """
+    Analyze resume text and keep per-section state for incremental updates
+
+    Returns the session ID, revision, section spans and the full analysis.
+    """
+    try:
+        data = request.get_json()
+        if not data or 'text' not in data:
+            return jsonify({
+                'error': 'No text provided for analysis'
+            }), 400
+
+        engine = request.args.get('engine') or data.get('engine') or DEFAULT_ENGINE
+        try:
+            analyzer = get_analyzer(engine)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if not supports_incremental(analyzer):
+            return jsonify({'error': f"Engine '{engine}' does not support incremental analysis"}), 400
+
+        session = sessions.add(AnalysisSession(engine, analyzer, data['text']))
+        logger.info(f"🆕 Session {session.id} ({engine}, {len(session.sections)} sections)")
+
+        return jsonify({'success': True, **session.to_dict()})
+
+    except Exception as e:
+        logger.error(f"❌ Session creation failed: {str(e)}")
+        logger.error(traceback.format_exc())
+
+        return jsonify({
+            'error': 'Internal server error during analysis',
+            'details': str(e)
+        }), 500
+
+@app.route('/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    try:
+        session = sessions.get(session_id)
+    except KeyError:
+        return jsonify({'error': 'Session not found or expired'}), 404
+    return jsonify({'success': True, **session.to_dict()})
+
+@app.route('/sessions/<session_id>/edits', methods=['POST'])
+def edit_session(session_id):
+    """
+    Apply edits to a session's text and re-analyze only the changed sections
+
+    Body: {'edits': [...], 'revision': optional}. Edits are text diffs
+    {'start', 'end', 'text'} or section replacements {'section', 'text'};
+    see AnalysisSession.apply_edits. If 'revision' is given and the session
+    has moved on, nothing is applied and 409 is returned.
+    """
+    try:
+        session = sessions.get(session_id)
+    except KeyError:
+        return jsonify({'error': 'Session not found or expired'}), 404
+
+    try:
+        data = request.get_json()
+        if not data or not isinstance(data.get('edits'), list):
+            return jsonify({'error': "No 'edits' list provided"}), 400
+
+        with session.lock:
+            if 'revision' in data and data['revision'] != session.revision:
+                return jsonify({
+                    'error': 'Session has changed since this revision',
+                    'revision': session.revision
+                }), 409
+
+            start = time.perf_counter()
+            try:
+                recomputed = session.apply_edits(data['edits'])
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            return jsonify({
+                'success': True,
+                **session.to_dict(),
+                'recomputed_sections': recomputed,
+                'timing_ms': elapsed_ms
+            })
+
+    except Exception as e:
+        logger.error(f"❌ Incremental analysis failed: {str(e)}")
+        logger.error(traceback.format_exc())
+
+        return jsonify({
+            'error': 'Internal server error during analysis',
+            'details': str(e)
+        }), 500
+
+@app.route('/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    if not sessions.remove(session_id):
+        return jsonify({'error': 'Session not found or expired'}), 404
+    return jsonify({'success': True})
+
+@app.errorhandler(404)
+def not_found(error):
+    return jsonify({
+        'error': 'Endpoint not found',
+        'available_endpoints': ['/', '/analyze-text', '/sessions']
+    }), 404
+
+preload(parse_engines(PRELOAD_ENGINES))
+
+if __name__ == '__main__':
+    logger.info("🚀 Starting Unified Resume Analysis API")
+    logger.info("📍 Server will be available at http://localhost:5000")
+    logger.info(f"🧠 Engines: {', '.join(engine_status())} (default: {DEFAULT_ENGINE})")
+    app.run(debug=False, host='0.0.0.0', port=5000)
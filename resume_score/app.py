@@ -2,6 +2,7 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
 import joblib
+import sys
 import fitz  # PyMuPDF
 import nltk
 import string
@@ -11,6 +12,14 @@ import re
 from sklearn.feature_extraction.text import TfidfVectorizer
 import logging
 
+# Shared modules from resume_ml_model/src
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'resume_ml_model', 'src'))
+
+from utils.artifacts import load_artifact
+from utils.batching import MicroBatcher
+from lexicon.terms import get_lexicon
+from data_processing.preprocessing import segment_resume, SKILL_SECTIONS
+
 # Setup Flask app
 app = Flask(__name__)
 CORS(app)
@@ -27,21 +36,39 @@ except:
     STOPWORDS = set()
     logger.warning("NLTK stopwords not available")
 
-# Load trained model and vectorizer
-MODEL_PATH = 'models/resume_model.pkl'
-VECTORIZER_PATH = 'models/vectorizer.pkl'
+# Load trained model and vectorizer (relative to this file, so the unified
+# service in resume_ml_model can load this module as an engine)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(BASE_DIR, 'models', 'resume_model.pkl')
+VECTORIZER_PATH = os.path.join(BASE_DIR, 'models', 'vectorizer.pkl')
 
+# Not memory-mapped: the model is a random forest, whose nodes sklearn copies
+# into private memory on load (utils/artifacts.py), and the vectorizer's
+# IDF vector is too small for shared pages to matter
 try:
-    model = joblib.load(MODEL_PATH)
-    vectorizer = joblib.load(VECTORIZER_PATH)
+    model = load_artifact(MODEL_PATH, mmap=False)
+    vectorizer = load_artifact(VECTORIZER_PATH, mmap=False)
     logger.info("✅ ML Model and Vectorizer loaded successfully")
 except Exception as e:
     logger.error(f"❌ Failed to load ML model: {e}")
     model = None
     vectorizer = None
 
+# Concurrent requests are scored together: a lone request is scored at once,
+# and under load a batch closes after BATCH_MAX_SIZE texts or
+# BATCH_MAX_WAIT_MS after its first text
+BATCH_MAX_SIZE = int(os.environ.get('BATCH_MAX_SIZE', 32))
+BATCH_MAX_WAIT_MS = float(os.environ.get('BATCH_MAX_WAIT_MS', 5))
+
+def score_batch(processed_texts):
+    features = vectorizer.transform(processed_texts)
+    return np.clip(model.predict(features), 0, 10)
+
+score_batcher = MicroBatcher(score_batch, max_batch_size=BATCH_MAX_SIZE,
+                             max_wait_ms=BATCH_MAX_WAIT_MS, name='resume-score-batcher')
+
 # Load training data for keyword extraction
-TRAINING_DATA_PATH = 'data/processed/training_dataa.csv'
+TRAINING_DATA_PATH = os.path.join(BASE_DIR, 'data', 'processed', 'training_dataa.csv')
 HIGH_SCORE_THRESHOLD = 8
 
 try:
@@ -136,20 +163,16 @@ def extract_contact_info(text):
 
     return result
 
+# Technical skills from the shared lexicon, compiled once into a word-boundary automaton
+TECH_SKILL_AUTOMATON = get_lexicon('resume_score')
+
 # Extract keywords found in resume
-def extract_keywords(text, processed_text):
+def extract_keywords(text, processed_text, segments=None):
     keywords = {}
-    text_lower = text.lower()
+    segments = segment_resume(text) if segments is None else segments
 
-    # Technical skills
-    tech_skills = ['python', 'java', 'javascript', 'c++', 'c', 'html', 'css', 'sql', 'react',
-                   'node', 'angular', 'vue', 'django', 'flask', 'spring', 'mongodb', 'postgresql',
-                   'mysql', 'aws', 'azure', 'docker', 'kubernetes', 'git', 'linux', 'windows',
-                   'machine learning', 'ai', 'data science', 'tensorflow', 'pytorch', 'nlp']
-
-    for skill in tech_skills:
-        if skill in text_lower:
-            keywords[skill] = text_lower.count(skill)
+    # Technical skills from the skills, experience and projects sections, counted in one pass
+    keywords.update(TECH_SKILL_AUTOMATON.count_terms(segments.text_of(*SKILL_SECTIONS)))
 
     # Add words from processed text
     words = processed_text.split()
@@ -185,7 +208,7 @@ def suggest_improvements(processed_text, score):
     return suggestions[:8]
 
 # Generate issues
-def detect_issues(text, contact_info, keywords):
+def detect_issues(text, contact_info, keywords, segments=None):
     issues = []
 
     if not contact_info['emails']:
@@ -203,10 +226,11 @@ def detect_issues(text, contact_info, keywords):
     elif len(text.split()) > 800:
         issues.append("Resume too lengthy - consider condensing content")
 
-    # Check for common resume sections
-    sections = ['experience', 'education', 'skills', 'summary', 'objective']
-    missing_sections = [s for s in sections if s not in text.lower()]
-    if len(missing_sections) > 2:
+    # Check for common resume sections (headings; 'summary' includes objective/profile)
+    segments = segment_resume(text) if segments is None else segments
+    sections = ['experience', 'education', 'skills', 'summary']
+    missing_sections = [s for s in sections if not segments.has(s)]
+    if len(missing_sections) > 1:
         issues.append(f"Missing important sections: {', '.join(missing_sections[:3])}")
 
     return issues
@@ -224,20 +248,21 @@ def analyze_resume_text(text):
 
         # Get ML score
         if model and vectorizer:
-            features = vectorizer.transform([processed])
-            ml_score = model.predict(features)[0]
-            ml_score = float(np.clip(ml_score, 0, 10))  # Ensure score is 0-10
+            ml_score = float(score_batcher(processed))  # Clipped to 0-10
         else:
             ml_score = 5.0  # Fallback score
 
         # Extract contact info
         contact_info = extract_contact_info(text)
 
+        # Split into sections once for the stages below
+        segments = segment_resume(text)
+
         # Extract keywords
-        keywords = extract_keywords(text, processed)
+        keywords = extract_keywords(text, processed, segments)
 
         # Detect issues
-        issues = detect_issues(text, contact_info, keywords)
+        issues = detect_issues(text, contact_info, keywords, segments)
 
         # Generate suggestions
         suggestions = suggest_improvements(processed, ml_score)
@@ -284,6 +309,7 @@ def health_check():
         'service': 'Real ML Resume Analysis API',
         'version': '2.0.0',
         'model_loaded': model is not None,
+        'batching': score_batcher.stats(),
         'features': [
             'Scikit-learn ML Model',
             'TF-IDF Vectorization',
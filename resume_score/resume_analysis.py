@@ -1,4 +1,5 @@
 import os
+import sys
 import joblib
 import fitz  # PyMuPDF
 import nltk
@@ -7,6 +8,11 @@ import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+# Shared modules from resume_ml_model/src
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'resume_ml_model', 'src'))
+
+from utils.artifacts import load_artifact
+
 # Download stopwords
 nltk.download('stopwords')
 from nltk.corpus import stopwords
@@ -17,8 +23,8 @@ STOPWORDS = set(stopwords.words('english'))
 MODEL_PATH = 'models/resume_model.pkl'
 VECTORIZER_PATH = 'models/vectorizer.pkl'
 
-model = joblib.load(MODEL_PATH)
-vectorizer = joblib.load(VECTORIZER_PATH)
+model = load_artifact(MODEL_PATH, mmap=False)
+vectorizer = load_artifact(VECTORIZER_PATH, mmap=False)
 
 # Extract general keywords from high-scoring resumes using a fresh vectorizer
 TRAINING_DATA_PATH = 'data/processed/training_dataa.csv'
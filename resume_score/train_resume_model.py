@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 import pandas as pd
 import joblib
 import nltk
@@ -7,6 +8,11 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 
+# Shared modules from resume_ml_model/src
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'resume_ml_model', 'src'))
+
+from utils.artifacts import save_artifact
+
 nltk.download('stopwords')
 from nltk.corpus import stopwords
 
@@ -43,8 +49,8 @@ def train_model(df):
     model = RandomForestRegressor()
     model.fit(X_train, y_train)
 
-    joblib.dump(model, os.path.join(MODEL_DIR, "resume_model.pkl"))
-    joblib.dump(vectorizer, os.path.join(MODEL_DIR, "vectorizer.pkl"))
+    save_artifact(model, os.path.join(MODEL_DIR, "resume_model.pkl"))
+    save_artifact(vectorizer, os.path.join(MODEL_DIR, "vectorizer.pkl"))
 
     print("[✓] Model saved in 'models/' folder.")
     print(f"Train Score: {model.score(X_train, y_train):.2f}")